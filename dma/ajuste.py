@@ -0,0 +1,119 @@
+from collections import deque
+
+
+class AjustadorBuffer:
+
+    """
+    Ajusta el tamaño del buffer de cada canal del DMA según su uso.
+
+    En cada evaluación mira, por canal, cuánto tiempo esperaron los
+    productores con el buffer lleno y la ocupación máxima alcanzada, y mira
+    cuántas entradas esperan en el bus:
+
+    - Si hubo bloqueos y el bus no está saturado, duplica el buffer (hasta
+      `tamano_max`). Con el bus saturado un buffer mayor solo movería la cola
+      de lugar, así que no crece.
+    - Si durante `evaluaciones_para_reducir` evaluaciones seguidas no hubo
+      bloqueos y la ocupación no pasó de un cuarto del buffer, lo reduce a la
+      mitad (hasta `tamano_min`).
+
+    Attributes:
+        tamano_min (int): Tamaño mínimo del buffer
+        tamano_max (int): Tamaño máximo del buffer
+        intervalo (float): Segundos entre evaluaciones
+        max_backlog_bus (int): Entradas en el bus a partir de las que no se crece
+        evaluaciones_para_reducir (int): Evaluaciones tranquilas antes de reducir
+        decisiones (deque): Últimas decisiones de cambio de tamaño
+        crecimientos (int): Veces que se agrandó un buffer
+        reducciones (int): Veces que se achicó un buffer
+        crecimientos_descartados (int): Veces que no se creció por saturación del bus
+    """
+
+    def __init__(self, tamano_min=2, tamano_max=64, intervalo=0.5, max_backlog_bus=64,
+                 evaluaciones_para_reducir=3, max_decisiones=100):
+        self.tamano_min = tamano_min
+        self.tamano_max = tamano_max
+        self.intervalo = intervalo
+        self.max_backlog_bus = max_backlog_bus
+        self.evaluaciones_para_reducir = evaluaciones_para_reducir
+        self.decisiones = deque(maxlen=max_decisiones)
+        self.crecimientos = 0
+        self.reducciones = 0
+        self.crecimientos_descartados = 0
+        self._tranquilas = {}
+        self._ultima_evaluacion = None
+
+    def debe_evaluar(self, ahora):
+        """
+        Indica si pasó el intervalo desde la última evaluación.
+
+        Args:
+            ahora (float): Instante actual
+
+        Returns:
+            bool: True si corresponde evaluar
+        """
+        if self._ultima_evaluacion is None:
+            self._ultima_evaluacion = ahora
+            return False
+        return ahora - self._ultima_evaluacion >= self.intervalo
+
+    def evaluar(self, canales, backlog_bus, ahora):
+        """
+        Evalúa los canales y redimensiona los buffers que lo necesiten.
+
+        Args:
+            canales (list[CanalDMA]): Canales del DMA
+            backlog_bus (int): Entradas esperando en el bus
+            ahora (float): Instante actual
+        """
+        self._ultima_evaluacion = ahora
+        for canal in canales:
+            bloqueo, ocupacion_max, tamano = canal.tomar_estadisticas()
+
+            if bloqueo > 0:
+                self._tranquilas[canal.indice] = 0
+                if backlog_bus >= self.max_backlog_bus:
+                    self.crecimientos_descartados += 1
+                elif tamano < self.tamano_max:
+                    nuevo = min(self.tamano_max, tamano * 2)
+                    self._decidir(canal, tamano, nuevo, ahora,
+                                  f"productores bloqueados {bloqueo:.3f}s")
+                    self.crecimientos += 1
+                continue
+
+            if ocupacion_max * 4 > tamano:
+                self._tranquilas[canal.indice] = 0
+                continue
+            tranquilas = self._tranquilas.get(canal.indice, 0) + 1
+            self._tranquilas[canal.indice] = tranquilas
+            if tranquilas >= self.evaluaciones_para_reducir and tamano > self.tamano_min:
+                nuevo = max(self.tamano_min, tamano // 2)
+                self._decidir(canal, tamano, nuevo, ahora,
+                              f"ocupación máxima {ocupacion_max}/{tamano}")
+                self.reducciones += 1
+                self._tranquilas[canal.indice] = 0
+
+    def _decidir(self, canal, anterior, nuevo, ahora, motivo):
+        canal.redimensionar(nuevo)
+        self.decisiones.append({
+            'timestamp': ahora,
+            'canal': canal.indice,
+            'anterior': anterior,
+            'nuevo': nuevo,
+            'motivo': motivo
+        })
+
+    def get_status(self):
+        """
+        Returns:
+            dict: Límites, contadores y últimas decisiones de ajuste
+        """
+        return {
+            'tamano_min': self.tamano_min,
+            'tamano_max': self.tamano_max,
+            'crecimientos': self.crecimientos,
+            'reducciones': self.reducciones,
+            'crecimientos_descartados': self.crecimientos_descartados,
+            'decisiones': list(self.decisiones)
+        }
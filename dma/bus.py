@@ -1,7 +1,10 @@
 import threading
-import time
 
-from collections import defaultdict
+from collections import defaultdict, deque
+
+from dma.coalescencia import segmentos
+from generador.generador import TAMANO_BLOQUE
+from reloj.reloj import RelojReal
 
 
 class BusInteligente:
@@ -9,89 +12,357 @@ class BusInteligente:
     """
     Implementa un bus inteligente que gestiona la transferencia de datos entre dispositivos
     y la memoria principal, manejando múltiples colas de prioridad.
-    
-    El bus inteligente organiza las solicitudes por niveles de prioridad y las procesa
-    de manera ordenada, asegurando que las solicitudes de mayor prioridad sean atendidas
-    primero.
+
+    El bus reparte su capacidad entre las colas de prioridad con Deficit Round
+    Robin (DRR): en cada ronda cada cola activa recibe un crédito igual a su
+    peso y atiende solicitudes mientras le alcance, así que a largo plazo cada
+    prioridad obtiene una fracción del bus proporcional a su peso y ninguna
+    queda sin atender. El crédito se mide en bytes: cada punto de peso vale
+    `cuanto` bytes y una entrada consume su tamaño, así que el reparto es
+    proporcional a los bytes transferidos y no al número de solicitudes.
+
+    Cada transacción tarda `latencia` (preparación) más su tamaño dividido por
+    `ancho_banda`, y como mucho `max_concurrentes` transacciones están en
+    curso a la vez; en tiempo real hay un hilo trabajador persistente por
+    transacción concurrente. `get_status` informa los bytes/s logrados y la
+    utilización, para ver con qué carga el cuello de botella pasa del disco
+    al bus.
+
+    Una entrada puede ser una solicitud o una TransferenciaDispersa: esta
+    ocupa una sola transacción del bus, pero al completarse cuenta (y se
+    notifica a `al_completar`) cada una de sus solicitudes originales.
 
     Attributes:
-        colas_prioridad (defaultdict): Diccionario que mantiene listas separadas de solicitudes por nivel de prioridad
+        colas_prioridad (defaultdict): Deque de (llegada, solicitud, al_liberar) por nivel de prioridad
+        pesos (dict): Peso de cada prioridad en el reparto del bus
+        deficit (dict): Crédito acumulado de cada prioridad en la ronda actual
+        activas (deque): Prioridades con solicitudes pendientes, en orden de ronda
         lock (threading.Lock): Mecanismo de sincronización para acceso seguro a recursos compartidos
+        hay_solicitudes (Condition): Despierta al trabajador cuando llegan solicitudes
+        terminadas (Condition): Avisa cada transacción completada en tiempo real
         tiempo_total_procesamiento (float): Acumulador del tiempo total de procesamiento
         solicitudes_totales (int): Contador del total de solicitudes recibidas
         solicitudes_procesadas (int): Contador de solicitudes completadas
-        processing_thread (Thread): Hilo dedicado al procesamiento de solicitudes
+        transacciones (int): Transacciones del bus completadas
+        al_completar (callable): Función opcional llamada con cada solicitud completada
+        estadisticas_prioridad (defaultdict): Procesadas y espera en cola por prioridad
+        processing_threads (list[Thread]): Hilos trabajadores persistentes (vacía en modo virtual)
         is_running (bool): Flag que controla el estado de ejecución del bus
+        reloj (RelojReal | RelojVirtual): Reloj de la simulación
+        ancho_banda (float): Bytes por segundo que transfiere cada transacción
+        latencia (float): Segundos de preparación de cada transacción
+        max_concurrentes (int): Transacciones que pueden estar en curso a la vez
+        cuanto (int): Bytes de crédito DRR por punto de peso
+        en_servicio (int): Transacciones en curso
+        bytes_transferidos (int): Bytes de las transacciones completadas
     """
 
-    def __init__(self):
-        self.colas_prioridad = defaultdict(list)  # Diccionario para colas por prioridad
+    PESOS_POR_DEFECTO = {1: 1, 2: 2, 3: 3, 4: 4, 5: 5}
+    # Un bloque de TAMANO_BLOQUE tarda 0.1 s, como el antiguo tiempo fijo por solicitud
+    ANCHO_BANDA_POR_DEFECTO = 51200  # Bytes por segundo
+    LATENCIA_POR_DEFECTO = 0.02  # Segundos por transacción
+
+    def __init__(self, reloj=None, pesos=None, al_completar=None, ancho_banda=None, latencia=None,
+                 max_concurrentes=1):
+        if max_concurrentes < 1:
+            raise ValueError("El bus debe admitir al menos una transacción concurrente")
+        self.colas_prioridad = defaultdict(deque)  # Diccionario para colas por prioridad
+        self.pesos = dict(pesos or self.PESOS_POR_DEFECTO)
+        self.deficit = defaultdict(int)
+        self.activas = deque()
+        self._turno_abierto = False  # La cola en cabeza ya recibió su crédito de la ronda
         self.lock = threading.Lock()
+        self.hay_solicitudes = threading.Condition(self.lock)
+        self.terminadas = threading.Condition(self.lock)
         self.tiempo_total_procesamiento = 0.0
         self.solicitudes_totales = 0
         self.solicitudes_procesadas = 0
-        self.processing_thread = None
+        self.transacciones = 0
+        self.al_completar = al_completar
+        self.estadisticas_prioridad = defaultdict(lambda: {'procesadas': 0, 'espera_total': 0.0, 'espera_max': 0.0})
+        self.processing_threads = []
         self.is_running = True
+        self.reloj = reloj or RelojReal()
+        self.inicio = self.reloj.ahora()
+        self.ancho_banda = ancho_banda or self.ANCHO_BANDA_POR_DEFECTO
+        self.latencia = self.LATENCIA_POR_DEFECTO if latencia is None else latencia
+        self.max_concurrentes = max_concurrentes
+        self.cuanto = TAMANO_BLOQUE
+        self.en_servicio = 0
+        self.bytes_transferidos = 0
+
+        # En modo virtual no hay hilos: el servicio se programa como eventos
+        if not self.reloj.virtual:
+            for _ in range(max_concurrentes):
+                hilo = threading.Thread(target=self.procesar_solicitudes)
+                hilo.daemon = True
+                hilo.start()
+                self.processing_threads.append(hilo)
 
     def agregar_solicitud(self, solicitud):
         """
         Agrega una nueva solicitud a la cola correspondiente según su prioridad.
-        
-        Este método es thread-safe y maneja automáticamente el inicio del procesamiento
-        si es necesario.
+
+        Este método es thread-safe y despierta al trabajador del bus. Con un
+        reloj virtual no se crean hilos: la atención de la solicitud se
+        programa como evento en el reloj.
 
         Args:
             solicitud (Solicitud): Objeto solicitud a ser procesado
         """
+        self.agregar_lote((solicitud,))
+
+    def agregar_lote(self, solicitudes, al_liberar=None):
+        """
+        Agrega varias solicitudes adquiriendo el lock una sola vez.
+
+        Args:
+            solicitudes (Iterable[Solicitud]): Solicitudes en orden de llegada
+            al_liberar (callable, optional): Se llama sin argumentos al terminar
+                cada entrada del lote, antes de notificar sus solicitudes. El
+                canal del DMA la usa para liberar el lugar de la entrada en su
+                buffer. Defaults to None.
+        """
         with self.lock:  # Asegura acceso exclusivo a las colas
-             # Agregar solicitud a la cola de su prioridad
-            self.colas_prioridad[solicitud.prioridad].append(solicitud)
-            self.solicitudes_totales += 1
-            # Iniciar el procesamiento si no está en curso
-            if not self.processing_thread or not self.processing_thread.is_alive():
-                self.processing_thread = threading.Thread(target=self.procesar_solicitudes)
-                self.processing_thread.daemon = True
-                self.processing_thread.start()
+            ahora = self.reloj.ahora()
+            colas = self.colas_prioridad
+            for solicitud in solicitudes:
+                # Agregar solicitud a la cola de su prioridad
+                cola = colas[solicitud.prioridad]
+                if not cola:
+                    self.activas.append(solicitud.prioridad)
+                cola.append((ahora, solicitud, al_liberar))
+                self.solicitudes_totales += len(segmentos(solicitud))
+            if self.reloj.virtual:
+                self._iniciar_servicio()
+                return
+            self.hay_solicitudes.notify_all()
+
+    def set_priority_weight(self, prioridad, peso):
+        """
+        Cambia el peso de una prioridad; se aplica desde la siguiente ronda.
+
+        Args:
+            prioridad (int): Nivel de prioridad
+            peso (int): Nuevo peso, al menos 1
+
+        Raises:
+            ValueError: Si el peso es menor que 1
+        """
+        if peso < 1:
+            raise ValueError(f"El peso de la prioridad {prioridad} debe ser al menos 1")
+        with self.lock:
+            self.pesos[prioridad] = peso
+
+    def _costo(self, entrada):
+        """
+        Crédito que consume una entrada en el reparto DRR: sus bytes.
+        """
+        return entrada.tamano
+
+    def duracion(self, entrada):
+        """
+        Tiempo que ocupa una entrada en el bus.
+
+        Args:
+            entrada (Solicitud | TransferenciaDispersa): Entrada a transferir
+
+        Returns:
+            float: latencia + tamaño / ancho_banda, en segundos
+        """
+        return self.latencia + entrada.tamano / self.ancho_banda
+
+    def _siguiente(self):
+        """
+        Elige la siguiente solicitud según Deficit Round Robin.
+        Debe llamarse con el lock adquirido.
+
+        Returns:
+            tuple: (prioridad, llegada, solicitud, al_liberar), o None si no hay pendientes
+        """
+        activas = self.activas
+        while activas:
+            prioridad = activas[0]
+            cola = self.colas_prioridad[prioridad]
+            if not self._turno_abierto:
+                self.deficit[prioridad] += self.pesos.get(prioridad, 1) * self.cuanto
+                self._turno_abierto = True
+
+            costo = self._costo(cola[0][1])
+            if self.deficit[prioridad] >= costo:
+                self.deficit[prioridad] -= costo
+                llegada, solicitud, al_liberar = cola.popleft()
+                if not cola:
+                    # Una cola vacía sale de la ronda y pierde el crédito sobrante
+                    activas.popleft()
+                    self.deficit[prioridad] = 0
+                    self._turno_abierto = False
+                return prioridad, llegada, solicitud, al_liberar
+
+            # Crédito insuficiente: pasar el turno a la siguiente cola
+            activas.rotate(-1)
+            self._turno_abierto = False
+        return None
+
+    def _registrar_servicio(self, prioridad, llegada, inicio, entrada, duracion):
+        """
+        Actualiza los contadores al completar una entrada, contando cada
+        solicitud original. Debe llamarse con el lock adquirido.
+
+        Args:
+            duracion (float): Tiempo que la entrada ocupó el bus
+
+        Returns:
+            list[Solicitud] | tuple: Solicitudes originales completadas
+        """
+        espera = inicio - llegada
+        originales = segmentos(entrada)
+        estadisticas = self.estadisticas_prioridad[prioridad]
+        estadisticas['procesadas'] += len(originales)
+        estadisticas['espera_total'] += espera * len(originales)
+        if espera > estadisticas['espera_max']:
+            estadisticas['espera_max'] = espera
+        self.solicitudes_procesadas += len(originales)
+        self.transacciones += 1
+        self.bytes_transferidos += entrada.tamano
+        self.tiempo_total_procesamiento += duracion
+        return originales
+
+    def _notificar(self, originales, al_liberar=None):
+        """
+        Libera la entrada en su origen e informa a `al_completar` cada
+        solicitud completada. Se llama fuera del lock para que la
+        notificación pueda usar el bus.
+        """
+        if al_liberar is not None:
+            al_liberar()
+        if self.al_completar is not None:
+            for solicitud in originales:
+                self.al_completar(solicitud)
 
     def procesar_solicitudes(self):
         """
-        Procesa las solicitudes pendientes respetando el orden de prioridad.
-        
-        Este método implementa la lógica principal de procesamiento:
-        - Procesa primero las solicitudes de mayor prioridad
-        - Mantiene un registro del tiempo de procesamiento
-        - Garantiza el acceso thread-safe a las colas
-        """
-        tiempo_inicio = time.time()
-        # Continúa mientras haya solicitudes en alguna cola
-        while any(self.colas_prioridad.values()):
-            # Procesa prioridades en orden descendente
-            for prioridad in sorted(self.colas_prioridad.keys(), reverse=True):
-                while self.colas_prioridad[prioridad]:
-                    with self.lock:
-                        # Extrae y procesa la siguiente solicitud
-                        solicitud = self.colas_prioridad[prioridad].pop(0)
-                        self.solicitudes_procesadas += 1
-                    time.sleep(0.1)  # Simula tiempo de procesamiento
-        
-        # Actualiza estadísticas de tiempo
-        tiempo_total = time.time() - tiempo_inicio
-        self.tiempo_total_procesamiento += tiempo_total
+        Bucle de un hilo trabajador: atiende las solicitudes según DRR.
+
+        Espera en `hay_solicitudes` mientras no haya trabajo, así que el hilo
+        se crea una sola vez y vive hasta `shutdown`. Cada hilo lleva una
+        transacción a la vez.
+        """
+        while self.is_running:
+            with self.hay_solicitudes:
+                siguiente = self._siguiente()
+                while siguiente is None and self.is_running:
+                    self.hay_solicitudes.wait(timeout=1.0)
+                    siguiente = self._siguiente()
+                if siguiente is None:
+                    break
+                prioridad, llegada, entrada, al_liberar = siguiente
+                inicio = self.reloj.ahora()
+                self.en_servicio += 1
+
+            duracion = self.duracion(entrada)
+            self.reloj.dormir(duracion)  # Simula la transferencia
+            with self.lock:
+                self.en_servicio -= 1
+                originales = self._registrar_servicio(prioridad, llegada, inicio, entrada, duracion)
+                self.terminadas.notify_all()
+            self._notificar(originales, al_liberar)
+
+    def _iniciar_servicio(self):
+        """
+        Toma solicitudes según DRR mientras haya transacciones libres y
+        programa su finalización en el reloj virtual. Debe llamarse con el
+        lock adquirido.
+        """
+        while self.en_servicio < self.max_concurrentes:
+            siguiente = self._siguiente()
+            if siguiente is None:
+                return
+            prioridad, llegada, entrada, al_liberar = siguiente
+            self.en_servicio += 1
+            duracion = self.duracion(entrada)
+            self.reloj.programar(duracion, self._completar_servicio,
+                                 prioridad, llegada, self.reloj.ahora(), entrada, duracion, al_liberar)
+
+    def _completar_servicio(self, prioridad, llegada, inicio, entrada, duracion, al_liberar):
+        """
+        Evento de fin de transferencia en modo virtual: actualiza contadores
+        y arranca la siguiente solicitud pendiente.
+        """
+        with self.lock:
+            self.en_servicio -= 1
+            originales = self._registrar_servicio(prioridad, llegada, inicio, entrada, duracion)
+            self._iniciar_servicio()
+        self._notificar(originales, al_liberar)
+
+    def pendientes(self):
+        """
+        Returns:
+            int: Entradas en cola esperando al bus
+        """
+        with self.lock:
+            return sum(len(cola) for cola in self.colas_prioridad.values())
 
     def get_status(self):
         """
         Proporciona información sobre el estado actual del bus.
-        
+
         Returns:
             dict: Diccionario con estadísticas actuales:
                 - solicitudes_totales: Número total de solicitudes recibidas
                 - solicitudes_procesadas: Número de solicitudes completadas
+                - transacciones: Transacciones del bus completadas
                 - tiempo_promedio: Tiempo promedio de procesamiento por solicitud
+                - bytes_transferidos: Bytes de las transacciones completadas
+                - throughput_bytes: Bytes por segundo logrados desde el inicio
+                - utilizacion: Porcentaje de la capacidad del bus (tiempo de
+                  las transacciones sobre tiempo transcurrido × max_concurrentes)
+                - ancho_banda, latencia, max_concurrentes y en_servicio
+                - por_prioridad: Peso, pendientes, procesadas, throughput
+                  (solicitudes/s) y espera en cola promedio y máxima de cada prioridad
         """
         with self.lock:
+            transcurrido = self.reloj.ahora() - self.inicio
+            por_prioridad = {}
+            for prioridad in sorted(set(self.pesos) | set(self.estadisticas_prioridad)):
+                estadisticas = self.estadisticas_prioridad[prioridad]
+                procesadas = estadisticas['procesadas']
+                por_prioridad[prioridad] = {
+                    'peso': self.pesos.get(prioridad, 1),
+                    'pendientes': len(self.colas_prioridad[prioridad]),
+                    'procesadas': procesadas,
+                    'throughput': procesadas / transcurrido if transcurrido > 0 else 0,
+                    'espera_promedio': estadisticas['espera_total'] / procesadas if procesadas else 0,
+                    'espera_max': estadisticas['espera_max']
+                }
             return {
                 'solicitudes_totales': self.solicitudes_totales,
                 'solicitudes_procesadas': self.solicitudes_procesadas,
+                'transacciones': self.transacciones,
                 'tiempo_promedio': (self.tiempo_total_procesamiento / self.solicitudes_procesadas
-                                  if self.solicitudes_procesadas > 0 else 0)
-            }
\ No newline at end of file
+                                  if self.solicitudes_procesadas > 0 else 0),
+                'bytes_transferidos': self.bytes_transferidos,
+                'throughput_bytes': self.bytes_transferidos / transcurrido if transcurrido > 0 else 0,
+                'utilizacion': (min(100.0, self.tiempo_total_procesamiento /
+                                    (transcurrido * self.max_concurrentes) * 100)
+                                if transcurrido > 0 else 0),
+                'ancho_banda': self.ancho_banda,
+                'latencia': self.latencia,
+                'max_concurrentes': self.max_concurrentes,
+                'en_servicio': self.en_servicio,
+                'por_prioridad': por_prioridad
+            }
+
+    def shutdown(self):
+        """
+        Detiene los hilos trabajadores del bus. En tiempo real espera antes a
+        que terminen las entradas encoladas y en curso; con reloj virtual se
+        completan al ejecutar los eventos pendientes del reloj.
+        """
+        with self.lock:
+            while self.processing_threads and (self.activas or self.en_servicio):
+                self.terminadas.wait(timeout=1.0)
+            self.is_running = False
+            self.hay_solicitudes.notify_all()
+        for hilo in self.processing_threads:
+            hilo.join()
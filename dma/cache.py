@@ -0,0 +1,391 @@
+from collections import OrderedDict
+
+
+class CachePolitica:
+    """
+    Base de las cachés del DMA.
+
+    Cada política implementa `_buscar`, `_insertar` y `_ajustar`; la base lleva
+    los contadores de aciertos, fallos y desalojos de la política. Todas las
+    operaciones son O(1).
+
+    Attributes:
+        capacidad (int): Número máximo de entradas
+        aciertos (int): Búsquedas que encontraron la clave
+        fallos (int): Búsquedas que no encontraron la clave
+        desalojos (int): Entradas expulsadas por falta de espacio
+        al_desalojar (callable): Función opcional llamada con (clave, valor) de
+            cada entrada expulsada
+    """
+
+    nombre = None
+
+    def __init__(self, capacidad):
+        self.capacidad = max(0, capacidad)
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.al_desalojar = None
+
+    def _desalojado(self, clave, valor):
+        self.desalojos += 1
+        if self.al_desalojar is not None:
+            self.al_desalojar(clave, valor)
+
+    def obtener(self, clave):
+        """
+        Busca una clave y actualiza la política y los contadores.
+
+        Args:
+            clave (hashable): Clave buscada
+
+        Returns:
+            object: Valor almacenado, o None si la clave no está en caché
+        """
+        valor = self._buscar(clave)
+        if valor is None:
+            self.fallos += 1
+        else:
+            self.aciertos += 1
+        return valor
+
+    def insertar(self, clave, valor):
+        """
+        Guarda un valor, desalojando según la política si la caché está llena.
+
+        Args:
+            clave (hashable): Clave de la entrada
+            valor (object): Valor a guardar (no None)
+        """
+        if self.capacidad > 0:
+            self._insertar(clave, valor)
+
+    def redimensionar(self, capacidad):
+        """
+        Cambia la capacidad, desalojando las entradas que sobren.
+
+        Args:
+            capacidad (int): Nueva capacidad
+        """
+        self.capacidad = max(0, capacidad)
+        self._ajustar()
+
+    def estadisticas(self):
+        """
+        Returns:
+            dict: Política, capacidad, ocupación, contadores y hit rate (%)
+        """
+        total = self.aciertos + self.fallos
+        return {
+            'politica': self.nombre,
+            'capacidad': self.capacidad,
+            'ocupacion': len(self),
+            'aciertos': self.aciertos,
+            'fallos': self.fallos,
+            'desalojos': self.desalojos,
+            'hit_rate': (self.aciertos / total * 100) if total > 0 else 0
+        }
+
+
+class CacheLRU(CachePolitica):
+    """
+    Caché LRU: desaloja la entrada usada hace más tiempo.
+
+    Un OrderedDict mantiene las entradas de la menos a la más reciente; cada
+    acierto mueve la clave al final.
+    """
+
+    nombre = "LRU"
+
+    def __init__(self, capacidad):
+        super().__init__(capacidad)
+        self.entradas = OrderedDict()
+
+    def __len__(self):
+        return len(self.entradas)
+
+    def __contains__(self, clave):
+        return clave in self.entradas
+
+    def _buscar(self, clave):
+        valor = self.entradas.get(clave)
+        if valor is not None:
+            self.entradas.move_to_end(clave)
+        return valor
+
+    def _insertar(self, clave, valor):
+        self.entradas[clave] = valor
+        self.entradas.move_to_end(clave)
+        self._ajustar()
+
+    def _ajustar(self):
+        while len(self.entradas) > self.capacidad:
+            self._desalojado(*self.entradas.popitem(last=False))
+
+
+class CacheLFU(CachePolitica):
+    """
+    Caché LFU: desaloja la entrada con menos accesos; ante empate, la menos reciente.
+
+    Agrupa las claves por frecuencia en OrderedDicts y recuerda la frecuencia
+    mínima, así que acceder y desalojar cuestan O(1).
+    """
+
+    nombre = "LFU"
+
+    def __init__(self, capacidad):
+        super().__init__(capacidad)
+        self.entradas = {}  # clave -> (valor, frecuencia)
+        self.por_frecuencia = {}  # frecuencia -> OrderedDict de claves
+        self.min_frecuencia = 0
+
+    def __len__(self):
+        return len(self.entradas)
+
+    def __contains__(self, clave):
+        return clave in self.entradas
+
+    def _incrementar(self, clave, valor, frecuencia):
+        grupo = self.por_frecuencia[frecuencia]
+        del grupo[clave]
+        if not grupo:
+            del self.por_frecuencia[frecuencia]
+            if self.min_frecuencia == frecuencia:
+                self.min_frecuencia = frecuencia + 1
+        self.entradas[clave] = (valor, frecuencia + 1)
+        self.por_frecuencia.setdefault(frecuencia + 1, OrderedDict())[clave] = None
+
+    def _buscar(self, clave):
+        entrada = self.entradas.get(clave)
+        if entrada is None:
+            return None
+        valor, frecuencia = entrada
+        self._incrementar(clave, valor, frecuencia)
+        return valor
+
+    def _insertar(self, clave, valor):
+        entrada = self.entradas.get(clave)
+        if entrada is not None:
+            self._incrementar(clave, valor, entrada[1])
+            return
+        if len(self.entradas) >= self.capacidad:
+            self._desalojar()
+        self.entradas[clave] = (valor, 1)
+        self.por_frecuencia.setdefault(1, OrderedDict())[clave] = None
+        self.min_frecuencia = 1
+
+    def _desalojar(self):
+        grupo = self.por_frecuencia[self.min_frecuencia]
+        clave, _ = grupo.popitem(last=False)
+        if not grupo:
+            del self.por_frecuencia[self.min_frecuencia]
+            self.min_frecuencia = min(self.por_frecuencia, default=0)
+        valor, _ = self.entradas.pop(clave)
+        self._desalojado(clave, valor)
+
+    def _ajustar(self):
+        while len(self.entradas) > self.capacidad:
+            self._desalojar()
+
+
+class CacheARC(CachePolitica):
+    """
+    Caché ARC (Adaptive Replacement Cache, Megiddo y Modha).
+
+    Reparte la capacidad entre entradas vistas una vez (t1) y vistas varias
+    veces (t2), y guarda solo las claves de lo desalojado de cada una (b1, b2).
+    Un acierto en b1 o b2 mueve el objetivo `p` de tamaño de t1, con lo que la
+    caché se adapta entre recencia y frecuencia sin parámetros.
+
+    Attributes:
+        p (float): Tamaño objetivo de t1
+    """
+
+    nombre = "ARC"
+
+    def __init__(self, capacidad):
+        super().__init__(capacidad)
+        self.t1 = OrderedDict()
+        self.t2 = OrderedDict()
+        self.b1 = OrderedDict()
+        self.b2 = OrderedDict()
+        self.p = 0.0
+
+    def __len__(self):
+        return len(self.t1) + len(self.t2)
+
+    def __contains__(self, clave):
+        return clave in self.t1 or clave in self.t2
+
+    def _buscar(self, clave):
+        if clave in self.t1:
+            valor = self.t1.pop(clave)
+            self.t2[clave] = valor
+            return valor
+        valor = self.t2.get(clave)
+        if valor is not None:
+            self.t2.move_to_end(clave)
+        return valor
+
+    def _reemplazar(self, en_b2):
+        # Pasa la entrada LRU de t1 o de t2 a su lista fantasma
+        if self.t1 and (len(self.t1) > self.p or (en_b2 and len(self.t1) == self.p)):
+            clave, valor = self.t1.popitem(last=False)
+            self.b1[clave] = None
+        else:
+            clave, valor = self.t2.popitem(last=False)
+            self.b2[clave] = None
+        self._desalojado(clave, valor)
+
+    def _insertar(self, clave, valor):
+        c = self.capacidad
+        if clave in self.t1:
+            del self.t1[clave]
+            self.t2[clave] = valor
+            return
+        if clave in self.t2:
+            self.t2[clave] = valor
+            self.t2.move_to_end(clave)
+            return
+
+        if clave in self.b1:
+            self.p = min(c, self.p + max(len(self.b2) / len(self.b1), 1))
+            del self.b1[clave]
+            if len(self) >= c:
+                self._reemplazar(False)
+            self.t2[clave] = valor
+            return
+        if clave in self.b2:
+            self.p = max(0.0, self.p - max(len(self.b1) / len(self.b2), 1))
+            del self.b2[clave]
+            if len(self) >= c:
+                self._reemplazar(True)
+            self.t2[clave] = valor
+            return
+
+        l1 = len(self.t1) + len(self.b1)
+        if l1 >= c:
+            if len(self.t1) < c:
+                self.b1.popitem(last=False)
+                self._reemplazar(False)
+            else:
+                self._desalojado(*self.t1.popitem(last=False))
+        else:
+            total = l1 + len(self.t2) + len(self.b2)
+            if total >= c:
+                if total >= 2 * c:
+                    self.b2.popitem(last=False)
+                if len(self) >= c:
+                    self._reemplazar(False)
+        self.t1[clave] = valor
+
+    def _ajustar(self):
+        c = self.capacidad
+        self.p = min(self.p, c)
+        while len(self) > c:
+            self._reemplazar(False)
+        while len(self.t1) + len(self.b1) > c and self.b1:
+            self.b1.popitem(last=False)
+        while len(self) + len(self.b1) + len(self.b2) > 2 * c and self.b2:
+            self.b2.popitem(last=False)
+
+
+class Cache2Q(CachePolitica):
+    """
+    Caché 2Q (Johnson y Shasha), versión completa.
+
+    Las entradas nuevas entran a una FIFO corta (a1_entrada, un cuarto de la
+    capacidad). Al salir de ella solo se recuerda su clave (a1_salida, hasta
+    la mitad de la capacidad); si se vuelve a pedir mientras está ahí, pasa a
+    la LRU principal (am). Así un barrido de un solo uso no expulsa los
+    sectores calientes.
+    """
+
+    nombre = "2Q"
+
+    def __init__(self, capacidad):
+        super().__init__(capacidad)
+        self.a1_entrada = OrderedDict()
+        self.a1_salida = OrderedDict()
+        self.am = OrderedDict()
+
+    @property
+    def k_entrada(self):
+        return max(1, self.capacidad // 4)
+
+    @property
+    def k_salida(self):
+        return max(1, self.capacidad // 2)
+
+    def __len__(self):
+        return len(self.a1_entrada) + len(self.am)
+
+    def __contains__(self, clave):
+        return clave in self.am or clave in self.a1_entrada
+
+    def _buscar(self, clave):
+        valor = self.am.get(clave)
+        if valor is not None:
+            self.am.move_to_end(clave)
+            return valor
+        # Un acierto en a1_entrada no la promueve: puede ser un uso correlacionado
+        return self.a1_entrada.get(clave)
+
+    def _liberar(self):
+        if self.a1_entrada and (len(self.a1_entrada) > self.k_entrada or not self.am):
+            clave, valor = self.a1_entrada.popitem(last=False)
+            self.a1_salida[clave] = None
+            while len(self.a1_salida) > self.k_salida:
+                self.a1_salida.popitem(last=False)
+        else:
+            clave, valor = self.am.popitem(last=False)
+        self._desalojado(clave, valor)
+
+    def _insertar(self, clave, valor):
+        if clave in self.am:
+            self.am[clave] = valor
+            self.am.move_to_end(clave)
+            return
+        if clave in self.a1_entrada:
+            self.a1_entrada[clave] = valor
+            return
+        if len(self) >= self.capacidad:
+            self._liberar()
+        if clave in self.a1_salida:
+            del self.a1_salida[clave]
+            self.am[clave] = valor
+        else:
+            self.a1_entrada[clave] = valor
+
+    def _ajustar(self):
+        while len(self) > self.capacidad:
+            self._liberar()
+        while len(self.a1_salida) > self.k_salida:
+            self.a1_salida.popitem(last=False)
+
+
+POLITICAS = {
+    "LRU": CacheLRU,
+    "LFU": CacheLFU,
+    "ARC": CacheARC,
+    "2Q": Cache2Q,
+}
+
+
+def crear_cache(politica, capacidad):
+    """
+    Crea una caché con la política indicada.
+
+    Args:
+        politica (str): "LRU", "LFU", "ARC" o "2Q"
+        capacidad (int): Número máximo de entradas
+
+    Returns:
+        CachePolitica: Caché vacía
+
+    Raises:
+        ValueError: Si se especifica una política no soportada
+    """
+    if politica not in POLITICAS:
+        raise ValueError(f"Política de caché desconocida: {politica}")
+    return POLITICAS[politica](capacidad)
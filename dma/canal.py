@@ -0,0 +1,373 @@
+import sys
+import threading
+from collections import deque
+from concurrent.futures import Future
+
+from dma.coalescencia import TransferenciaDispersa
+
+
+class CanalDMA:
+
+    """
+    Canal del DMA con buffer, sincronización e hilo de procesamiento propios.
+
+    Cada canal drena su buffer hacia el bus compartido, así que un canal lleno
+    solo bloquea a los productores asignados a él.
+
+    Una entrada ocupa su lugar en el buffer desde que se acepta hasta que el
+    bus termina de transferirla, no solo hasta que el canal se la entrega:
+    la ocupación sigue al servicio del bus y no a cuándo el hilo del canal
+    alcanza a despertar. Así los dos relojes llegan a las mismas esperas: con
+    el reloj real el productor espera en `buffer_not_full`; con el virtual
+    ejecuta eventos del reloj hasta que el bus libera un lugar.
+
+    Con `ventana_coalescencia` mayor que cero el canal mantiene abierta una
+    transferencia scatter-gather: las solicitudes siguientes del mismo
+    dispositivo y tipo en posiciones solapadas o adyacentes se suman a ella
+    en lugar de ocupar su propia entrada del buffer. La transferencia reserva
+    su lugar al abrirse y pasa al buffer al llegar una solicitud que no
+    encaja o al vencer la ventana.
+
+    Attributes:
+        indice (int): Número del canal
+        buffer (deque): Buffer circular de entradas aún no entregadas al bus
+        buffer_size (int): Tamaño máximo del buffer
+        tamano_lote (int): Máximo de entradas que se entregan al bus por despertar
+        bus (BusInteligente): Bus compartido al que se entregan las entradas
+        reloj (RelojReal | RelojVirtual): Reloj de la simulación
+        ventana_coalescencia (float): Segundos que una transferencia queda abierta (0 = sin coalescencia)
+        max_segmentos (int): Máximo de solicitudes por transferencia
+        abierta (TransferenciaDispersa): Transferencia en formación, o None
+        en_bus (int): Entradas entregadas al bus que aún no terminó
+        lock (threading.Lock): Lock del canal
+        buffer_not_full (Condition): Condición para control de buffer lleno
+        buffer_not_empty (Condition): Condición para control de buffer vacío
+        transferencias (int): Solicitudes que pasaron por el canal
+        transacciones (int): Entradas emitidas hacia el bus
+        tiempo_bloqueado (float): Tiempo total que los productores esperaron con el buffer lleno
+        bloqueos (int): Veces que un productor encontró el buffer lleno
+        ocupacion_max (int): Mayor ocupación desde la última consulta de `tomar_estadisticas`
+        is_running (bool): Estado de ejecución del canal
+        processing_thread (Thread): Hilo del canal (None en modo virtual)
+        al_cambiar (callable): Función opcional llamada tras vaciar parte del buffer
+    """
+
+    def __init__(self, indice, buffer_size, tamano_lote, bus, reloj, ventana_coalescencia=0.0, max_segmentos=16,
+                 al_cambiar=None):
+        self.indice = indice
+        self.buffer = deque()  # Buffer circular; el tope de la ocupación lo impone buffer_not_full
+        self.buffer_size = buffer_size
+        self.tamano_lote = tamano_lote
+        self.bus = bus
+        self.reloj = reloj
+        self.ventana_coalescencia = ventana_coalescencia
+        self.max_segmentos = max_segmentos
+        self.abierta = None
+        self.en_bus = 0
+        self._hueco = None  # Future que espera un productor con reloj virtual
+        self.lock = threading.Lock()
+        self.buffer_not_full = threading.Condition(self.lock)
+        self.buffer_not_empty = threading.Condition(self.lock)
+        self.transferencias = 0
+        self.transacciones = 0
+        self.tiempo_bloqueado = 0.0
+        self.bloqueos = 0
+        self.ocupacion_max = 0
+        self._bloqueado_consultado = 0.0
+        self.is_running = True
+        self.al_cambiar = al_cambiar
+
+        # En modo virtual no hay hilos: el reloj de eventos dirige la simulación
+        self.processing_thread = None
+        if not reloj.virtual:
+            self.processing_thread = threading.Thread(target=self.procesar_buffer)
+            self.processing_thread.daemon = True
+            self.processing_thread.start()
+
+    def __len__(self):
+        return self.ocupacion
+
+    @property
+    def ocupacion(self):
+        """Lugares ocupados: entradas en el buffer, en el bus y la transferencia abierta."""
+        return len(self.buffer) + self.en_bus + (self.abierta is not None)
+
+    def encolar(self, solicitud):
+        """
+        Agrega una solicitud al canal, esperando si el buffer está lleno.
+
+        Args:
+            solicitud (Solicitud): Solicitud a transferir
+
+        Returns:
+            bool: False si el canal se detuvo antes de aceptarla
+        """
+        with self.buffer_not_full:
+            if not self.is_running:
+                return False
+            self.transferencias += 1
+
+            if self.ventana_coalescencia <= 0:
+                return self._agregar_al_buffer(solicitud)
+
+            # Esperar un hueco libera el lock: otro productor (o el vaciador
+            # de escrituras) puede abrir su propia transferencia mientras
+            # tanto, así que se vuelve a mirar la abierta después de cada espera
+            while True:
+                if self.abierta is not None:
+                    if self.abierta.admite(solicitud, self.max_segmentos):
+                        self.abierta.agregar(solicitud)
+                        return True
+                    self._cerrar_abierta()  # Ya tenía su lugar reservado
+                if self.ocupacion < self.buffer_size:
+                    break
+                if not self._esperar_hueco():
+                    return False
+
+            self.abierta = TransferenciaDispersa(solicitud, self.reloj.ahora())
+            self._registrar_ocupacion()
+            if self.reloj.virtual:
+                self.reloj.programar(self.ventana_coalescencia, self._vencer_ventana, self.abierta)
+            else:
+                # El hilo del canal debe recalcular cuándo vence la ventana
+                self.buffer_not_empty.notify()
+            return True
+
+    def _esperar_hueco(self):
+        """
+        Espera a que haya lugar en el buffer. Debe llamarse con el lock
+        adquirido; lo libera mientras espera.
+
+        Returns:
+            bool: False si el canal se detuvo antes de que hubiera lugar
+        """
+        # Esperar si el buffer está lleno
+        if self.ocupacion >= self.buffer_size and self.is_running:
+            self.bloqueos += 1
+            # Solo el primer bloqueo: con carga sostenida se repite miles de
+            # veces; el total está en `bloqueos` y `tiempo_bloqueado`. A stderr:
+            # la salida estándar puede llevar las métricas del modo --cli
+            if self.bloqueos == 1:
+                print(f"DMA: Buffer del canal {self.indice} lleno "
+                      f"({self.ocupacion}/{self.buffer_size}). Esperando; los siguientes "
+                      f"bloqueos se cuentan en el estado del DMA.", file=sys.stderr)
+            inicio = self.reloj.ahora()
+            while self.ocupacion >= self.buffer_size and self.is_running:
+                if not self.reloj.virtual:
+                    self.buffer_not_full.wait(timeout=1.0)
+                elif not self._esperar_liberacion():
+                    break  # No quedan eventos que puedan liberar un lugar
+            self.tiempo_bloqueado += self.reloj.ahora() - inicio
+        return self.is_running
+
+    def _esperar_liberacion(self):
+        """
+        Con reloj virtual, suelta el lock y ejecuta eventos del reloj hasta
+        que se libere un lugar. Debe llamarse con el lock adquirido.
+
+        Returns:
+            bool: False si se acabaron los eventos sin liberar ninguno
+        """
+        if self._hueco is None:
+            self._hueco = Future()
+        hueco = self._hueco
+        self.lock.release()
+        try:
+            return self.reloj.esperar(hueco)
+        finally:
+            self.lock.acquire()
+
+    def _avisar_hueco(self):
+        """
+        Despierta a los productores que esperan lugar. Debe llamarse con el lock adquirido.
+        """
+        self.buffer_not_full.notify_all()
+        if self._hueco is not None:
+            self._hueco.set_result(None)
+            self._hueco = None
+
+    def _liberar(self):
+        """
+        Llamada por el bus al terminar una entrada del canal: libera su lugar.
+        """
+        with self.lock:
+            self.en_bus -= 1
+            self._avisar_hueco()
+
+    def _registrar_ocupacion(self):
+        if self.ocupacion > self.ocupacion_max:
+            self.ocupacion_max = self.ocupacion
+
+    def _agregar_al_buffer(self, entrada):
+        """
+        Pone una entrada en el buffer, esperando si está lleno.
+        Debe llamarse con el lock adquirido.
+
+        Args:
+            entrada (Solicitud | TransferenciaDispersa): Entrada para el bus
+
+        Returns:
+            bool: False si el canal se detuvo antes de aceptarla
+        """
+        if not self._esperar_hueco():
+            return False
+        self._poner(entrada)
+        return True
+
+    def _poner(self, entrada):
+        """
+        Pone una entrada en el buffer sin esperar. Debe llamarse con el lock
+        adquirido y lugar en el buffer.
+
+        Args:
+            entrada (Solicitud | TransferenciaDispersa): Entrada para el bus
+        """
+        self.buffer.append(entrada)
+        self.transacciones += 1
+        self._registrar_ocupacion()
+
+        if self.reloj.virtual:
+            # Sin hilo de procesamiento: entregar el buffer al bus ahora
+            while self.buffer:
+                self.bus.agregar_lote(self._extraer_lote(), self._liberar)
+            return
+
+        self.buffer_not_empty.notify()
+
+    def _cerrar_abierta(self):
+        """
+        Pasa la transferencia abierta al buffer. Debe llamarse con el lock
+        adquirido y lugar en el buffer, así que nunca espera.
+        """
+        abierta, self.abierta = self.abierta, None
+        self._poner(abierta.entrada())
+
+    def _vencer_ventana(self, transferencia):
+        """
+        Evento de fin de ventana en modo virtual: cierra la transferencia si
+        sigue abierta.
+        """
+        with self.lock:
+            if self.abierta is transferencia:
+                self._cerrar_abierta()
+
+    def procesar_buffer(self):
+        """
+        Procesa continuamente las solicitudes del buffer.
+
+        Este método se ejecuta en el hilo del canal. En cada despertar extrae
+        hasta `tamano_lote` entradas y las entrega al bus en una sola llamada,
+        fuera del lock del canal; sus lugares se liberan cuando el bus las
+        termina. También cierra la transferencia abierta cuando vence su ventana.
+        """
+        while self.is_running:
+            with self.buffer_not_empty:
+                # Esperar si el buffer está vacío
+                while not self.buffer and self.is_running:
+                    if self.abierta is None:
+                        self.buffer_not_empty.wait(timeout=1.0)
+                        continue
+                    restante = self.abierta.apertura + self.ventana_coalescencia - self.reloj.ahora()
+                    if restante <= 0:
+                        self._cerrar_abierta()
+                    else:
+                        self.buffer_not_empty.wait(timeout=min(restante, 1.0))
+
+                if not self.is_running:
+                    break
+
+                lote = self._extraer_lote()
+
+            self.bus.agregar_lote(lote, self._liberar)
+            if self.al_cambiar is not None:
+                self.al_cambiar()
+
+    def _extraer_lote(self):
+        """
+        Extrae del buffer hasta `tamano_lote` entradas en orden de llegada,
+        que pasan a contar como entregadas al bus. Debe llamarse con el lock
+        adquirido.
+
+        Returns:
+            list: Entradas extraídas
+        """
+        buffer = self.buffer
+        lote = [buffer.popleft() for _ in range(min(self.tamano_lote, len(buffer)))]
+        self.en_bus += len(lote)
+        return lote
+
+    def redimensionar(self, nuevo_tamano):
+        """
+        Cambia el tamaño del buffer. Si se reduce por debajo de la ocupación
+        actual, no se descarta nada: los productores esperan a que se vacíe.
+
+        Args:
+            nuevo_tamano (int): Nuevo tamaño del buffer
+        """
+        with self.lock:
+            self.buffer_size = nuevo_tamano
+            self._avisar_hueco()
+
+    def tomar_estadisticas(self):
+        """
+        Devuelve lo ocurrido desde la consulta anterior y reinicia la ventana.
+
+        Returns:
+            tuple: (segundos de bloqueo de productores, ocupación máxima, tamaño del buffer)
+        """
+        with self.lock:
+            bloqueo = self.tiempo_bloqueado - self._bloqueado_consultado
+            self._bloqueado_consultado = self.tiempo_bloqueado
+            ocupacion_max, self.ocupacion_max = self.ocupacion_max, self.ocupacion
+            return bloqueo, ocupacion_max, self.buffer_size
+
+    def get_status(self):
+        """
+        Returns:
+            dict: Uso del buffer, solicitudes, transacciones, ratio de fusión y bloqueos del canal
+        """
+        with self.lock:
+            return {
+                'canal': self.indice,
+                'buffer_size': self.buffer_size,
+                'buffer_used': self.ocupacion,
+                'buffer_usage_percent': (self.ocupacion / self.buffer_size) * 100,
+                'transferencias': self.transferencias,
+                'transacciones': self.transacciones,
+                'ratio_fusion': self.transferencias / self.transacciones if self.transacciones else 1.0,
+                'bloqueos': self.bloqueos,
+                'tiempo_bloqueado': self.tiempo_bloqueado
+            }
+
+    def vaciar(self):
+        """
+        Cierra la transferencia abierta y espera a que el bus termine todas
+        las entradas que el canal aceptó. Con reloj virtual ejecuta los
+        eventos del reloj necesarios.
+        """
+        with self.lock:
+            if self.abierta is not None:
+                self._cerrar_abierta()
+            while self.ocupacion and self.is_running:
+                if not self.reloj.virtual:
+                    self.buffer_not_full.wait(timeout=1.0)
+                elif not self._esperar_liberacion():
+                    break
+
+    def shutdown(self):
+        """
+        Detiene el hilo del canal sin esperar al bus (ver `vaciar`). La
+        transferencia abierta, si la hay, se entrega al bus directamente.
+        """
+        with self.lock:
+            abierta, self.abierta = self.abierta, None
+            self.is_running = False
+            self.buffer_not_empty.notify_all()
+            self._avisar_hueco()
+            if abierta is not None:
+                self.transacciones += 1
+                self.en_bus += 1
+        if self.processing_thread:
+            self.processing_thread.join()
+        if abierta is not None:
+            self.bus.agregar_lote((abierta.entrada(),), self._liberar)
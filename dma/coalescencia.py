@@ -0,0 +1,95 @@
+class TransferenciaDispersa:
+
+    """
+    Transferencia scatter-gather que agrupa solicitudes contiguas.
+
+    Reúne solicitudes del mismo dispositivo y tipo de operación cuyas
+    posiciones se solapan o son adyacentes, para atenderlas en una sola
+    transacción del bus. Conserva las solicitudes originales en orden de
+    llegada para informar la finalización de cada una.
+
+    Attributes:
+        id_dispositivo (int): Dispositivo común de los segmentos
+        tipo (str): Tipo de operación común de los segmentos
+        prioridad (int): Mayor prioridad entre los segmentos
+        inicio (int): Primera posición cubierta
+        fin (int): Última posición cubierta
+        solicitudes (list[Solicitud]): Solicitudes originales agrupadas
+        apertura (float): Instante en que se abrió la transferencia
+        tamano (int): Bytes de todos los segmentos
+    """
+
+    __slots__ = ("id_dispositivo", "tipo", "prioridad", "inicio", "fin", "solicitudes", "apertura", "tamano")
+
+    def __init__(self, solicitud, apertura):
+        self.id_dispositivo = solicitud.id_dispositivo
+        self.tipo = solicitud.tipo
+        self.prioridad = solicitud.prioridad
+        self.inicio = self.fin = solicitud.posicion
+        self.solicitudes = [solicitud]
+        self.apertura = apertura
+        self.tamano = solicitud.tamano
+
+    def __len__(self):
+        return len(self.solicitudes)
+
+    @property
+    def posicion(self):
+        """Posición inicial de la transferencia."""
+        return self.inicio
+
+    def admite(self, solicitud, max_segmentos):
+        """
+        Indica si una solicitud puede sumarse a la transferencia.
+
+        Args:
+            solicitud (Solicitud): Solicitud candidata
+            max_segmentos (int): Máximo de solicitudes por transferencia
+
+        Returns:
+            bool: True si coincide dispositivo y tipo, su posición se solapa o
+                es adyacente al rango cubierto y queda lugar
+        """
+        return (len(self.solicitudes) < max_segmentos and
+                solicitud.id_dispositivo == self.id_dispositivo and
+                solicitud.tipo == self.tipo and
+                self.inicio - 1 <= solicitud.posicion <= self.fin + 1)
+
+    def agregar(self, solicitud):
+        """
+        Suma una solicitud admitida, ampliando el rango y la prioridad.
+
+        Args:
+            solicitud (Solicitud): Solicitud a agrupar
+        """
+        self.solicitudes.append(solicitud)
+        self.tamano += solicitud.tamano
+        if solicitud.posicion < self.inicio:
+            self.inicio = solicitud.posicion
+        elif solicitud.posicion > self.fin:
+            self.fin = solicitud.posicion
+        if solicitud.prioridad > self.prioridad:
+            self.prioridad = solicitud.prioridad
+
+    def entrada(self):
+        """
+        Returns:
+            Solicitud | TransferenciaDispersa: La solicitud original si la
+                transferencia tiene un único segmento; si no, la transferencia
+        """
+        return self.solicitudes[0] if len(self.solicitudes) == 1 else self
+
+
+def segmentos(entrada):
+    """
+    Devuelve las solicitudes originales de una entrada del bus.
+
+    Args:
+        entrada (Solicitud | TransferenciaDispersa): Entrada de una cola del bus
+
+    Returns:
+        list[Solicitud] | tuple: Solicitudes que cubre la entrada
+    """
+    if isinstance(entrada, TransferenciaDispersa):
+        return entrada.solicitudes
+    return (entrada,)
@@ -1,8 +1,16 @@
 import threading
-import time
-from collections import defaultdict
+from concurrent.futures import Future
+from itertools import islice
 
+from dma.ajuste import AjustadorBuffer
 from dma.bus import BusInteligente
+from dma.cache import crear_cache
+from dma.canal import CanalDMA
+from dma.telemetria import RegistroCircular
+from reloj.reloj import RelojReal
+
+ASIGNACIONES = ("afinidad", "menos_cargado")
+
 
 class DMA:
 
@@ -12,142 +20,356 @@ class DMA:
     Esta clase gestiona la transferencia de datos entre dispositivos y memoria principal,
     implementando un sistema de buffer y caché para optimizar el rendimiento.
 
+    Las transferencias se reparten entre `num_canales` canales, cada uno con su
+    propio buffer e hilo, que comparten la caché y el bus. Con asignación por
+    afinidad cada dispositivo usa siempre el mismo canal, así que un
+    dispositivo lento solo llena su canal; con `menos_cargado` cada solicitud
+    va al canal con el buffer más vacío.
+
+    Con `ventana_coalescencia` mayor que cero cada canal agrupa solicitudes
+    contiguas del mismo dispositivo y tipo en transferencias scatter-gather;
+    `ratio_fusion` en get_status indica cuántas solicitudes cubre en promedio
+    cada transacción del bus.
+
+    Con `buffer_adaptativo` un AjustadorBuffer agranda o achica el buffer de
+    cada canal entre `buffer_min` y `buffer_max` según los bloqueos de los
+    productores, la ocupación y la cola del bus; cada decisión queda en
+    get_status()['ajuste_buffer'].
+
+    Las escrituras usan write-back: quedan en la caché marcadas como sucias
+    (las lecturas posteriores del mismo sector se sirven desde ahí) y un
+    vaciador las envía al bus en lotes ordenados por sector cuando la
+    proporción de sucias llega a `marca_alta`, hasta bajar a `marca_baja`.
+    Varias escrituras al mismo sector antes del vaciado cuestan una sola
+    transacción. Una entrada sucia desalojada de la caché se escribe en el acto.
+
+    `ancho_banda_bus`, `latencia_bus` y `concurrencia_bus` configuran el
+    modelo de tiempos del bus (ver BusInteligente).
+
+    `transferir` no espera a que la transferencia termine: devuelve un Future
+    que se resuelve con la solicitud cuando el bus la completa, así el
+    planificador puede buscar la siguiente mientras la actual se transfiere.
+
     Attributes:
-        buffer (list): Cola de solicitudes pendientes
-        buffer_size (int): Tamaño máximo del buffer
+        canales (list[CanalDMA]): Canales del DMA
+        asignacion (str): Criterio de asignación de canal ("afinidad" o "menos_cargado")
+        buffer_size (int): Tamaño inicial del buffer de cada canal
+        ajustador (AjustadorBuffer): Ajuste automático del buffer (None si está desactivado)
+        tamano_lote (int): Máximo de solicitudes que un canal entrega al bus por despertar
         cache_size (int): Tamaño máximo de la caché
-        lock (threading.Lock): Lock principal para sincronización
-        buffer_not_full (Condition): Condición para control de buffer lleno
-        buffer_not_empty (Condition): Condición para control de buffer vacío
+        lock (threading.Lock): Lock principal para sincronización (caché y métricas)
         bus (BusInteligente): Instancia del bus para transferencia de datos
         is_running (bool): Estado de ejecución del DMA
-        cache (dict): Caché de solicitudes procesadas
+        cache (CachePolitica): Caché de sectores por (dispositivo, posición) (LRU, LFU, ARC o 2Q)
+        escritura_diferida (bool): Write-back si es True; si no, write-through
+        sucias (dict): Escrituras pendientes por sector, de la más antigua a la más reciente
+        marca_alta (float): Proporción de sucias que dispara el vaciado
+        marca_baja (float): Proporción de sucias a la que baja el vaciado
         cache_hits (int): Contador de aciertos en caché
         cache_misses (int): Contador de fallos en caché
-        buffer_usage_history (list): Historial de uso del buffer
-        cache_hits_history (list): Historial de rendimiento de la caché
+        futuros (dict): Futures pendientes por id_solicitud
+        telemetria (RegistroCircular): Historial de uso del buffer y hit rate de la caché
+        intervalo_muestreo (float): Separación mínima entre muestras de telemetría
+        reloj (RelojReal | RelojVirtual): Reloj de la simulación. Con un reloj
+            virtual el DMA no crea hilos y entrega cada solicitud al bus en el
+            acto; con el buffer lleno el productor avanza el reloj hasta que el
+            bus libere un lugar.
     """
      
-    def __init__(self, buffer_size=5, cache_size=100):
+    def __init__(self, buffer_size=5, cache_size=100, reloj=None, politica_cache="LRU", tamano_lote=None,
+                 num_canales=1, asignacion="afinidad", ventana_coalescencia=0.0, max_segmentos=16,
+                 buffer_adaptativo=False, buffer_min=2, buffer_max=64,
+                 escritura_diferida=True, marca_alta=0.5, marca_baja=0.25,
+                 ancho_banda_bus=None, latencia_bus=None, concurrencia_bus=1):
+        if asignacion not in ASIGNACIONES:
+            raise ValueError(f"Asignación de canal desconocida: {asignacion}")
+
         # Inicialización de estructuras básicas
-        self.buffer = []  # Buffer principal de solicitudes
-        self.buffer_size = buffer_size  # Tamaño configurable del buffer
+        self.buffer_size = buffer_size  # Tamaño configurable del buffer de cada canal
+        self.tamano_lote = tamano_lote or buffer_size  # Solicitudes por entrega al bus
         self.cache_size = cache_size  # Tamaño configurable de la caché
+        self.asignacion = asignacion
         
         # Mecanismos de sincronización
         self.lock = threading.Lock()  # Lock principal
-        self.buffer_not_full = threading.Condition(self.lock)  # Control de buffer lleno
-        self.buffer_not_empty = threading.Condition(self.lock)  # Control de buffer vacío
+        self.futuros_lock = threading.Lock()  # Protege los futures pendientes
+        self.ajuste_lock = threading.Lock()  # Una sola evaluación de ajuste a la vez
         
         # Componentes del sistema
-        self.bus = BusInteligente()  # Bus para transferencia de datos
+        self.reloj = reloj or RelojReal()  # Reloj real o simulado
+        self.bus = BusInteligente(self.reloj, al_completar=self._completar, ancho_banda=ancho_banda_bus,
+                                  latencia=latencia_bus, max_concurrentes=concurrencia_bus)  # Bus para transferencia de datos
+        self.canales = [
+            CanalDMA(i, buffer_size, self.tamano_lote, self.bus, self.reloj,
+                     ventana_coalescencia, max_segmentos, al_cambiar=self._registrar_muestra)
+            for i in range(max(1, num_canales))
+        ]
         self.is_running = True  # Estado de ejecución
         
         # Sistema de caché y métricas
-        self.cache = {}  # Caché de solicitudes
-        self.cache_hits = 0  # Contador de aciertos
-        self.cache_misses = 0  # Contador de fallos
+        self.cache = crear_cache(politica_cache, cache_size)  # Caché de solicitudes
+        self.cache.al_desalojar = self._al_desalojar
+        self.escritura_diferida = escritura_diferida
+        self.marca_alta = marca_alta
+        self.marca_baja = marca_baja
+        self.sucias = {}  # Escrituras aún no enviadas al bus
+        self._por_escribir = []  # Sucias desalojadas de la caché, a escribir ya
+        self.escrituras_diferidas = 0
+        self.escrituras_absorbidas = 0
+        self.escrituras_por_desalojo = 0
+        self.vaciados = 0
+        self.escrituras_vaciadas = 0
         self.transferencia_total = 0  # Total de transferencias
-        self.buffer_usage_history = []  # Historial de uso
-        self.cache_hits_history = []  # Historial de rendimiento
-        
-        # Inicialización de hilos
-        self.processing_thread = threading.Thread(target=self.procesar_buffer)
-        self.monitor_thread = threading.Thread(target=self.monitor_rendimiento)
-        self.processing_thread.daemon = True
-        self.monitor_thread.daemon = True
-        self.processing_thread.start()
-        self.monitor_thread.start()
+        self.futuros = {}  # Transferencias en vuelo
+        self.telemetria = RegistroCircular(('timestamp', 'buffer', 'hit_rate'))  # Historial
+        self.intervalo_muestreo = 0.01  # Como mucho una muestra cada 10 ms
+        self._ultima_muestra = float("-inf")
+        self.ajustador = AjustadorBuffer(buffer_min, buffer_max) if buffer_adaptativo else None
+
+        # Vaciador de escrituras sucias: solo con write-back (en modo virtual se
+        # vacía en el acto)
+        self.hay_sucias = threading.Condition()
+        self._vaciado_pedido = False
+        self.vaciador_thread = None
+        if self.escritura_diferida and not self.reloj.virtual:
+            self.vaciador_thread = threading.Thread(target=self.vaciador)
+            self.vaciador_thread.daemon = True
+            self.vaciador_thread.start()
 
-    def procesar_buffer(self):
+    def _elegir_canal(self, solicitud):
         """
-        Procesa continuamente las solicitudes del buffer.
-        
-        Este método se ejecuta en un hilo separado y maneja la transferencia
-        de solicitudes desde el buffer hacia el bus inteligente.
+        Elige el canal de una solicitud según el criterio de asignación.
+
+        Args:
+            solicitud (Solicitud): Solicitud a transferir
+
+        Returns:
+            CanalDMA: Canal asignado
         """
-        while self.is_running:
-            with self.buffer_not_empty:
-                # Esperar si el buffer está vacío
-                while not self.buffer and self.is_running:
-                    self.buffer_not_empty.wait(timeout=1.0)
-                
-                if not self.is_running:
-                    break
-                    
-                # Procesar siguiente solicitud si hay disponible
-                if self.buffer:
-                    solicitud = self.buffer.pop(0)
-                    self.buffer_not_full.notify()
-                    self.bus.agregar_solicitud(solicitud)
+        if self.asignacion == "afinidad":
+            return self.canales[solicitud.id_dispositivo % len(self.canales)]
+        return min(self.canales, key=len)
 
     def transferir(self, solicitud):
         """
-        Transfiere una solicitud al buffer del DMA.
+        Transfiere una solicitud al buffer de uno de los canales del DMA.
         
         Este método implementa la lógica de caché y control de buffer,
-        optimizando el rendimiento de las transferencias.
+        optimizando el rendimiento de las transferencias. Solo espera si el
+        buffer del canal asignado está lleno.
 
         Args:
             solicitud (Solicitud): La solicitud a transferir
+
+        Returns:
+            Future: Se resuelve con la solicitud al completarse la transferencia
+                (en el acto si está en caché) y se cancela si el DMA se detiene
+                antes de aceptarla
         """
-        with self.buffer_not_full:
-            # Esperar si el buffer está lleno
-            while len(self.buffer) >= self.buffer_size and self.is_running:
-                print(f"DMA: Buffer lleno ({len(self.buffer)}/{self.buffer_size}). Esperando...")
-                self.buffer_not_full.wait(timeout=1.0)
-            
-            if not self.is_running:
-                return
-            
-            # Verificar caché antes de transferir
-            cache_key = (solicitud.id_dispositivo, solicitud.posicion, solicitud.tipo)
-            if cache_key in self.cache:
-                self.cache_hits += 1
-                return self.cache[cache_key]
-            
-            # Procesar nueva solicitud
-            self.cache_misses += 1
-            self.buffer.append(solicitud)
-            self.transferencia_total += 1
-            
-            # Actualizar caché con política LRU
-            self.cache[cache_key] = solicitud
-            if len(self.cache) > self.cache_size:
-                self.cache.pop(next(iter(self.cache)))
-            
-            self.buffer_not_empty.notify()
+        futuro = Future()
+        if not self.is_running:
+            futuro.cancel()
+            return futuro
+
+        if solicitud.tipo == "escritura" and self.escritura_diferida and self.cache.capacidad > 0:
+            self._escribir_diferida(solicitud)
+            self._registrar_muestra()
+            futuro.set_result(solicitud)
+            return futuro
+
+        with self.lock:
+            cache_key = (solicitud.id_dispositivo, solicitud.posicion)
+            if solicitud.tipo == "escritura":
+                # Write-through: la escritura va al bus y reemplaza a la sucia, si la hay
+                en_cache = None
+                self.sucias.pop(cache_key, None)
+            else:
+                # Verificar caché antes de transferir
+                en_cache = self.cache.obtener(cache_key)
+            if en_cache is None:
+                # Actualizar caché según su política
+                self.cache.insertar(cache_key, solicitud)
+                self.transferencia_total += 1
+            desalojadas = self._tomar_desalojadas()
+
+        self._escribir_en_bus(desalojadas)
+        if en_cache is not None:
+            self._registrar_muestra()
+            futuro.set_result(en_cache)
+            return futuro
+
+        # Registrar el future antes de encolar: el bus puede completarla enseguida
+        with self.futuros_lock:
+            self.futuros.setdefault(solicitud.id_solicitud, []).append(futuro)
+
+        # Procesar nueva solicitud en su canal
+        if not self._elegir_canal(solicitud).encolar(solicitud):
+            with self.futuros_lock:
+                self.futuros.pop(solicitud.id_solicitud, None)
+            futuro.cancel()
+        self._registrar_muestra()
+        return futuro
 
-    def monitor_rendimiento(self):
+    def _escribir_diferida(self, solicitud):
         """
-        Monitorea y registra estadísticas de rendimiento del DMA.
-        
-        Mantiene un registro histórico del uso del buffer y rendimiento
-        de la caché para análisis y optimización.
+        Guarda una escritura en la caché como sucia y pide un vaciado si se
+        supera la marca alta.
+
+        Args:
+            solicitud (Solicitud): Escritura a diferir
+        """
+        with self.lock:
+            clave = (solicitud.id_dispositivo, solicitud.posicion)
+            if self.sucias.pop(clave, None) is not None:
+                self.escrituras_absorbidas += 1
+            self.sucias[clave] = solicitud  # Al final: la sucia más reciente
+            self.cache.insertar(clave, solicitud)
+            self.escrituras_diferidas += 1
+            desalojadas = self._tomar_desalojadas()
+            disparar = len(self.sucias) >= self.marca_alta * self.cache.capacidad
+
+        self._escribir_en_bus(desalojadas)
+        if not disparar:
+            return
+        if self.reloj.virtual:
+            self.vaciar_sucias(self.marca_baja * self.cache.capacidad)
+            return
+        with self.hay_sucias:
+            self._vaciado_pedido = True
+            self.hay_sucias.notify()
+
+    def _al_desalojar(self, clave, valor):
+        # La caché expulsó un sector: si estaba sucio hay que escribirlo ya
+        sucia = self.sucias.pop(clave, None)
+        if sucia is not None:
+            self._por_escribir.append(sucia)
+            self.escrituras_por_desalojo += 1
+
+    def _tomar_desalojadas(self):
+        """
+        Devuelve y olvida las sucias desalojadas. Debe llamarse con el lock adquirido.
+        """
+        desalojadas, self._por_escribir = self._por_escribir, []
+        self.transferencia_total += len(desalojadas)
+        return desalojadas
+
+    def _escribir_en_bus(self, escrituras):
+        """
+        Envía escrituras a sus canales ordenadas por dispositivo y posición.
+
+        Args:
+            escrituras (list[Solicitud]): Escrituras a enviar
+        """
+        for escritura in sorted(escrituras, key=lambda s: (s.id_dispositivo, s.posicion)):
+            self._elegir_canal(escritura).encolar(escritura)
+
+    def vaciar_sucias(self, hasta=0):
+        """
+        Escribe en el bus las sucias más antiguas hasta que queden `hasta`.
+
+        El lote se envía ordenado por sector para que el cabezal lo recorra
+        en una pasada y la coalescencia de los canales pueda unir los
+        sectores contiguos.
+
+        Args:
+            hasta (float, optional): Sucias que pueden quedar. Defaults to 0 (todas).
+
+        Returns:
+            int: Escrituras enviadas
+        """
+        with self.lock:
+            exceso = len(self.sucias) - int(hasta)
+            if exceso <= 0:
+                return 0
+            lote = [self.sucias.pop(clave) for clave in list(islice(self.sucias, exceso))]
+            self.vaciados += 1
+            self.escrituras_vaciadas += len(lote)
+            self.transferencia_total += len(lote)
+
+        self._escribir_en_bus(lote)
+        return len(lote)
+
+    def vaciador(self):
+        """
+        Hilo vaciador: espera a que se supere la marca alta y vacía hasta la baja.
         """
         while self.is_running:
-            with self.lock:
-                # Registrar uso del buffer
-                self.buffer_usage_history.append({
-                    'timestamp': time.time(),
-                    'usage': len(self.buffer)
-                })
-                
-                # Registrar hit rate de cache
-                total_accesos = self.cache_hits + self.cache_misses
-                hit_rate = (self.cache_hits / total_accesos * 100) if total_accesos > 0 else 0
-                self.cache_hits_history.append({
-                    'timestamp': time.time(),
-                    'hit_rate': hit_rate
-                })
-                
-                # Limitar histórico
-                if len(self.buffer_usage_history) > 1000:
-                    self.buffer_usage_history = self.buffer_usage_history[-1000:]
-                if len(self.cache_hits_history) > 1000:
-                    self.cache_hits_history = self.cache_hits_history[-1000:]
-            
-            time.sleep(0.1)
+            with self.hay_sucias:
+                while not self._vaciado_pedido and self.is_running:
+                    self.hay_sucias.wait(timeout=1.0)
+                self._vaciado_pedido = False
+            if not self.is_running:
+                break
+            self.vaciar_sucias(self.marca_baja * self.cache.capacidad)
+
+    def _completar(self, solicitud):
+        """
+        Resuelve los futures de una solicitud completada por el bus.
+
+        Args:
+            solicitud (Solicitud): Solicitud original completada
+        """
+        with self.futuros_lock:
+            futuros = self.futuros.pop(solicitud.id_solicitud, ())
+        for futuro in futuros:
+            futuro.set_result(solicitud)
+
+    @property
+    def en_vuelo(self):
+        """Transferencias aceptadas que el bus aún no completó."""
+        with self.futuros_lock:
+            return sum(len(futuros) for futuros in self.futuros.values())
+
+    def transferir_lote(self, solicitudes):
+        """
+        Transfiere en orden todas las solicitudes de una lista o LoteSolicitudes.
+
+        Args:
+            solicitudes (list[Solicitud] | LoteSolicitudes): Solicitudes a transferir
+
+        Returns:
+            list[Future]: Un future por solicitud, en el mismo orden
+        """
+        return [self.transferir(solicitud) for solicitud in solicitudes]
+
+    @property
+    def cache_hits(self):
+        """Aciertos de la caché."""
+        return self.cache.aciertos
+
+    @property
+    def cache_misses(self):
+        """Fallos de la caché."""
+        return self.cache.fallos
+
+    def _registrar_muestra(self):
+        """
+        Registra una muestra de uso del buffer y de hit rate de la caché.
+
+        Se llama cuando cambia el estado (una transferencia o una extracción
+        de un canal), no por sondeo, y descarta los cambios que llegan antes
+        de `intervalo_muestreo`. No toma el lock del DMA: el registro
+        circular tiene el suyo.
+        """
+        ahora = self.reloj.ahora()
+        if ahora - self._ultima_muestra < self.intervalo_muestreo:
+            return
+        self._ultima_muestra = ahora
+        total_accesos = self.cache.aciertos + self.cache.fallos
+        hit_rate = (self.cache.aciertos / total_accesos * 100) if total_accesos > 0 else 0
+        self.telemetria.registrar(
+            ahora,
+            sum(len(canal) for canal in self.canales),  # Uso del buffer de todos los canales
+            hit_rate
+        )
+
+        if self.ajustador is not None and self.ajustador.debe_evaluar(ahora):
+            # Si otro hilo ya está evaluando, esta muestra no hace falta
+            if self.ajuste_lock.acquire(blocking=False):
+                try:
+                    self.ajustador.evaluar(self.canales, self.bus.pendientes(), ahora)
+                finally:
+                    self.ajuste_lock.release()
 
     def get_status(self):
         """
@@ -155,26 +377,57 @@ class DMA:
         
         Returns:
             dict: Diccionario con métricas actuales incluyendo:
-                - Uso del buffer
+                - Uso del buffer (total de los canales) y veces y tiempo que
+                  los productores esperaron con el buffer lleno
+                - Estado de cada canal
                 - Estadísticas de caché
-                - Historial de rendimiento
+                - Historial de rendimiento: las últimas 50 muestras de cada
+                  columna como memoryview, sin copia
         """
+        canales = [canal.get_status() for canal in self.canales]
+        historial = self.telemetria.ultimas(50)
         with self.lock:
             total_accesos = self.cache_hits + self.cache_misses
             hit_rate = (self.cache_hits / total_accesos * 100) if total_accesos > 0 else 0
+            capacidad = sum(c['buffer_size'] for c in canales)
+            usado = sum(c['buffer_used'] for c in canales)
+            solicitudes = sum(c['transferencias'] for c in canales)
+            transacciones = sum(c['transacciones'] for c in canales)
+            bloqueos = sum(c['bloqueos'] for c in canales)
+            tiempo_bloqueado = sum(c['tiempo_bloqueado'] for c in canales)
             
             return {
-                'buffer_size': self.buffer_size,
-                'buffer_used': len(self.buffer),
-                'buffer_usage_percent': (len(self.buffer) / self.buffer_size) * 100,
+                'buffer_size': capacidad,
+                'buffer_used': usado,
+                'buffer_usage_percent': (usado / capacidad) * 100,
+                'num_canales': len(canales),
+                'bloqueos_buffer': bloqueos,
+                'tiempo_bloqueado_buffer': tiempo_bloqueado,
+                'canales': canales,
                 'cache_size': self.cache_size,
                 'cache_used': len(self.cache),
                 'cache_hits': self.cache_hits,
                 'cache_misses': self.cache_misses,
+                'cache_policy': self.cache.nombre,
+                'cache_evictions': self.cache.desalojos,
                 'hit_rate': hit_rate,
+                'escritura_diferida': self.escritura_diferida,
+                'sucias': len(self.sucias),
+                'ratio_sucias': len(self.sucias) / self.cache.capacidad if self.cache.capacidad else 0,
+                'escrituras_diferidas': self.escrituras_diferidas,
+                'escrituras_absorbidas': self.escrituras_absorbidas,
+                'escrituras_por_desalojo': self.escrituras_por_desalojo,
+                'vaciados': self.vaciados,
+                'lote_vaciado_promedio': self.escrituras_vaciadas / self.vaciados if self.vaciados else 0,
                 'transferencias_totales': self.transferencia_total,
-                'buffer_history': self.buffer_usage_history[-50:],
-                'cache_history': self.cache_hits_history[-50:]
+                'transferencias_en_vuelo': self.en_vuelo,
+                'transacciones_bus': transacciones,
+                'transacciones_ahorradas': solicitudes - transacciones,
+                'ratio_fusion': solicitudes / transacciones if transacciones else 1.0,
+                'timestamp_history': historial['timestamp'],
+                'buffer_history': historial['buffer'],
+                'cache_history': historial['hit_rate'],
+                'ajuste_buffer': self.ajustador.get_status() if self.ajustador else None
             }
 
     def set_cache_size(self, new_size):
@@ -186,19 +439,34 @@ class DMA:
         """
         with self.lock:
             self.cache_size = new_size
-            while len(self.cache) > new_size:
-                self.cache.pop(next(iter(self.cache)))
+            self.cache.redimensionar(new_size)
+            desalojadas = self._tomar_desalojadas()
+        self._escribir_en_bus(desalojadas)
 
     def shutdown(self):
         """
         Detiene de manera segura todos los procesos del DMA.
         
         Asegura una terminación limpia de hilos y liberación de recursos.
+        Deja de aceptar transferencias, escribe en el bus las escrituras
+        sucias y espera a que el bus termine todo lo que aceptaron los
+        canales antes de detener sus hilos.
         """
         self.is_running = False
-        with self.buffer_not_empty:
-            self.buffer_not_empty.notify_all()
-        with self.buffer_not_full:
-            self.buffer_not_full.notify_all()
-        self.processing_thread.join()
-        self.monitor_thread.join()
\ No newline at end of file
+        with self.hay_sucias:
+            self.hay_sucias.notify_all()
+        if self.vaciador_thread:
+            self.vaciador_thread.join()
+        self.vaciar_sucias()
+        for canal in self.canales:
+            canal.vaciar()
+        for canal in self.canales:
+            canal.shutdown()
+        self.bus.shutdown()
+
+        # Las transferencias que no llegaron a completarse no se completarán
+        with self.futuros_lock:
+            pendientes, self.futuros = self.futuros, {}
+        for futuros in pendientes.values():
+            for futuro in futuros:
+                futuro.cancel()
\ No newline at end of file
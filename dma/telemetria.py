@@ -0,0 +1,65 @@
+import threading
+from array import array
+
+
+class RegistroCircular:
+
+    """
+    Almacén circular de muestras con columnas preasignadas.
+
+    Cada campo es un `array('d')` de 2 × capacidad posiciones y cada muestra
+    se escribe dos veces (en i y en i + capacidad), así que las últimas n
+    muestras siempre ocupan un tramo contiguo y se pueden leer como
+    memoryview sin copiar. Escribir no reserva memoria ni recorta listas.
+
+    Las escrituras se serializan con un lock propio, independiente del lock
+    del DMA; las lecturas no toman lock y, como mucho, ven a medio escribir
+    la muestra más reciente.
+
+    Attributes:
+        campos (tuple[str]): Nombres de las columnas
+        capacidad (int): Máximo de muestras conservadas
+        columnas (dict): array('d') de cada campo
+        total (int): Muestras escritas desde el inicio
+        lock (threading.Lock): Serializa las escrituras
+    """
+
+    def __init__(self, campos, capacidad=1000):
+        self.campos = tuple(campos)
+        self.capacidad = capacidad
+        self.columnas = {campo: array('d', bytes(16 * capacidad)) for campo in self.campos}
+        self._vistas = {campo: memoryview(columna) for campo, columna in self.columnas.items()}
+        self.total = 0
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return min(self.total, self.capacidad)
+
+    def registrar(self, *valores):
+        """
+        Escribe una muestra, sobrescribiendo la más antigua si está lleno.
+
+        Args:
+            *valores (float): Un valor por campo, en el orden de `campos`
+        """
+        with self.lock:
+            i = self.total % self.capacidad
+            for columna, valor in zip(self.columnas.values(), valores):
+                columna[i] = columna[i + self.capacidad] = valor
+            self.total += 1
+
+    def ultimas(self, n=None):
+        """
+        Devuelve las últimas muestras sin copiarlas.
+
+        Args:
+            n (int, optional): Número de muestras. Defaults to todas las conservadas.
+
+        Returns:
+            dict: memoryview de cada campo, de la más antigua a la más reciente
+        """
+        total = self.total
+        cantidad = min(total, self.capacidad) if n is None else min(n, total, self.capacidad)
+        fin = (total - 1) % self.capacidad + 1 + self.capacidad if total else 0
+        inicio = fin - cantidad
+        return {campo: vista[inicio:fin] for campo, vista in self._vistas.items()}
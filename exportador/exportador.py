@@ -0,0 +1,301 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from planificador.histograma import DIMENSIONES
+
+TIPO_OPENMETRICS = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+TIPO_PROMETHEUS = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escapar(valor):
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _formatear_etiquetas(etiquetas):
+    if not etiquetas:
+        return ""
+    return "{" + ",".join(f'{clave}="{_escapar(valor)}"' for clave, valor in etiquetas.items()) + "}"
+
+
+class Familia:
+    """
+    Familia de métricas con sus muestras, lista para escribirse en texto.
+
+    Attributes:
+        nombre (str): Nombre sin el sufijo _total de los contadores
+        tipo (str): "counter", "gauge" o "histogram"
+        ayuda (str): Descripción de la métrica
+        muestras (list[tuple]): (sufijo, etiquetas, valor) de cada muestra
+    """
+
+    __slots__ = ("nombre", "tipo", "ayuda", "muestras")
+
+    def __init__(self, nombre, tipo, ayuda):
+        self.nombre = nombre
+        self.tipo = tipo
+        self.ayuda = ayuda
+        self.muestras = []
+
+    def agregar(self, valor, sufijo="", **etiquetas):
+        """
+        Agrega una muestra. Los contadores reciben el sufijo _total.
+
+        Args:
+            valor (float): Valor de la muestra
+            sufijo (str, optional): Sufijo del nombre (p. ej. "_count"). Defaults to "".
+            **etiquetas: Etiquetas de la muestra
+
+        Returns:
+            Familia: La propia familia
+        """
+        if self.tipo == "counter" and not sufijo:
+            sufijo = "_total"
+        self.muestras.append((sufijo, etiquetas, valor))
+        return self
+
+    def escribir(self, lineas, openmetrics):
+        """
+        Agrega las líneas de texto de la familia.
+
+        Args:
+            lineas (list[str]): Líneas de salida
+            openmetrics (bool): Formato OpenMetrics; si no, texto de Prometheus 0.0.4
+        """
+        # En el formato de Prometheus los contadores se declaran con el sufijo _total
+        nombre = self.nombre if openmetrics or self.tipo != "counter" else self.nombre + "_total"
+        lineas.append(f"# HELP {nombre} {self.ayuda}")
+        lineas.append(f"# TYPE {nombre} {self.tipo}")
+        for sufijo, etiquetas, valor in self.muestras:
+            lineas.append(f"{self.nombre}{sufijo}{_formatear_etiquetas(etiquetas)} {float(valor)!r}")
+
+
+class ExportadorMetricas:
+    """
+    Servidor HTTP local que publica las métricas del DMA, el bus y el
+    planificador en formato OpenMetrics (o texto de Prometheus 0.0.4 si el
+    cliente no pide OpenMetrics en Accept).
+
+    Cada consulta lee las instantáneas de `DMA.get_status`,
+    `BusInteligente.get_status` y las estadísticas O(1) de las métricas del
+    planificador, que toman sus locks solo para copiar contadores. El texto
+    generado se reutiliza durante `intervalo_minimo` segundos, así que
+    consultas muy seguidas no vuelven a tocar la simulación. El servidor
+    atiende una consulta a la vez desde su propio hilo.
+
+    Attributes:
+        dma (DMA): DMA observado (su bus incluido), o None
+        planificador (PlanificadorDisco): Planificador observado, o None
+        host (str): Dirección de escucha
+        puerto (int): Puerto de escucha (el asignado si se pidió 0)
+        intervalo_minimo (float): Segundos que se reutiliza el texto generado
+        consultas (int): Consultas atendidas
+        generaciones (int): Veces que se generó el texto
+    """
+
+    PREFIJO = "simulador_"
+
+    def __init__(self, dma=None, planificador=None, host="127.0.0.1", puerto=9464, intervalo_minimo=1.0):
+        self.dma = dma
+        self.planificador = planificador
+        self.host = host
+        self.puerto = puerto
+        self.intervalo_minimo = intervalo_minimo
+        self.consultas = 0
+        self.generaciones = 0
+        self.lock = threading.Lock()
+        self._cache = {}  # formato -> (instante, texto)
+        self._servidor = None
+        self._hilo = None
+
+    def iniciar(self):
+        """
+        Empieza a escuchar en host:puerto desde un hilo propio.
+
+        Returns:
+            ExportadorMetricas: El propio exportador
+        """
+        exportador = self
+
+        class Manejador(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                openmetrics = "application/openmetrics-text" in self.headers.get("Accept", "")
+                cuerpo = exportador.generar(openmetrics).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", TIPO_OPENMETRICS if openmetrics else TIPO_PROMETHEUS)
+                self.send_header("Content-Length", str(len(cuerpo)))
+                self.end_headers()
+                self.wfile.write(cuerpo)
+
+            def log_message(self, *args):
+                pass  # Sin log por consulta
+
+        self._servidor = HTTPServer((self.host, self.puerto), Manejador)
+        self.puerto = self._servidor.server_address[1]
+        self._hilo = threading.Thread(target=self._servidor.serve_forever)
+        self._hilo.daemon = True
+        self._hilo.start()
+        return self
+
+    def detener(self):
+        """
+        Deja de escuchar y espera al hilo del servidor.
+        """
+        if self._servidor is None:
+            return
+        self._servidor.shutdown()
+        self._servidor.server_close()
+        self._hilo.join()
+        self._servidor = None
+
+    def generar(self, openmetrics=True):
+        """
+        Devuelve el texto de las métricas, reutilizando el generado hace
+        menos de `intervalo_minimo` segundos.
+
+        Args:
+            openmetrics (bool, optional): Formato OpenMetrics; si no, texto de
+                Prometheus 0.0.4. Defaults to True.
+
+        Returns:
+            str: Métricas en formato de texto
+        """
+        with self.lock:
+            self.consultas += 1
+            ahora = time.monotonic()
+            guardado = self._cache.get(openmetrics)
+            if guardado is not None and ahora - guardado[0] < self.intervalo_minimo:
+                return guardado[1]
+            lineas = []
+            for familia in self.familias():
+                familia.escribir(lineas, openmetrics)
+            if openmetrics:
+                lineas.append("# EOF")
+            texto = "\n".join(lineas) + "\n"
+            self._cache[openmetrics] = (ahora, texto)
+            self.generaciones += 1
+            return texto
+
+    def _familia(self, nombre, tipo, ayuda):
+        return Familia(self.PREFIJO + nombre, tipo, ayuda)
+
+    def familias(self):
+        """
+        Returns:
+            list[Familia]: Métricas actuales del DMA, el bus y el planificador
+        """
+        familias = []
+        if self.dma is not None:
+            familias += self._familias_dma(self.dma.get_status())
+            familias += self._familias_bus(self.dma.bus.get_status())
+        if self.planificador is not None:
+            familias += self._familias_planificador(self.planificador)
+        return familias
+
+    def _familias_dma(self, estado):
+        f = self._familia
+        familias = [
+            f("dma_transferencias", "counter", "Transferencias enviadas al bus").agregar(
+                estado['transferencias_totales']),
+            f("dma_transferencias_en_vuelo", "gauge", "Transferencias aceptadas aún no completadas").agregar(
+                estado['transferencias_en_vuelo']),
+            f("dma_transacciones_bus", "counter", "Entradas emitidas por los canales hacia el bus").agregar(
+                estado['transacciones_bus']),
+            f("dma_cache_aciertos", "counter", "Aciertos de la caché").agregar(estado['cache_hits']),
+            f("dma_cache_fallos", "counter", "Fallos de la caché").agregar(estado['cache_misses']),
+            f("dma_cache_desalojos", "counter", "Entradas desalojadas de la caché").agregar(
+                estado['cache_evictions']),
+            f("dma_cache_entradas", "gauge", "Entradas en la caché").agregar(estado['cache_used']),
+            f("dma_cache_tamano", "gauge", "Capacidad de la caché").agregar(estado['cache_size']),
+            f("dma_sucias", "gauge", "Escrituras diferidas sin enviar al bus").agregar(estado['sucias']),
+            f("dma_escrituras_diferidas", "counter", "Escrituras guardadas como sucias").agregar(
+                estado['escrituras_diferidas']),
+            f("dma_escrituras_absorbidas", "counter", "Escrituras que reemplazaron a una sucia").agregar(
+                estado['escrituras_absorbidas']),
+            f("dma_vaciados", "counter", "Vaciados de escrituras sucias").agregar(estado['vaciados']),
+        ]
+        ocupado = f("dma_buffer_ocupado", "gauge", "Entradas en el buffer del canal")
+        tamano = f("dma_buffer_tamano", "gauge", "Tamaño del buffer del canal")
+        bloqueos = f("dma_buffer_bloqueos", "counter", "Veces que un productor encontró el buffer lleno")
+        bloqueado = f("dma_buffer_bloqueado_segundos", "counter", "Tiempo que los productores esperaron")
+        for canal in estado['canales']:
+            ocupado.agregar(canal['buffer_used'], canal=canal['canal'])
+            tamano.agregar(canal['buffer_size'], canal=canal['canal'])
+            bloqueos.agregar(canal['bloqueos'], canal=canal['canal'])
+            bloqueado.agregar(canal['tiempo_bloqueado'], canal=canal['canal'])
+        return familias + [ocupado, tamano, bloqueos, bloqueado]
+
+    def _familias_bus(self, estado):
+        f = self._familia
+        familias = [
+            f("bus_solicitudes_recibidas", "counter", "Solicitudes recibidas por el bus").agregar(
+                estado['solicitudes_totales']),
+            f("bus_solicitudes_procesadas", "counter", "Solicitudes completadas por el bus").agregar(
+                estado['solicitudes_procesadas']),
+            f("bus_transacciones", "counter", "Transacciones completadas").agregar(estado['transacciones']),
+            f("bus_bytes", "counter", "Bytes transferidos").agregar(estado['bytes_transferidos']),
+            f("bus_throughput_bytes", "gauge", "Bytes por segundo logrados desde el inicio").agregar(
+                estado['throughput_bytes']),
+            f("bus_utilizacion", "gauge", "Fracción de la capacidad del bus en uso").agregar(
+                estado['utilizacion'] / 100),
+            f("bus_en_servicio", "gauge", "Transacciones en curso").agregar(estado['en_servicio']),
+        ]
+        pendientes = f("bus_pendientes", "gauge", "Entradas esperando en la cola de la prioridad")
+        procesadas = f("bus_procesadas", "counter", "Solicitudes completadas de la prioridad")
+        espera = f("bus_espera_promedio_segundos", "gauge", "Espera promedio en la cola de la prioridad")
+        peso = f("bus_peso", "gauge", "Peso DRR de la prioridad")
+        for prioridad, datos in estado['por_prioridad'].items():
+            pendientes.agregar(datos['pendientes'], prioridad=prioridad)
+            procesadas.agregar(datos['procesadas'], prioridad=prioridad)
+            espera.agregar(datos['espera_promedio'], prioridad=prioridad)
+            peso.agregar(datos['peso'], prioridad=prioridad)
+        return familias + [pendientes, procesadas, espera, peso]
+
+    def _familias_planificador(self, planificador):
+        f = self._familia
+        metricas = planificador.metricas
+        estadisticas = metricas.obtener_estadisticas_detalladas()  # O(1)
+        familias = [
+            f("planificador_solicitudes_procesadas", "counter", "Solicitudes despachadas").agregar(
+                estadisticas['solicitudes_procesadas']),
+            f("planificador_movimientos_cabezal", "counter", "Movimientos del cabezal").agregar(
+                estadisticas['movimientos_totales']),
+            f("planificador_pendientes", "gauge", "Solicitudes en cola").agregar(planificador.pendientes),
+            f("planificador_profundidad_cola_max", "gauge", "Mayor profundidad de cola").agregar(
+                estadisticas['profundidad_max']),
+            f("planificador_espera_transferencias_segundos", "counter",
+              "Tiempo bloqueado esperando transferencias del DMA").agregar(planificador.tiempo_espera_dma),
+        ]
+        # Una familia por dimensión: si el total y los desgloses compartieran
+        # familia, sum() y histogram_quantile() sobre ella contarían cada
+        # observación dos veces
+        latencia = f("planificador_latencia_segundos", "histogram",
+                     "Latencia de servicio, espera en cola y extremo a extremo")
+        por_dimension = {
+            dimension: f(f"planificador_latencia_por_{dimension}_segundos", "histogram",
+                         f"Latencia de servicio, espera en cola y extremo a extremo por {dimension}")
+            for dimension in DIMENSIONES
+        }
+        latencias = metricas.latencias
+        with latencias.lock:
+            for metrica, grupo in latencias.histogramas.items():
+                self._agregar_histograma(latencia, grupo['total'], metrica=metrica)
+                for dimension, familia in por_dimension.items():
+                    for valor in sorted(grupo[dimension]):
+                        self._agregar_histograma(familia, grupo[dimension][valor],
+                                                 metrica=metrica, **{dimension: valor})
+        return familias + [latencia] + list(por_dimension.values())
+
+    @staticmethod
+    def _agregar_histograma(familia, histograma, **etiquetas):
+        # Buckets acumulados de las cubetas no vacías. Los límites los fija la
+        # configuración del histograma, así que se pueden sumar entre consultas
+        # e instancias; una cubeta que ya tuvo registros nunca desaparece
+        for limite, acumulado in histograma.cubetas():
+            familia.agregar(acumulado, "_bucket", **etiquetas, le=repr(float(f"{limite:.12g}")))
+        familia.agregar(histograma.n, "_bucket", **etiquetas, le="+Inf")
+        familia.agregar(histograma.n, "_count", **etiquetas)
+        familia.agregar(histograma.total, "_sum", **etiquetas)
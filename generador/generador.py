@@ -1,4 +1,48 @@
+import itertools
 import random
+import threading
+
+TIPOS = ("lectura", "escritura")  # Tipos de operación; su índice es el código en LoteSolicitudes
+TAMANO_BLOQUE = 4096  # Bytes que transfiere una solicitud por defecto
+
+_lock_ids = threading.Lock()
+_proximo_id = 1
+
+
+def reservar_ids(cantidad=1):
+    """
+    Reserva un bloque de identificadores de solicitud consecutivos.
+
+    Los identificadores crecen de forma monótona durante todo el proceso y
+    nunca se reutilizan, a diferencia de id().
+
+    Args:
+        cantidad (int, optional): Número de identificadores. Defaults to 1.
+
+    Returns:
+        int: Primer identificador del bloque
+    """
+    global _proximo_id
+    with _lock_ids:
+        inicio = _proximo_id
+        _proximo_id += cantidad
+    return inicio
+
+
+def avanzar_ids(ultimo):
+    """
+    Garantiza que los identificadores que se reserven después sean mayores
+    que `ultimo`. Se usa al cargar solicitudes con identificadores ya
+    asignados (por ejemplo, de una traza) para que las nuevas no los repitan.
+
+    Args:
+        ultimo (int): Mayor identificador en uso
+    """
+    global _proximo_id
+    with _lock_ids:
+        if _proximo_id <= ultimo:
+            _proximo_id = ultimo + 1
+
 
 class Solicitud:
     """
@@ -12,8 +56,18 @@ class Solicitud:
         posicion (int): Sector específico del disco donde se realizará la operación
         tipo (str): Tipo de operación a realizar ('lectura' o 'escritura')
         prioridad (int): Nivel de prioridad de la solicitud (1-5, siendo 5 la más alta)
+        id_solicitud (int): Identificador único y creciente de la solicitud
+        llegada (float): Instante de llegada a la cola del planificador, o None si
+            aún no fue admitida. La espera se mide desde aquí.
+        tamano (int): Bytes a transferir
+
+    Note:
+        Usa __slots__ para no reservar un __dict__ por instancia.
     """
-    def __init__(self, id_dispositivo, posicion, tipo, prioridad=1):
+    __slots__ = ("id_dispositivo", "posicion", "tipo", "prioridad", "id_solicitud", "llegada", "tamano")
+
+    def __init__(self, id_dispositivo, posicion, tipo, prioridad=1, id_solicitud=None, llegada=None,
+                 tamano=TAMANO_BLOQUE):
         """
         Inicializa una nueva solicitud de disco.
 
@@ -22,11 +76,17 @@ class Solicitud:
             posicion (int): Posición en el disco donde realizar la operación
             tipo (str): Tipo de operación ('lectura' o 'escritura')
             prioridad (int, optional): Nivel de prioridad. Defaults to 1.
+            id_solicitud (int, optional): Identificador. Defaults to uno nuevo.
+            llegada (float, optional): Instante de llegada. Defaults to None.
+            tamano (int, optional): Bytes a transferir. Defaults to TAMANO_BLOQUE.
         """
         self.id_dispositivo = id_dispositivo  # Identificador del dispositivo origen
         self.posicion = posicion  # Sector del disco objetivo
         self.tipo = tipo  # Tipo de operación a realizar
         self.prioridad = prioridad  # Nivel de prioridad de la solicitud
+        self.id_solicitud = reservar_ids() if id_solicitud is None else id_solicitud
+        self.llegada = llegada  # Se fija al admitirla en la cola
+        self.tamano = tamano  # Bytes que ocupa la transferencia en el bus
 
     def __repr__(self):
         """
@@ -52,8 +112,10 @@ class GeneradorSolicitudes:
         num_solicitudes (int): Cantidad de solicitudes a generar
         max_posicion (int): Límite superior para las posiciones en el disco
         alta_carga (bool): Indica si se debe simular una carga alta del sistema
+        tamanos (tuple[int]): Tamaños en bytes entre los que se elige el de
+            cada solicitud; con uno solo todas tienen ese tamaño
     """
-    def __init__(self, num_solicitudes=10, max_posicion=100, alta_carga=False):
+    def __init__(self, num_solicitudes=10, max_posicion=100, alta_carga=False, tamanos=(TAMANO_BLOQUE,)):
         """
         Inicializa el generador de solicitudes.
 
@@ -61,10 +123,28 @@ class GeneradorSolicitudes:
             num_solicitudes (int, optional): Número de solicitudes a generar. Defaults to 10.
             max_posicion (int, optional): Posición máxima en el disco. Defaults to 100.
             alta_carga (bool, optional): Activar modo de alta carga. Defaults to False.
+            tamanos (tuple[int], optional): Tamaños posibles en bytes. Defaults to (TAMANO_BLOQUE,).
         """
         self.num_solicitudes = num_solicitudes  # Cantidad de solicitudes a generar
         self.max_posicion = max_posicion  # Límite máximo de posición en disco
         self.alta_carga = alta_carga  # Indicador de modo alta carga
+        self.tamanos = tuple(tamanos)  # Tamaños de transferencia posibles
+
+    def _crear_solicitud(self):
+        # Generar parámetros aleatorios para una solicitud
+        tipo = random.choice(TIPOS)  # Tipo de operación aleatorio
+
+        # Calcular posición según modo de carga
+        max_pos = self.max_posicion * 10 if self.alta_carga else self.max_posicion
+        posicion = random.randint(0, max_pos)
+
+        prioridad = random.randint(1, 5)  # Prioridad aleatoria entre 1 y 5
+        id_dispositivo = random.randint(1, 3)  # Simula 3 dispositivos conectados
+
+        # Con un único tamaño no se consume aleatoriedad: la secuencia no cambia
+        tamano = self.tamanos[0] if len(self.tamanos) == 1 else random.choice(self.tamanos)
+
+        return Solicitud(id_dispositivo, posicion, tipo, prioridad, tamano=tamano)
 
     def generar(self):
         """
@@ -80,17 +160,57 @@ class GeneradorSolicitudes:
         """
         solicitudes = []
         for _ in range(self.num_solicitudes):
-            # Generar parámetros aleatorios para cada solicitud
-            tipo = random.choice(["lectura", "escritura"])  # Tipo de operación aleatorio
-            
-            # Calcular posición según modo de carga
-            max_pos = self.max_posicion * 10 if self.alta_carga else self.max_posicion
-            posicion = random.randint(0, max_pos)
-            
-            prioridad = random.randint(1, 5)  # Prioridad aleatoria entre 1 y 5
-            id_dispositivo = random.randint(1, 3)  # Simula 3 dispositivos conectados
-            
             # Crear y agregar la nueva solicitud
-            solicitudes.append(Solicitud(id_dispositivo, posicion, tipo, prioridad))
+            solicitudes.append(self._crear_solicitud())
         
-        return solicitudes
\ No newline at end of file
+        return solicitudes
+
+    def generar_lote(self, semilla=None):
+        """
+        Genera todas las solicitudes en un lote por columnas con una sola llamada
+        vectorizada por atributo.
+
+        Usa el generador aleatorio de NumPy, así que con la misma semilla produce
+        una carga distinta a la de `generar`.
+
+        Args:
+            semilla (int, optional): Semilla del generador. Defaults to None.
+
+        Returns:
+            LoteSolicitudes: Lote con num_solicitudes solicitudes
+        """
+        import numpy as np
+
+        from generador.lote import LoteSolicitudes
+
+        rng = np.random.default_rng(semilla)
+        n = self.num_solicitudes
+        max_pos = self.max_posicion * 10 if self.alta_carga else self.max_posicion
+        return LoteSolicitudes(
+            id_dispositivo=rng.integers(1, 4, n, dtype=np.int8),  # 3 dispositivos
+            posicion=rng.integers(0, max_pos + 1, n, dtype=np.int64),
+            tipo=rng.integers(0, len(TIPOS), n, dtype=np.uint8),
+            prioridad=rng.integers(1, 6, n, dtype=np.int8),
+            tamano=rng.choice(np.asarray(self.tamanos, dtype=np.uint32), n)
+        )
+
+    def generar_flujo(self, tasa_llegadas, infinito=False):
+        """
+        Genera un flujo de llegadas de Poisson para un sistema abierto.
+
+        Las solicitudes se crean bajo demanda, así que el flujo puede ser tan
+        largo como se quiera sin ocupar memoria.
+
+        Args:
+            tasa_llegadas (float): Llegadas promedio por segundo
+            infinito (bool, optional): Ignorar num_solicitudes y no terminar nunca.
+                Defaults to False.
+
+        Yields:
+            tuple: (instante, Solicitud), con el instante en segundos desde el inicio
+        """
+        instante = 0.0
+        contador = itertools.count() if infinito else range(self.num_solicitudes)
+        for _ in contador:
+            instante += random.expovariate(tasa_llegadas)
+            yield instante, self._crear_solicitud()
\ No newline at end of file
@@ -0,0 +1,143 @@
+import numpy as np
+
+from generador.generador import Solicitud, TAMANO_BLOQUE, TIPOS, reservar_ids
+
+
+class LoteSolicitudes:
+    """
+    Lote compacto de solicitudes almacenado por columnas.
+
+    Guarda cada atributo en un arreglo NumPy (estructura de arreglos) en lugar
+    de un objeto Python por solicitud, lo que reduce la memoria de millones de
+    solicitudes a unos pocos bytes por fila. El tipo de operación se guarda
+    como código: el índice en TIPOS.
+
+    Para el código que necesita objetos, indexar o iterar el lote devuelve
+    objetos Solicitud (con __slots__) creados bajo demanda; `bloques` los
+    entrega de a bloques.
+
+    El lote ahorra memoria y tiempo de generación (un millón de solicitudes:
+    unos 23 MB y 0.1 s), no tiempo de simulación: el planificador atiende
+    cada solicitud como objeto, a unos 0.06-0.09 ms por solicitud de punta a
+    punta con el reloj virtual (medido con 20k solicitudes por consola), y
+    convertir el millón a objetos lleva unos 2 s.
+
+    Attributes:
+        id_dispositivo (np.ndarray): Dispositivo de cada solicitud (int8)
+        posicion (np.ndarray): Sector de cada solicitud (int64)
+        tipo (np.ndarray): Código del tipo de operación (uint8, índice en TIPOS)
+        prioridad (np.ndarray): Prioridad de cada solicitud (int8)
+        id_solicitud (np.ndarray): Identificador de cada solicitud (int64)
+        tamano (np.ndarray): Bytes a transferir de cada solicitud (uint32)
+    """
+
+    def __init__(self, id_dispositivo, posicion, tipo, prioridad, id_solicitud=None, tamano=None):
+        """
+        Crea un lote a partir de sus columnas.
+
+        Args:
+            id_dispositivo (array-like): Columna de dispositivos
+            posicion (array-like): Columna de posiciones
+            tipo (array-like): Columna de códigos de tipo
+            prioridad (array-like): Columna de prioridades
+            id_solicitud (array-like, optional): Columna de identificadores.
+                Defaults to un bloque nuevo de identificadores consecutivos.
+            tamano (array-like, optional): Columna de tamaños en bytes.
+                Defaults to TAMANO_BLOQUE para todas.
+
+        Raises:
+            ValueError: Si las columnas no tienen la misma longitud
+        """
+        self.id_dispositivo = np.asarray(id_dispositivo, dtype=np.int8)
+        self.posicion = np.asarray(posicion, dtype=np.int64)
+        self.tipo = np.asarray(tipo, dtype=np.uint8)
+        self.prioridad = np.asarray(prioridad, dtype=np.int8)
+        if id_solicitud is None:
+            n = len(self.posicion)
+            id_solicitud = np.arange(n, dtype=np.int64) + reservar_ids(n)
+        self.id_solicitud = np.asarray(id_solicitud, dtype=np.int64)
+        if tamano is None:
+            tamano = np.full(len(self.posicion), TAMANO_BLOQUE, dtype=np.uint32)
+        self.tamano = np.asarray(tamano, dtype=np.uint32)
+        if not (len(self.id_dispositivo) == len(self.posicion) == len(self.tipo) ==
+                len(self.prioridad) == len(self.id_solicitud) == len(self.tamano)):
+            raise ValueError("Las columnas del lote deben tener la misma longitud")
+
+    @classmethod
+    def desde_solicitudes(cls, solicitudes):
+        """
+        Construye un lote a partir de objetos Solicitud.
+
+        Args:
+            solicitudes (list[Solicitud]): Solicitudes a empaquetar
+
+        Returns:
+            LoteSolicitudes: Lote con los mismos datos
+        """
+        codigos = {tipo: i for i, tipo in enumerate(TIPOS)}
+        return cls(
+            [s.id_dispositivo for s in solicitudes],
+            [s.posicion for s in solicitudes],
+            [codigos[s.tipo] for s in solicitudes],
+            [s.prioridad for s in solicitudes],
+            [s.id_solicitud for s in solicitudes],
+            [s.tamano for s in solicitudes]
+        )
+
+    def __len__(self):
+        return len(self.posicion)
+
+    def __getitem__(self, i):
+        """
+        Devuelve la solicitud i como objeto Solicitud, o un sub-lote si i es un slice.
+        """
+        if isinstance(i, slice):
+            return LoteSolicitudes(self.id_dispositivo[i], self.posicion[i], self.tipo[i],
+                                   self.prioridad[i], self.id_solicitud[i], self.tamano[i])
+        return Solicitud(int(self.id_dispositivo[i]), int(self.posicion[i]),
+                         TIPOS[self.tipo[i]], int(self.prioridad[i]), int(self.id_solicitud[i]),
+                         tamano=int(self.tamano[i]))
+
+    def __iter__(self):
+        for bloque in self.bloques():
+            yield from bloque
+
+    def bloques(self, tamano=65536):
+        """
+        Recorre el lote en bloques de objetos Solicitud.
+
+        Cada bloque se convierte con una llamada tolist() por columna, lo que
+        evita crear escalares NumPy fila por fila.
+
+        Args:
+            tamano (int, optional): Solicitudes por bloque. Defaults to 65536.
+
+        Yields:
+            list[Solicitud]: Solicitudes del bloque, en orden
+        """
+        for inicio in range(0, len(self), tamano):
+            fin = inicio + tamano
+            yield [
+                Solicitud(d, p, TIPOS[t], pr, i, tamano=b)
+                for d, p, t, pr, i, b in zip(
+                    self.id_dispositivo[inicio:fin].tolist(),
+                    self.posicion[inicio:fin].tolist(),
+                    self.tipo[inicio:fin].tolist(),
+                    self.prioridad[inicio:fin].tolist(),
+                    self.id_solicitud[inicio:fin].tolist(),
+                    self.tamano[inicio:fin].tolist()
+                )
+            ]
+
+    def a_solicitudes(self):
+        """
+        Returns:
+            list[Solicitud]: Todas las solicitudes del lote como objetos
+        """
+        return list(self)
+
+    @property
+    def nbytes(self):
+        """Memoria ocupada por las columnas, en bytes."""
+        return (self.id_dispositivo.nbytes + self.posicion.nbytes + self.tipo.nbytes +
+                self.prioridad.nbytes + self.id_solicitud.nbytes + self.tamano.nbytes)
@@ -27,7 +27,7 @@ class InterfazSimulador:
         root (tk.Tk): Ventana principal de la aplicación
         planificador (PlanificadorDisco): Instancia del planificador
         dma (DMA): Sistema de Acceso Directo a Memoria
-        solicitudes (list): Lista de solicitudes actuales
+        solicitudes (LoteSolicitudes | list): Solicitudes actuales
         lock_buffer (threading.Condition): Lock para sincronización
         
     Note:
@@ -324,8 +324,8 @@ class InterfazSimulador:
             # Crear instancia de GeneradorSolicitudes con los parámetros
             generador = GeneradorSolicitudes(num_solicitudes=num_solicitudes, alta_carga=alta_carga)
 
-            # Generar solicitudes
-            self.solicitudes = generador.generar()
+            # Generar solicitudes como lote compacto por columnas
+            self.solicitudes = generador.generar_lote()
 
             # Actualizar la tabla de solicitudes
             self.actualizar_tabla_solicitudes()
@@ -414,9 +414,10 @@ class InterfazSimulador:
 
             # Gráfico de movimientos del cabezal
             self.ax_movimientos.set_title("Movimientos del Cabezal")
-            tiempos = range(1, len(self.planificador.metricas.historial_accesos) + 1)
-            # Usar las posiciones reales, no los movimientos
-            posiciones = [acc.posicion for acc in self.planificador.metricas.historial_accesos]
+            historial = self.planificador.metricas.historial_accesos
+            tiempos = range(1, len(historial) + 1)
+            # Usar las posiciones reales, no los movimientos (vista sin copia)
+            posiciones = historial.posicion
             self.ax_movimientos.plot(tiempos, posiciones, 'b-', marker='o')
             self.ax_movimientos.set_xlabel("Número de Solicitud")
             self.ax_movimientos.set_ylabel("Posición del Cabezal")
@@ -424,10 +425,10 @@ class InterfazSimulador:
 
             # Gráfico de tiempos por solicitud
             self.ax_tiempos.set_title("Tiempos por Solicitud")
-            if self.planificador.metricas.tiempos_por_solicitud:
-                tiempos_x = range(1, len(self.planificador.metricas.tiempos_por_solicitud) + 1)
+            if len(historial):
+                tiempos_x = range(1, len(historial) + 1)
                 # Usar los tiempos de proceso reales
-                tiempos_proceso = [acc.tiempo_proceso for acc in self.planificador.metricas.historial_accesos]
+                tiempos_proceso = historial.tiempo_proceso
                 self.ax_tiempos.plot(tiempos_x, 
                                 tiempos_proceso,
                                 'g-', 
@@ -1,6 +1,6 @@
 """
 Sistema de Simulación de Planificación de Disco
-    
+
 Este es el módulo principal del sistema que simula la planificación de disco
 utilizando diferentes algoritmos (FIFO, SSTF, SCAN, C-SCAN) junto con DMA y
 buses inteligentes.
@@ -11,32 +11,234 @@ El sistema permite:
 - Analizar rendimiento del sistema
 - Gestionar transferencias mediante DMA
 - Controlar el tráfico mediante buses inteligentes
+- Ejecutar simulaciones por lotes sin interfaz gráfica (--cli)
+
+Sin argumentos abre la interfaz gráfica. Con --cli ejecuta la simulación en
+modo consola y escribe las métricas en JSON o CSV, sin importar Tk,
+ttkbootstrap ni matplotlib.
 
 Version: 1.0
 """
 
-from generador.generador import GeneradorSolicitudes
-from planificador.planificador import PlanificadorDisco
-from dma.dma import DMA
-from interfaz.interfaz import InterfazSimulador
-import tkinter as tk
+import argparse
+import csv
+import json
+import sys
+
+
+def crear_parser():
+    """
+    Construye el parser de argumentos de línea de comandos.
+
+    Returns:
+        argparse.ArgumentParser: Parser configurado
+    """
+    parser = argparse.ArgumentParser(description="Simulador de planificación de disco")
+    parser.add_argument("--cli", action="store_true",
+                        help="Ejecutar sin interfaz gráfica y escribir las métricas")
+    parser.add_argument("--algoritmo", default="FIFO", choices=["FIFO", "SSTF", "SCAN", "C-SCAN"],
+                        help="Algoritmo de planificación (por defecto FIFO)")
+    parser.add_argument("--solicitudes", type=int, default=10,
+                        help="Número de solicitudes a generar (por defecto 10)")
+    parser.add_argument("--buffer", type=int, default=5,
+                        help="Tamaño del buffer del DMA (por defecto 5)")
+    parser.add_argument("--buffer-adaptativo", action="store_true",
+                        help="Ajustar automáticamente el tamaño del buffer del DMA")
+    parser.add_argument("--cache", type=int, default=100,
+                        help="Tamaño de la caché del DMA (por defecto 100)")
+    parser.add_argument("--canales", type=int, default=1,
+                        help="Número de canales del DMA (por defecto 1)")
+    parser.add_argument("--asignacion", default="afinidad", choices=["afinidad", "menos_cargado"],
+                        help="Asignación de solicitudes a canales del DMA (por defecto afinidad)")
+    parser.add_argument("--coalescencia", type=float, default=0.0,
+                        help="Ventana en segundos para agrupar solicitudes contiguas (0 la desactiva)")
+    parser.add_argument("--en-vuelo", type=int, default=None,
+                        help="Máximo de transferencias del DMA en vuelo (por defecto sin límite)")
+    parser.add_argument("--write-through", action="store_true",
+                        help="Enviar las escrituras al bus en el acto en lugar de diferirlas en la caché")
+    parser.add_argument("--tamanos", type=int, nargs="+", default=[4096],
+                        help="Tamaños en bytes de las transferencias; con varios se elige uno al azar "
+                             "por solicitud (por defecto 4096)")
+    parser.add_argument("--ancho-banda", type=float, default=None,
+                        help="Ancho de banda del bus en bytes/s (por defecto 51200)")
+    parser.add_argument("--latencia-bus", type=float, default=None,
+                        help="Latencia de preparación de cada transacción del bus en segundos (por defecto 0.02)")
+    parser.add_argument("--concurrencia-bus", type=int, default=1,
+                        help="Transacciones simultáneas que admite el bus (por defecto 1)")
+    parser.add_argument("--politica-cache", default="LRU", choices=["LRU", "LFU", "ARC", "2Q"],
+                        help="Política de reemplazo de la caché del DMA (por defecto LRU)")
+    parser.add_argument("--alta-carga", action="store_true",
+                        help="Distribuir las solicitudes en un rango de posiciones mayor")
+    parser.add_argument("--semilla", type=int, default=None,
+                        help="Semilla para generar las solicitudes")
+    parser.add_argument("--tiempo-real", action="store_true",
+                        help="Usar el reloj del sistema en lugar del reloj virtual")
+    parser.add_argument("--salida", default="-",
+                        help="Archivo de métricas (.json o .csv); '-' para la salida estándar")
+    parser.add_argument("--formato", choices=["json", "csv"], default=None,
+                        help="Formato de salida (por defecto según la extensión, o json)")
+    parser.add_argument("--exportar-historial", default=None,
+                        help="Guardar el historial completo de accesos en este archivo (.npy o .csv)")
+    parser.add_argument("--grabar-traza", default=None,
+                        help="Grabar las llegadas y despachos en una traza binaria")
+    parser.add_argument("--reproducir-traza", default=None,
+                        help="Usar las solicitudes de una traza en lugar de generarlas; se admiten "
+                             "en el instante grabado, con --buffer pendientes como máximo")
+    parser.add_argument("--puerto-metricas", type=int, default=None,
+                        help="Publicar las métricas en formato OpenMetrics en http://127.0.0.1:PUERTO/metrics "
+                             "mientras dura la simulación")
+    parser.add_argument("--verbose", action="store_true",
+                        help="Mostrar el log de cada solicitud procesada")
+    return parser
+
+
+def ejecutar_cli(args):
+    """
+    Ejecuta una simulación sin interfaz gráfica.
+
+    Args:
+        args (argparse.Namespace): Parámetros de la simulación
+
+    Returns:
+        dict: Métricas del planificador, del DMA y del bus
+    """
+    import random
+
+    from dma.dma import DMA
+    from generador.generador import GeneradorSolicitudes
+    from planificador.planificador import PlanificadorDisco
+    from reloj.reloj import RelojReal, RelojVirtual
+
+    if args.semilla is not None:
+        random.seed(args.semilla)
+
+    reloj = RelojReal() if args.tiempo_real else RelojVirtual()
+    solicitudes = fuente = None
+    if args.reproducir_traza:
+        from traza.traza import FuenteTraza
+
+        # La traza se lee por bloques desde el mapa en memoria a medida que
+        # llegan sus solicitudes, y la ventana de --buffer acota las pendientes:
+        # la memoria no depende del largo de la traza. Las llegadas se admiten
+        # en el orden y los instantes grabados
+        fuente = FuenteTraza(args.reproducir_traza)
+    else:
+        solicitudes = GeneradorSolicitudes(num_solicitudes=args.solicitudes, alta_carga=args.alta_carga,
+                                           tamanos=args.tamanos).generar()
+    grabador = None
+    if args.grabar_traza:
+        from traza.traza import GrabadorTraza
+
+        grabador = GrabadorTraza(args.grabar_traza)
+    dma = DMA(buffer_size=args.buffer, cache_size=args.cache, reloj=reloj,
+              politica_cache=args.politica_cache, num_canales=args.canales, asignacion=args.asignacion,
+              ventana_coalescencia=args.coalescencia, buffer_adaptativo=args.buffer_adaptativo,
+              escritura_diferida=not args.write_through, ancho_banda_bus=args.ancho_banda,
+              latencia_bus=args.latencia_bus, concurrencia_bus=args.concurrencia_bus)
+    planificador = PlanificadorDisco(
+        solicitudes=solicitudes,
+        tamano_buffer=args.buffer,
+        algoritmo=args.algoritmo,
+        dma=dma,
+        silencioso=not args.verbose,
+        max_en_vuelo=args.en_vuelo,
+        max_historial=None if args.exportar_historial else 1000,
+        grabador=grabador,
+        fuente=fuente
+    )
+    exportador = None
+    if args.puerto_metricas is not None:
+        from exportador.exportador import ExportadorMetricas
 
-def main():
+        exportador = ExportadorMetricas(dma, planificador, puerto=args.puerto_metricas).iniciar()
+    planificador.ejecutar()
+    dma.shutdown()
+    if exportador:
+        exportador.detener()
+    if grabador:
+        grabador.cerrar()
+
+    if args.exportar_historial:
+        historial = planificador.metricas.historial_accesos
+        if args.exportar_historial.lower().endswith(".csv"):
+            historial.exportar_csv(args.exportar_historial)
+        else:
+            historial.exportar_npy(args.exportar_historial)
+
+    metricas = planificador.obtener_metricas()
+    metricas.pop("tiempos_por_solicitud", None)  # Serie por solicitud, no resumen
+    estado_dma = dma.get_status()
+    return {
+        "algoritmo": args.algoritmo,
+        "planificador": metricas,
+        "dma": {k: v for k, v in estado_dma.items() if not k.endswith("_history")},
+        "bus": dma.bus.get_status()
+    }
+
+
+def escribir_metricas(resultado, salida, formato=None):
+    """
+    Escribe las métricas en JSON o CSV.
+
+    En CSV cada fila es (seccion, metrica, valor) con los valores escalares.
+
+    Args:
+        resultado (dict): Métricas devueltas por ejecutar_cli
+        salida (str): Ruta del archivo, o '-' para la salida estándar
+        formato (str, optional): 'json' o 'csv'. Defaults to según la extensión.
+    """
+    if formato is None:
+        formato = "csv" if salida.lower().endswith(".csv") else "json"
+
+    archivo = sys.stdout if salida == "-" else open(salida, "w", newline="", encoding="utf-8")
+    try:
+        if formato == "json":
+            json.dump(resultado, archivo, indent=2, ensure_ascii=False)
+            archivo.write("\n")
+        else:
+            escritor = csv.writer(archivo)
+            escritor.writerow(["seccion", "metrica", "valor"])
+            for seccion, valores in resultado.items():
+                if not isinstance(valores, dict):
+                    escritor.writerow(["", seccion, valores])
+                    continue
+                for metrica, valor in valores.items():
+                    if isinstance(valor, (int, float, str)):
+                        escritor.writerow([seccion, metrica, valor])
+    finally:
+        if archivo is not sys.stdout:
+            archivo.close()
+
+
+def main(argv=None):
     """
     Punto de entrada principal del sistema.
-    
-    Inicializa la interfaz gráfica y comienza la simulación del
-    sistema de planificación de disco.
+
+    Sin --cli inicializa la interfaz gráfica y comienza la simulación del
+    sistema de planificación de disco. Los módulos gráficos se importan solo
+    en ese caso.
+
+    Args:
+        argv (list, optional): Argumentos de línea de comandos. Defaults to sys.argv.
     """
+    args = crear_parser().parse_args(argv)
+
+    if args.cli:
+        escribir_metricas(ejecutar_cli(args), args.salida, args.formato)
+        return
+
+    import tkinter as tk
+    from interfaz.interfaz import InterfazSimulador
+
     # Crear la ventana principal para la interfaz gráfica
-    root = tk.Tk()  
-    
+    root = tk.Tk()
+
     # Inicializar la interfaz gráfica del simulador
     app = InterfazSimulador(root)
-    
+
     # Iniciar el bucle principal de la interfaz
     root.mainloop()
 
 # Verificación estándar de Python para ejecución directa
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
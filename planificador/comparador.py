@@ -0,0 +1,138 @@
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+ALGORITMOS = ("FIFO", "SSTF", "SCAN", "C-SCAN")
+
+# Valores críticos de la t de Student (dos colas, 95%) por grados de libertad
+_T_95 = {
+    1: 12.706, 2: 4.303, 3: 3.182, 4: 2.776, 5: 2.571, 6: 2.447, 7: 2.365,
+    8: 2.306, 9: 2.262, 10: 2.228, 11: 2.201, 12: 2.179, 13: 2.160, 14: 2.145,
+    15: 2.131, 16: 2.120, 17: 2.110, 18: 2.101, 19: 2.093, 20: 2.086,
+    25: 2.060, 30: 2.042, 40: 2.021, 60: 2.000, 120: 1.980,
+}
+
+
+def _t_95(grados):
+    # Valor tabulado más cercano por debajo (conservador); 1.96 para muestras grandes
+    if grados > 120:
+        return 1.96
+    return _T_95[max(g for g in _T_95 if g <= grados)]
+
+
+def ejecutar_corrida(algoritmo, semilla, num_solicitudes=100, alta_carga=False, tamano_buffer=5):
+    """
+    Ejecuta una simulación completa con reloj virtual y devuelve sus estadísticas.
+
+    Se usa como tarea de un proceso del pool, así que importa los módulos de
+    simulación dentro del proceso. Con la misma semilla todos los algoritmos
+    reciben la misma carga.
+
+    Args:
+        algoritmo (str): Algoritmo de planificación
+        semilla (int): Semilla para generar la carga
+        num_solicitudes (int, optional): Tamaño de la carga. Defaults to 100.
+        alta_carga (bool, optional): Modo de alta carga. Defaults to False.
+        tamano_buffer (int, optional): Tamaño del buffer del DMA. Defaults to 5.
+
+    Returns:
+        dict: Resultado de Metricas.obtener_estadisticas_detalladas(), más
+            'latencias' con los histogramas (LatenciasPorClase) de la corrida
+    """
+    from dma.dma import DMA
+    from generador.generador import GeneradorSolicitudes
+    from planificador.planificador import PlanificadorDisco
+    from reloj.reloj import RelojVirtual
+
+    random.seed(semilla)
+    solicitudes = GeneradorSolicitudes(num_solicitudes=num_solicitudes, alta_carga=alta_carga).generar()
+
+    reloj = RelojVirtual()
+    dma = DMA(buffer_size=tamano_buffer, reloj=reloj)
+    planificador = PlanificadorDisco(
+        solicitudes=solicitudes,
+        tamano_buffer=tamano_buffer,
+        algoritmo=algoritmo,
+        dma=dma,
+        silencioso=True,
+        max_historial=0
+    )
+    planificador.ejecutar()
+    dma.shutdown()
+    return {**planificador.metricas.obtener_estadisticas_detalladas(),
+            'latencias': planificador.metricas.latencias}
+
+
+def resumir(corridas):
+    """
+    Agrega los resultados de varias corridas de un mismo algoritmo.
+
+    Los histogramas de latencia de las corridas se combinan en uno solo, así
+    los percentiles se calculan sobre todas las solicitudes y no se promedian.
+
+    Args:
+        corridas (list[dict]): Estadísticas de cada corrida
+
+    Returns:
+        dict: Media de cada métrica (mismas claves que las corridas), más
+            'desviaciones', 'intervalos' (IC del 95% como (inferior, superior)),
+            'muestras' y 'latencias' (percentiles de los histogramas combinados)
+    """
+    from planificador.histograma import LatenciasPorClase
+
+    n = len(corridas)
+    resumen = {'desviaciones': {}, 'intervalos': {}, 'muestras': n}
+    latencias = LatenciasPorClase()
+    for corrida in corridas:
+        if 'latencias' in corrida:
+            latencias.combinar(corrida['latencias'])
+    resumen['latencias'] = latencias.resumen()
+    for clave in corridas[0]:
+        if clave == 'latencias':
+            continue
+        valores = [c[clave] for c in corridas]
+        media = sum(valores) / n
+        if n > 1:
+            desviacion = math.sqrt(sum((v - media) ** 2 for v in valores) / (n - 1))
+            margen = _t_95(n - 1) * desviacion / math.sqrt(n)
+        else:
+            desviacion, margen = 0.0, float("nan")
+        resumen[clave] = media
+        resumen['desviaciones'][clave] = desviacion
+        resumen['intervalos'][clave] = (media - margen, media + margen)
+    return resumen
+
+
+def comparar_algoritmos(num_solicitudes=100, semillas=range(5), algoritmos=ALGORITMOS,
+                        alta_carga=False, tamano_buffer=5, procesos=None):
+    """
+    Compara algoritmos sobre las mismas cargas en paralelo.
+
+    Cada par (algoritmo, semilla) se simula con reloj virtual en un proceso
+    del pool, así que la comparación aprovecha todos los núcleos.
+
+    Args:
+        num_solicitudes (int, optional): Solicitudes por carga. Defaults to 100.
+        semillas (iterable, optional): Semillas de las cargas. Defaults to range(5).
+        algoritmos (iterable, optional): Algoritmos a comparar. Defaults to ALGORITMOS.
+        alta_carga (bool, optional): Modo de alta carga. Defaults to False.
+        tamano_buffer (int, optional): Tamaño del buffer del DMA. Defaults to 5.
+        procesos (int, optional): Procesos del pool. Defaults to os.cpu_count().
+
+    Returns:
+        dict: Resumen por algoritmo (ver `resumir`), listo para
+            MetricVisualizer.plot_comparison
+    """
+    semillas = list(semillas)
+    tareas = [(algoritmo, semilla) for algoritmo in algoritmos for semilla in semillas]
+    with ProcessPoolExecutor(max_workers=procesos) as pool:
+        futuros = [
+            pool.submit(ejecutar_corrida, algoritmo, semilla, num_solicitudes, alta_carga, tamano_buffer)
+            for algoritmo, semilla in tareas
+        ]
+        resultados = [f.result() for f in futuros]
+
+    por_algoritmo = {algoritmo: [] for algoritmo in algoritmos}
+    for (algoritmo, _), resultado in zip(tareas, resultados):
+        por_algoritmo[algoritmo].append(resultado)
+    return {algoritmo: resumir(corridas) for algoritmo, corridas in por_algoritmo.items()}
@@ -0,0 +1,102 @@
+from collections import deque
+from itertools import count
+
+
+class ColaEnvejecimiento:
+    """
+    Cola FIFO con prioridades y envejecimiento perezoso.
+
+    Mantiene una deque por prioridad original, en orden de llegada. La
+    prioridad efectiva de una solicitud es su prioridad original más un
+    punto por cada `tiempo_envejecimiento` segundos de espera, con tope en
+    `max_prioridad`, y se calcula solo al despachar a partir de su instante
+    de llegada (`solicitud.llegada`). Dentro de una misma deque la cabeza es
+    la más antigua y por tanto la de mayor prioridad efectiva, así que basta
+    comparar las cabezas: el despacho cuesta O(P) con P prioridades
+    (constante) y nunca modifica el atributo `prioridad` de las solicitudes.
+
+    Attributes:
+        tiempo_envejecimiento (float): Segundos de espera por punto de prioridad
+        max_prioridad (int): Tope de la prioridad efectiva
+        colas (dict): Deque de (secuencia, solicitud) por prioridad original
+        promociones (int): Solicitudes despachadas con prioridad efectiva mayor a la original
+    """
+
+    def __init__(self, tiempo_envejecimiento=5.0, max_prioridad=5):
+        """
+        Inicializa la cola.
+
+        Args:
+            tiempo_envejecimiento (float, optional): Segundos por punto. Defaults to 5.0.
+            max_prioridad (int, optional): Tope de prioridad. Defaults to 5.
+        """
+        self.tiempo_envejecimiento = tiempo_envejecimiento
+        self.max_prioridad = max_prioridad
+        self.colas = {}
+        self.promociones = 0
+        self._contador = count()
+        self._tamano = 0
+
+    def __len__(self):
+        return self._tamano
+
+    def __bool__(self):
+        return self._tamano > 0
+
+    def agregar(self, solicitud):
+        """
+        Encola una solicitud.
+
+        Args:
+            solicitud (Solicitud): Solicitud a encolar, con `llegada` ya asignada
+        """
+        cola = self.colas.get(solicitud.prioridad)
+        if cola is None:
+            cola = self.colas[solicitud.prioridad] = deque()
+        cola.append((next(self._contador), solicitud))
+        self._tamano += 1
+
+    def prioridad_efectiva(self, prioridad, llegada, ahora):
+        """
+        Calcula la prioridad de una solicitud tras su envejecimiento.
+
+        Args:
+            prioridad (int): Prioridad original
+            llegada (float): Instante de llegada
+            ahora (float): Instante actual
+
+        Returns:
+            int: Prioridad efectiva
+        """
+        incrementos = int((ahora - llegada) / self.tiempo_envejecimiento)
+        if incrementos <= 0:
+            return prioridad
+        return max(prioridad, min(self.max_prioridad, prioridad + incrementos))
+
+    def extraer(self, ahora):
+        """
+        Despacha la solicitud de mayor prioridad efectiva; ante empate, la más antigua.
+
+        Args:
+            ahora (float): Instante actual
+
+        Returns:
+            Solicitud: Solicitud despachada, o None si la cola está vacía
+        """
+        mejor = None
+        mejor_clave = None
+        for prioridad, cola in self.colas.items():
+            if not cola:
+                continue
+            secuencia, solicitud = cola[0]
+            clave = (self.prioridad_efectiva(prioridad, solicitud.llegada, ahora), -secuencia)
+            if mejor_clave is None or clave > mejor_clave:
+                mejor, mejor_clave = prioridad, clave
+        if mejor is None:
+            return None
+
+        _, solicitud = self.colas[mejor].popleft()
+        self._tamano -= 1
+        if mejor_clave[0] > mejor:
+            self.promociones += 1
+        return solicitud
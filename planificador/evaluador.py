@@ -0,0 +1,226 @@
+from dataclasses import dataclass
+
+import numpy as np
+
+from generador.lote import LoteSolicitudes
+
+
+@dataclass
+class ResultadoEvaluacion:
+    """
+    Resultado de evaluar un algoritmo de planificación sin simular tiempos.
+
+    Attributes:
+        algoritmo (str): Algoritmo evaluado
+        orden (np.ndarray): Índices de las solicitudes en orden de despacho
+        distancias (np.ndarray): Movimiento del cabezal para cada solicitud despachada
+        movimiento_total (int): Suma de todos los movimientos del cabezal
+    """
+    algoritmo: str
+    orden: np.ndarray
+    distancias: np.ndarray
+    movimiento_total: int
+
+    def a_dict(self):
+        """
+        Resume el resultado en el formato de métricas del planificador.
+
+        Returns:
+            dict: movimientos_totales, movimientos_promedio y solicitudes_procesadas
+        """
+        n = len(self.orden)
+        return {
+            'movimientos_totales': self.movimiento_total,
+            'movimientos_promedio': self.movimiento_total / n if n else 0,
+            'solicitudes_procesadas': n
+        }
+
+
+def arreglos_desde_solicitudes(solicitudes):
+    """
+    Convierte solicitudes en arreglos de posiciones y prioridades.
+
+    Args:
+        solicitudes (list[Solicitud] | LoteSolicitudes): Solicitudes en orden de
+            llegada. Un lote devuelve directamente sus columnas.
+
+    Returns:
+        tuple: (posiciones, prioridades) como np.ndarray de enteros
+    """
+    if isinstance(solicitudes, LoteSolicitudes):
+        return solicitudes.posicion, solicitudes.prioridad.astype(np.int64)
+    posiciones = np.fromiter((s.posicion for s in solicitudes), dtype=np.int64, count=len(solicitudes))
+    prioridades = np.fromiter((s.prioridad for s in solicitudes), dtype=np.int64, count=len(solicitudes))
+    return posiciones, prioridades
+
+
+def _orden_fifo(posiciones, prioridades, posicion_inicial, direccion):
+    # Mayor prioridad primero; a igual prioridad, orden de llegada (sort estable)
+    if prioridades is None:
+        return np.arange(len(posiciones))
+    return np.argsort(-np.asarray(prioridades), kind='stable')
+
+
+def _orden_scan(posiciones, prioridades, posicion_inicial, direccion):
+    adelante = posiciones >= posicion_inicial
+    # Ascendente y descendente por posición; el sort estable respeta la llegada
+    subida = np.argsort(posiciones, kind='stable')
+    bajada = np.argsort(-posiciones, kind='stable')
+    subida = subida[adelante[subida]]
+    bajada = bajada[~adelante[bajada]]
+    partes = (subida, bajada) if direccion == 1 else (bajada, subida)
+    return np.concatenate(partes)
+
+
+def _orden_c_scan(posiciones, prioridades, posicion_inicial, direccion):
+    ordenadas = np.argsort(posiciones, kind='stable')
+    adelante = posiciones[ordenadas] >= posicion_inicial
+    # Barrido ascendente desde el cabezal y luego, tras volver al inicio, el resto
+    return np.concatenate((ordenadas[adelante], ordenadas[~adelante]))
+
+
+def _fin_de_racha(valores, desde, hasta, paso, umbral):
+    """
+    Busca el primer índice desde `desde` (avanzando de a `paso`, sin llegar a
+    `hasta`) con valores[i] >= umbral. Revisa tramos de tamaño creciente, así
+    que el coste es proporcional a la longitud de la racha.
+
+    Returns:
+        int: Índice encontrado, o `hasta` si la racha llega al final
+    """
+    tramo = 32
+    i = desde
+    while (i < hasta) if paso > 0 else (i > hasta):
+        if paso > 0:
+            fin = min(i + tramo, hasta)
+            bloque = valores[i:fin]
+        else:
+            fin = max(i - tramo, hasta)
+            bloque = valores[fin + 1:i + 1][::-1]
+        cortes = bloque >= umbral
+        if cortes.any():
+            return i + paso * int(cortes.argmax())
+        i = fin
+        tramo *= 2
+    return hasta
+
+
+def _orden_sstf(posiciones, prioridades, posicion_inicial, direccion):
+    """
+    SSTF por distancia pura.
+
+    En una recta, el conjunto de posiciones ya visitadas por SSTF es siempre un
+    intervalo contiguo de las posiciones ordenadas, así que basta avanzar dos
+    punteros sobre las posiciones distintas. Mientras el cabezal avanza en una
+    dirección el extremo opuesto queda fijo, y la racha continúa mientras el
+    siguiente salto sea menor que la distancia a ese extremo; cada racha se
+    resuelve con una búsqueda vectorizada. Las solicitudes en una misma
+    posición se despachan juntas en orden de llegada.
+    """
+    ordenadas = np.argsort(posiciones, kind='stable')
+    recorrido = posiciones[ordenadas]
+    inicios = np.flatnonzero(np.diff(recorrido, prepend=recorrido[0] - 1))
+    cuentas = np.diff(inicios, append=len(recorrido))
+    unicas = recorrido[inicios]
+    n = len(unicas)
+
+    # Seguir a la derecha desde j-1 mientras u[j] - u[j-1] < u[j-1] - u[izq]
+    salto_derecha = np.empty(n, dtype=np.int64)
+    salto_derecha[1:] = unicas[1:] - 2 * unicas[:-1]
+    # Seguir a la izquierda desde i+1 mientras u[i+1] - u[i] < u[der] - u[i+1]
+    salto_izquierda = np.empty(n, dtype=np.int64)
+    salto_izquierda[:-1] = 2 * unicas[1:] - unicas[:-1]
+
+    # Pocas rachas en cargas típicas: el acceso escalar a los arreglos es suficiente
+    u = unicas
+    primeras = ordenadas[inicios]
+    derecha = int(np.searchsorted(unicas, posicion_inicial))
+    izquierda = derecha - 1
+    cabezal = posicion_inicial
+    tramos = []
+    while izquierda >= 0 and derecha < n:
+        d_der = int(u[derecha]) - cabezal
+        d_izq = cabezal - int(u[izquierda])
+        # Empate de distancia: la solicitud más antigua, como el planificador
+        if d_der < d_izq or (d_der == d_izq and primeras[derecha] < primeras[izquierda]):
+            fin = _fin_de_racha(salto_derecha, derecha + 1, n, 1, -int(u[izquierda]))
+            tramos.append(np.arange(derecha, fin))
+            cabezal = int(u[fin - 1])
+            derecha = fin
+        else:
+            fin = _fin_de_racha(salto_izquierda, izquierda - 1, -1, -1, int(u[derecha]))
+            tramos.append(np.arange(izquierda, fin, -1))
+            cabezal = int(u[fin + 1])
+            izquierda = fin
+    # Agotado un lado, el resto se recorre de corrido hacia el otro
+    tramos.append(np.arange(derecha, n) if izquierda < 0 else np.arange(izquierda, -1, -1))
+
+    # Expandir cada grupo (posición) a sus solicitudes en orden de llegada
+    grupos = np.concatenate(tramos)
+    c = cuentas[grupos]
+    desplazamientos = np.repeat(inicios[grupos] - (np.cumsum(c) - c), c) + np.arange(c.sum())
+    return ordenadas[desplazamientos]
+
+
+_ALGORITMOS = {
+    "FIFO": _orden_fifo,
+    "SSTF": _orden_sstf,
+    "SCAN": _orden_scan,
+    "C-SCAN": _orden_c_scan,
+}
+
+
+def evaluar(algoritmo, posiciones, prioridades=None, posicion_inicial=0, direccion=1):
+    """
+    Calcula el orden de despacho y el movimiento del cabezal de un algoritmo.
+
+    Evaluación offline, sin hilos, DMA ni tiempos: pensada para planificación
+    de capacidad con cargas grandes. Coincide con PlanificadorDisco (que parte
+    de la posición 0 en dirección ascendente) en estos casos:
+
+    - FIFO: mientras el envejecimiento no promueva ninguna solicitud.
+    - SCAN: siempre.
+    - C-SCAN: siempre.
+    - SSTF: es SSTF por distancia pura; el SSTF del planificador además pondera
+      prioridad, frecuencia y espera, así que solo coincide cuando esos factores
+      no alteran la elección (por ejemplo, posiciones distintas e igual prioridad).
+
+    Args:
+        algoritmo (str): "FIFO", "SSTF", "SCAN" o "C-SCAN"
+        posiciones (array-like): Posición de cada solicitud, en orden de llegada
+        prioridades (array-like, optional): Prioridad de cada solicitud (solo FIFO).
+            Defaults to None.
+        posicion_inicial (int, optional): Posición inicial del cabezal. Defaults to 0.
+        direccion (int, optional): Dirección inicial de SCAN (1 o -1). Defaults to 1.
+
+    Returns:
+        ResultadoEvaluacion: Orden de despacho, distancias y movimiento total
+
+    Raises:
+        ValueError: Si se especifica un algoritmo no soportado
+    """
+    if algoritmo not in _ALGORITMOS:
+        raise ValueError(f"Algoritmo desconocido: {algoritmo}")
+
+    posiciones = np.asarray(posiciones, dtype=np.int64)
+    if len(posiciones) == 0:
+        vacio = np.empty(0, dtype=np.int64)
+        return ResultadoEvaluacion(algoritmo, vacio, vacio, 0)
+
+    orden = _ALGORITMOS[algoritmo](posiciones, prioridades, posicion_inicial, direccion)
+    recorrido = posiciones[orden]
+    distancias = np.abs(np.diff(recorrido, prepend=posicion_inicial))
+    return ResultadoEvaluacion(algoritmo, orden, distancias, int(distancias.sum()))
+
+
+def evaluar_todos(posiciones, prioridades=None, posicion_inicial=0, direccion=1):
+    """
+    Evalúa todos los algoritmos soportados sobre la misma carga.
+
+    Returns:
+        dict: ResultadoEvaluacion por nombre de algoritmo
+    """
+    return {
+        algoritmo: evaluar(algoritmo, posiciones, prioridades, posicion_inicial, direccion)
+        for algoritmo in _ALGORITMOS
+    }
@@ -0,0 +1,135 @@
+from collections import OrderedDict
+
+
+class _ContadorSector:
+    """Anillo de contadores por intervalo de tiempo para un sector."""
+
+    __slots__ = ("cuentas", "ultima", "suma", "total")
+
+    def __init__(self, num_cubetas):
+        self.cuentas = [0] * num_cubetas
+        self.ultima = None  # Última cubeta (época) a la que se avanzó el anillo
+        self.suma = 0  # Accesos dentro de la ventana
+        self.total = 0
+
+
+class FrecuenciaAccesos:
+    """
+    Registro acotado de frecuencia de acceso por sector.
+
+    Cada sector guarda un anillo de `num_cubetas` contadores, uno por intervalo
+    de `ventana / num_cubetas` segundos. Las cubetas viejas se reutilizan al
+    avanzar el tiempo (decaimiento por ventana deslizante) y se mantiene la suma
+    de la ventana, así que la consulta "accesos en los últimos `ventana`
+    segundos" es O(1) amortizado y no crece con el historial. La ventana tiene
+    la resolución de una cubeta: cubre entre `ventana - ancho` y `ventana`
+    segundos.
+
+    Además del anillo, cada sector lleva el total de accesos acumulado (usado
+    como predictor). Se siguen como máximo `max_sectores` sectores; al superar
+    el límite se descarta el sector accedido hace más tiempo.
+
+    Attributes:
+        ventana (float): Duración de la ventana deslizante en segundos
+        num_cubetas (int): Número de cubetas del anillo de cada sector
+        ancho (float): Duración de cada cubeta en segundos
+        max_sectores (int): Número máximo de sectores seguidos
+        sectores (OrderedDict): Contadores por sector, del menos al más reciente
+    """
+
+    def __init__(self, ventana=60.0, num_cubetas=12, max_sectores=4096):
+        """
+        Inicializa el registro de frecuencias.
+
+        Args:
+            ventana (float, optional): Ventana en segundos. Defaults to 60.0.
+            num_cubetas (int, optional): Cubetas por sector. Defaults to 12.
+            max_sectores (int, optional): Límite de sectores. Defaults to 4096.
+        """
+        self.ventana = ventana
+        self.num_cubetas = num_cubetas
+        self.ancho = ventana / num_cubetas
+        self.max_sectores = max_sectores
+        self.sectores = OrderedDict()
+
+    def __len__(self):
+        return len(self.sectores)
+
+    def __contains__(self, sector):
+        return sector in self.sectores
+
+    def registrar(self, sector, instante):
+        """
+        Registra un acceso a un sector.
+
+        Args:
+            sector (int): Sector accedido
+            instante (float): Timestamp del acceso
+        """
+        contador = self.sectores.get(sector)
+        if contador is None:
+            contador = _ContadorSector(self.num_cubetas)
+            self.sectores[sector] = contador
+            if len(self.sectores) > self.max_sectores:
+                self.sectores.popitem(last=False)
+        else:
+            self.sectores.move_to_end(sector)
+
+        epoca = int(instante // self.ancho)
+        self._avanzar(contador, epoca)
+        contador.cuentas[epoca % self.num_cubetas] += 1
+        contador.suma += 1
+        contador.total += 1
+
+    def frecuencia(self, sector, instante):
+        """
+        Cuenta los accesos a un sector dentro de la ventana.
+
+        Args:
+            sector (int): Sector consultado
+            instante (float): Instante de referencia
+
+        Returns:
+            int: Accesos en los últimos `ventana` segundos
+        """
+        contador = self.sectores.get(sector)
+        if contador is None:
+            return 0
+        self._avanzar(contador, int(instante // self.ancho))
+        return contador.suma
+
+    def _avanzar(self, contador, epoca):
+        # Vacía las cubetas que salieron de la ventana desde el último avance.
+        # Cada cubeta se vacía una vez por vuelta: coste amortizado O(1).
+        if contador.ultima is None or epoca - contador.ultima >= self.num_cubetas:
+            contador.cuentas = [0] * self.num_cubetas
+            contador.suma = 0
+        elif epoca > contador.ultima:
+            for e in range(contador.ultima + 1, epoca + 1):
+                i = e % self.num_cubetas
+                contador.suma -= contador.cuentas[i]
+                contador.cuentas[i] = 0
+        else:
+            return
+        contador.ultima = epoca
+
+    def total(self, sector):
+        """
+        Returns:
+            int: Total de accesos registrados para el sector (0 si no se sigue)
+        """
+        contador = self.sectores.get(sector)
+        return contador.total if contador else 0
+
+    def mas_frecuentes(self, n):
+        """
+        Obtiene los sectores con más accesos acumulados.
+
+        Args:
+            n (int): Número de sectores a devolver
+
+        Returns:
+            list: Tuplas (sector, total) ordenadas de mayor a menor
+        """
+        return sorted(((s, c.total) for s, c in self.sectores.items()),
+                      key=lambda x: x[1], reverse=True)[:n]
@@ -0,0 +1,288 @@
+import threading
+from array import array
+
+PERCENTILES = (50, 90, 99, 99.9)  # Percentiles que informa `resumen`
+METRICAS_LATENCIA = ("servicio", "espera", "extremo_a_extremo")
+DIMENSIONES = ("id_dispositivo", "prioridad", "tipo")
+
+
+class HistogramaLatencia:
+    """
+    Histograma de latencias con cubetas logarítmicas al estilo HDR.
+
+    Los valores se guardan en unidades enteras (microsegundos por defecto).
+    Hasta 2^precision unidades cada cubeta mide una unidad; por encima, cada
+    potencia de dos se divide en 2^(precision - 1) cubetas, así que el error
+    relativo de cualquier percentil es menor que 2^-(precision - 1) (menos
+    del 1.6% con la precisión por defecto). El número de cubetas lo fijan la
+    precisión y `valor_max`, no la cantidad de valores: registrar es O(1) y
+    la memoria está acotada. Los valores mayores que `valor_max` se cuentan
+    en la última cubeta y en `saturados`.
+
+    Dos histogramas con la misma configuración se pueden combinar, por
+    ejemplo los de corridas en procesos distintos.
+
+    Attributes:
+        precision (int): Bits de resolución dentro de cada potencia de dos
+        unidad (float): Segundos por unidad entera
+        valor_max (float): Mayor valor representable, en segundos
+        cuentas (array): Cuenta de cada cubeta
+        n (int): Valores registrados
+        total (float): Suma de los valores, en segundos
+        minimo (float): Menor valor registrado
+        maximo (float): Mayor valor registrado
+        saturados (int): Valores que superaron `valor_max`
+    """
+
+    __slots__ = ("precision", "unidad", "valor_max", "cuentas", "n", "total", "minimo", "maximo",
+                 "saturados", "_sub", "_mitad", "_max_unidades")
+
+    def __init__(self, precision=7, unidad=1e-6, valor_max=3600.0):
+        self.precision = precision
+        self.unidad = unidad
+        self.valor_max = valor_max
+        self._sub = 1 << precision
+        self._mitad = self._sub >> 1
+        self._max_unidades = int(valor_max / unidad)
+        self.cuentas = array('q', bytes(8 * (self._indice(self._max_unidades) + 1)))
+        self.n = 0
+        self.total = 0.0
+        self.minimo = 0.0
+        self.maximo = 0.0
+        self.saturados = 0
+
+    def _indice(self, unidades):
+        if unidades < self._sub:
+            return unidades
+        desplazamiento = unidades.bit_length() - self.precision
+        return self._sub + (desplazamiento - 1) * self._mitad + (unidades >> desplazamiento) - self._mitad
+
+    def _limite_superior(self, indice):
+        # Mayor valor, en unidades, que cae en la cubeta
+        if indice < self._sub:
+            return indice
+        desplazamiento, resto = divmod(indice - self._sub, self._mitad)
+        desplazamiento += 1
+        return ((resto + self._mitad + 1) << desplazamiento) - 1
+
+    def registrar(self, valor):
+        """
+        Registra un valor.
+
+        Args:
+            valor (float): Latencia en segundos (los negativos cuentan como 0)
+        """
+        valor = max(0.0, valor)
+        unidades = int(valor / self.unidad)
+        if unidades > self._max_unidades:
+            unidades = self._max_unidades
+            self.saturados += 1
+        self.cuentas[self._indice(unidades)] += 1
+        if self.n == 0 or valor < self.minimo:
+            self.minimo = valor
+        if valor > self.maximo:
+            self.maximo = valor
+        self.n += 1
+        self.total += valor
+
+    def percentil(self, p):
+        """
+        Args:
+            p (float): Percentil entre 0 y 100
+
+        Returns:
+            float: Valor en segundos por debajo del cual está el p% de los
+                registros (0 si el histograma está vacío)
+        """
+        return self.percentiles((p,))[0]
+
+    def percentiles(self, ps):
+        """
+        Calcula varios percentiles en una sola pasada por las cubetas.
+
+        Args:
+            ps (Iterable[float]): Percentiles entre 0 y 100
+
+        Returns:
+            list[float]: Valor de cada percentil, en el mismo orden
+        """
+        ps = list(ps)
+        if self.n == 0:
+            return [0.0] * len(ps)
+        # (cuenta acumulada necesaria, posición en el resultado), de menor a mayor
+        objetivos = sorted((max(1, -(-self.n * p // 100)), i) for i, p in enumerate(ps))
+        resultado = [self.maximo] * len(ps)
+        siguiente = 0
+        acumulado = 0
+        for indice, cuenta in enumerate(self.cuentas):
+            if not cuenta:
+                continue
+            acumulado += cuenta
+            while siguiente < len(objetivos) and acumulado >= objetivos[siguiente][0]:
+                valor = self._limite_superior(indice) * self.unidad
+                resultado[objetivos[siguiente][1]] = min(max(valor, self.minimo), self.maximo)
+                siguiente += 1
+            if siguiente == len(objetivos):
+                break
+        return resultado
+
+    def cubetas(self):
+        """
+        Cuentas acumuladas de las cubetas no vacías, como los buckets de un
+        histograma de Prometheus.
+
+        Returns:
+            list[tuple[float, int]]: (límite superior en segundos, registros
+                menores o iguales), en orden creciente. Los saturados no
+                entran en ninguna cubeta: solo cuentan en `n`.
+        """
+        resultado = []
+        acumulado = 0
+        ultima = len(self.cuentas) - 1
+        for indice, cuenta in enumerate(self.cuentas):
+            if indice == ultima:
+                cuenta -= self.saturados
+            if cuenta:
+                acumulado += cuenta
+                # Una cubeta guarda las unidades enteras hasta su límite: los
+                # valores reales son menores que el límite más una unidad
+                resultado.append(((self._limite_superior(indice) + 1) * self.unidad, acumulado))
+        return resultado
+
+    def combinar(self, otro):
+        """
+        Suma a este histograma los registros de otro.
+
+        Args:
+            otro (HistogramaLatencia): Histograma con la misma configuración
+
+        Returns:
+            HistogramaLatencia: Este histograma
+
+        Raises:
+            ValueError: Si las configuraciones no coinciden
+        """
+        if (otro.precision, otro.unidad, otro.valor_max) != (self.precision, self.unidad, self.valor_max):
+            raise ValueError("Solo se pueden combinar histogramas con la misma configuración")
+        if otro.n == 0:
+            return self
+        for indice, cuenta in enumerate(otro.cuentas):
+            if cuenta:
+                self.cuentas[indice] += cuenta
+        self.minimo = otro.minimo if self.n == 0 else min(self.minimo, otro.minimo)
+        self.maximo = max(self.maximo, otro.maximo)
+        self.n += otro.n
+        self.total += otro.total
+        self.saturados += otro.saturados
+        return self
+
+    def resumen(self):
+        """
+        Returns:
+            dict: Cantidad, media, mínimo, máximo y percentiles p50, p90, p99 y p99.9
+        """
+        resumen = {
+            'n': self.n,
+            'media': self.total / self.n if self.n else 0.0,
+            'min': self.minimo,
+            'max': self.maximo
+        }
+        for p, valor in zip(PERCENTILES, self.percentiles(PERCENTILES)):
+            resumen[f"p{p:g}".replace(".", "_")] = valor
+        return resumen
+
+
+class LatenciasPorClase:
+    """
+    Histogramas de tiempo de servicio, espera en cola y latencia extremo a
+    extremo, globales y desglosados por dispositivo, prioridad y tipo.
+
+    Es thread-safe: las latencias extremo a extremo se registran desde el
+    hilo que completa la transferencia.
+
+    Attributes:
+        histogramas (dict): Por métrica, {'total': HistogramaLatencia,
+            dimensión: {valor: HistogramaLatencia}}
+        lock (threading.Lock): Serializa los registros
+    """
+
+    def __init__(self, **configuracion):
+        """
+        Args:
+            **configuracion: Argumentos de HistogramaLatencia para cada histograma
+        """
+        self._configuracion = configuracion
+        self.histogramas = {
+            metrica: {'total': HistogramaLatencia(**configuracion), **{d: {} for d in DIMENSIONES}}
+            for metrica in METRICAS_LATENCIA
+        }
+        self.lock = threading.Lock()
+
+    def registrar(self, metrica, solicitud, valor):
+        """
+        Registra una latencia en el histograma global y en el de cada
+        dimensión de la solicitud.
+
+        Args:
+            metrica (str): "servicio", "espera" o "extremo_a_extremo"
+            solicitud (Solicitud): Solicitud medida
+            valor (float): Latencia en segundos
+        """
+        grupo = self.histogramas[metrica]
+        with self.lock:
+            grupo['total'].registrar(valor)
+            for dimension in DIMENSIONES:
+                clave = getattr(solicitud, dimension)
+                histograma = grupo[dimension].get(clave)
+                if histograma is None:
+                    histograma = grupo[dimension][clave] = HistogramaLatencia(**self._configuracion)
+                histograma.registrar(valor)
+
+    def combinar(self, otro):
+        """
+        Suma a estos histogramas los de otra instancia.
+
+        Args:
+            otro (LatenciasPorClase): Latencias de otra corrida
+
+        Returns:
+            LatenciasPorClase: Esta instancia
+        """
+        with self.lock:
+            for metrica, grupo in otro.histogramas.items():
+                propio = self.histogramas[metrica]
+                propio['total'].combinar(grupo['total'])
+                for dimension in DIMENSIONES:
+                    for clave, histograma in grupo[dimension].items():
+                        if clave not in propio[dimension]:
+                            propio[dimension][clave] = HistogramaLatencia(**self._configuracion)
+                        propio[dimension][clave].combinar(histograma)
+        return self
+
+    def __getstate__(self):
+        # El lock no se puede serializar; se recrea al deserializar
+        estado = self.__dict__.copy()
+        del estado['lock']
+        return estado
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado)
+        self.lock = threading.Lock()
+
+    def resumen(self):
+        """
+        Returns:
+            dict: Por métrica, el resumen global y el de cada valor de cada dimensión
+        """
+        with self.lock:
+            return {
+                metrica: {
+                    'total': grupo['total'].resumen(),
+                    **{
+                        dimension: {clave: grupo[dimension][clave].resumen()
+                                    for clave in sorted(grupo[dimension])}
+                        for dimension in DIMENSIONES
+                    }
+                }
+                for metrica, grupo in self.histogramas.items()
+            }
@@ -0,0 +1,183 @@
+from array import array
+
+# Columnas del historial y su código de tipo (array y NumPy): int64 o float64
+CAMPOS = (
+    ("posicion", "q"),
+    ("movimientos", "q"),
+    ("tiempo_inicio", "d"),
+    ("tiempo_fin", "d"),
+)
+
+
+class HistorialAccesos:
+    """
+    Historial de accesos al disco guardado por columnas.
+
+    Cada acceso ocupa 32 bytes (cuatro columnas `array` de 8 bytes) en lugar
+    de un objeto por acceso. Las columnas duplican su capacidad al llenarse,
+    así que agregar cuesta O(1) amortizado. Con `max_accesos` solo se conservan
+    los últimos accesos: los más antiguos se descartan y, cuando hace falta
+    lugar, los vigentes se copian al principio de columnas nuevas del mismo
+    tamaño en lugar de crecer, con lo que la memoria queda en a lo sumo el
+    doble del límite.
+
+    Registrar no usa NumPy, así que las corridas por consola y por lotes no
+    lo importan. NumPy se importa recién al leer una columna, que se
+    devuelve como vista np.ndarray sin copia, o al exportar. Una vista sigue
+    siendo válida y no cambia después de nuevos registros, pero no los incluye.
+
+    Attributes:
+        max_accesos (int): Accesos conservados (None = todos, 0 = ninguno)
+        total (int): Accesos registrados desde el inicio, incluidos los descartados
+    """
+
+    def __init__(self, max_accesos=None, capacidad_inicial=1024):
+        self.max_accesos = max_accesos
+        capacidad = capacidad_inicial if max_accesos is None else min(capacidad_inicial, max_accesos)
+        self._columnas = {campo: array(tipo, bytes(8 * capacidad)) for campo, tipo in CAMPOS}
+        self._inicio = 0
+        self._fin = 0
+        self.total = 0
+
+    def __len__(self):
+        return self._fin - self._inicio
+
+    @property
+    def capacidad(self):
+        """Filas reservadas en cada columna."""
+        return len(self._columnas["posicion"])
+
+    def _hacer_lugar(self):
+        # Si los vigentes ocupan hasta la mitad basta con moverlos al principio;
+        # si no, duplicar. En ambos casos en columnas nuevas: las vistas ya
+        # entregadas apuntan a las anteriores y no deben cambiar (además
+        # impiden cambiar el tamaño de un array)
+        vigentes = len(self)
+        nueva = self.capacidad
+        if not nueva or vigentes > nueva // 2:
+            nueva = max(1, nueva * 2)
+            if self.max_accesos is not None:
+                nueva = min(nueva, 2 * self.max_accesos)
+        for campo, columna in self._columnas.items():
+            ampliada = array(columna.typecode, bytes(8 * nueva))
+            ampliada[:vigentes] = columna[self._inicio:self._fin]
+            self._columnas[campo] = ampliada
+        self._inicio, self._fin = 0, vigentes
+
+    def agregar(self, posicion, movimientos, tiempo_inicio, tiempo_fin):
+        """
+        Registra un acceso.
+
+        Args:
+            posicion (int): Posición accedida
+            movimientos (int): Movimientos del cabezal
+            tiempo_inicio (float): Timestamp del inicio de la operación
+            tiempo_fin (float): Timestamp de finalización de la operación
+        """
+        self.total += 1
+        if self.max_accesos == 0:
+            return
+        if self._fin == self.capacidad:
+            self._hacer_lugar()
+        i = self._fin
+        columnas = self._columnas
+        columnas["posicion"][i] = posicion
+        columnas["movimientos"][i] = movimientos
+        columnas["tiempo_inicio"][i] = tiempo_inicio
+        columnas["tiempo_fin"][i] = tiempo_fin
+        self._fin += 1
+        if self.max_accesos is not None and len(self) > self.max_accesos:
+            self._inicio += 1  # Descartar el más antiguo
+
+    def columna(self, campo):
+        """
+        Args:
+            campo (str): Nombre de la columna (ver CAMPOS)
+
+        Returns:
+            np.ndarray: Vista de la columna, del acceso más antiguo al más reciente
+        """
+        import numpy as np
+
+        columna = self._columnas[campo]
+        if not len(columna):
+            return np.empty(0, dtype=columna.typecode)
+        return np.frombuffer(columna, dtype=columna.typecode)[self._inicio:self._fin]
+
+    def valores(self, campo):
+        """
+        Args:
+            campo (str): Nombre de la columna (ver CAMPOS)
+
+        Returns:
+            list: Copia de la columna como lista, sin importar NumPy
+        """
+        return self._columnas[campo][self._inicio:self._fin].tolist()
+
+    @property
+    def posicion(self):
+        """Vista de las posiciones accedidas."""
+        return self.columna("posicion")
+
+    @property
+    def movimientos(self):
+        """Vista de los movimientos del cabezal de cada acceso."""
+        return self.columna("movimientos")
+
+    @property
+    def tiempo_inicio(self):
+        """Vista de los timestamps de inicio."""
+        return self.columna("tiempo_inicio")
+
+    @property
+    def tiempo_fin(self):
+        """Vista de los timestamps de fin."""
+        return self.columna("tiempo_fin")
+
+    @property
+    def tiempo_proceso(self):
+        """Tiempo de proceso de cada acceso (arreglo nuevo)."""
+        return self.tiempo_fin - self.tiempo_inicio
+
+    @property
+    def nbytes(self):
+        """Memoria reservada por las columnas, en bytes."""
+        return sum(len(columna) * columna.itemsize for columna in self._columnas.values())
+
+    def a_estructurado(self):
+        """
+        Returns:
+            np.ndarray: Copia del historial como arreglo estructurado, un
+                campo por columna
+        """
+        import numpy as np
+
+        datos = np.empty(len(self), dtype=list(CAMPOS))
+        for campo, _ in CAMPOS:
+            datos[campo] = self.columna(campo)
+        return datos
+
+    def exportar_npy(self, ruta):
+        """
+        Guarda el historial en un archivo .npy como arreglo estructurado.
+        Se lee con np.load(ruta).
+
+        Args:
+            ruta (str): Archivo de destino
+        """
+        import numpy as np
+
+        np.save(ruta, self.a_estructurado())
+
+    def exportar_csv(self, ruta):
+        """
+        Guarda el historial en CSV con una fila de encabezado.
+
+        Args:
+            ruta (str): Archivo de destino
+        """
+        import numpy as np
+
+        np.savetxt(ruta, np.column_stack([self.columna(campo) for campo, _ in CAMPOS]),
+                   fmt=("%d", "%d", "%.9f", "%.9f"), delimiter=",",
+                   header=",".join(campo for campo, _ in CAMPOS), comments="")
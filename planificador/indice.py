@@ -0,0 +1,183 @@
+from bisect import bisect_left, insort
+from collections import Counter
+from itertools import count
+
+
+class IndiceSolicitudes:
+    """
+    Índice de solicitudes pendientes ordenado por posición en el disco.
+
+    Mantiene una lista ordenada de claves (posicion, secuencia) respaldada por
+    bisect, de modo que las búsquedas de "siguiente solicitud a partir del
+    cabezal" y "siguiente solicitud por debajo del cabezal" cuestan O(log n).
+    La secuencia es un contador de llegada que preserva el orden de inserción,
+    lo que permite desempatar igual que lo hacía la lista original.
+
+    Además agrupa las solicitudes por posición y, dentro de cada posición, por
+    prioridad; las posiciones distintas se reparten en cubetas de
+    `ancho_cubeta` sectores. Así una búsqueda que puntúa por posición y
+    prioridad (como el SSTF del planificador) recorre posiciones distintas en
+    lugar de solicitudes, y puede descartar cubetas enteras.
+
+    Attributes:
+        claves (list): Claves (posicion, secuencia) ordenadas
+        entradas (dict): Solicitudes por secuencia, en orden de llegada
+        secuencias (dict): Secuencia y prioridad de indexado por id_solicitud
+        prioridades (Counter): Conteo de solicitudes pendientes por prioridad
+        ancho_cubeta (int): Sectores por cubeta
+        grupos (dict): Por posición, listas ordenadas de secuencias por prioridad
+        cubetas (dict): Posiciones pendientes ordenadas, por cubeta
+    """
+
+    def __init__(self, solicitudes=None, ancho_cubeta=16):
+        """
+        Inicializa el índice.
+
+        Args:
+            solicitudes (iterable, optional): Solicitudes iniciales. Defaults to None.
+            ancho_cubeta (int, optional): Sectores por cubeta. Defaults to 16.
+        """
+        self.claves = []
+        self.entradas = {}
+        self.secuencias = {}
+        self.prioridades = Counter()
+        self.ancho_cubeta = ancho_cubeta
+        self.grupos = {}
+        self.cubetas = {}
+        self._contador = count()
+        for solicitud in solicitudes or []:
+            self.agregar(solicitud)
+
+    def __len__(self):
+        return len(self.entradas)
+
+    def __bool__(self):
+        return bool(self.entradas)
+
+    def __iter__(self):
+        """Itera las solicitudes pendientes en orden de llegada, sin copiarlas."""
+        return iter(self.entradas.values())
+
+    def __contains__(self, solicitud):
+        return solicitud.id_solicitud in self.secuencias
+
+    def agregar(self, solicitud):
+        """
+        Inserta una solicitud en el índice.
+
+        Args:
+            solicitud (Solicitud): Solicitud a indexar
+        """
+        secuencia = next(self._contador)
+        posicion = solicitud.posicion
+        insort(self.claves, (posicion, secuencia))
+        self.entradas[secuencia] = solicitud
+        self.secuencias[solicitud.id_solicitud] = (secuencia, solicitud.prioridad)
+        self.prioridades[solicitud.prioridad] += 1
+
+        grupo = self.grupos.get(posicion)
+        if grupo is None:
+            grupo = self.grupos[posicion] = {}
+            insort(self.cubetas.setdefault(self.cubeta(posicion), []), posicion)
+        # Las secuencias crecen, así que agregar al final mantiene el orden
+        grupo.setdefault(solicitud.prioridad, []).append(secuencia)
+
+    def eliminar(self, solicitud):
+        """
+        Elimina una solicitud del índice.
+
+        Args:
+            solicitud (Solicitud): Solicitud a eliminar
+
+        Raises:
+            ValueError: Si la solicitud no está en el índice
+        """
+        registro = self.secuencias.pop(solicitud.id_solicitud, None)
+        if registro is None:
+            raise ValueError(f"Solicitud no indexada: {solicitud}")
+        secuencia, prioridad = registro
+        posicion = solicitud.posicion
+        i = bisect_left(self.claves, (posicion, secuencia))
+        del self.claves[i]
+        del self.entradas[secuencia]
+        self.prioridades[prioridad] -= 1
+        if self.prioridades[prioridad] <= 0:
+            del self.prioridades[prioridad]
+
+        grupo = self.grupos[posicion]
+        pendientes = grupo[prioridad]
+        del pendientes[bisect_left(pendientes, secuencia)]
+        if not pendientes:
+            del grupo[prioridad]
+            if not grupo:
+                del self.grupos[posicion]
+                cubeta = self.cubeta(posicion)
+                posiciones = self.cubetas[cubeta]
+                del posiciones[bisect_left(posiciones, posicion)]
+                if not posiciones:
+                    del self.cubetas[cubeta]
+
+    def secuencia(self, solicitud):
+        """Devuelve la secuencia de llegada de una solicitud indexada."""
+        return self.secuencias[solicitud.id_solicitud][0]
+
+    def max_prioridad(self):
+        """Devuelve la mayor prioridad presente en el índice (0 si está vacío)."""
+        return max(self.prioridades) if self.prioridades else 0
+
+    def _primera_en(self, i):
+        # Dentro de una misma posición, la de menor secuencia (la más antigua)
+        posicion = self.claves[i][0]
+        return self.entradas[self.claves[bisect_left(self.claves, (posicion,))][1]]
+
+    def siguiente_desde(self, posicion):
+        """
+        Busca la solicitud más cercana con posición mayor o igual a la dada.
+
+        Args:
+            posicion (int): Posición de referencia
+
+        Returns:
+            Solicitud: Solicitud encontrada, o None si no hay ninguna
+        """
+        i = bisect_left(self.claves, (posicion,))
+        if i == len(self.claves):
+            return None
+        return self.entradas[self.claves[i][1]]
+
+    def anterior_a(self, posicion):
+        """
+        Busca la solicitud más cercana con posición estrictamente menor a la dada.
+
+        Args:
+            posicion (int): Posición de referencia
+
+        Returns:
+            Solicitud: Solicitud encontrada, o None si no hay ninguna
+        """
+        i = bisect_left(self.claves, (posicion,))
+        if i == 0:
+            return None
+        return self._primera_en(i - 1)
+
+    def primera(self):
+        """Devuelve la solicitud de menor posición, o None si el índice está vacío."""
+        return self.entradas[self.claves[0][1]] if self.claves else None
+
+    def cubeta(self, posicion):
+        """Devuelve la cubeta a la que pertenece una posición."""
+        return posicion // self.ancho_cubeta
+
+    def mas_antiguas_en(self, posicion):
+        """
+        Obtiene, para cada prioridad pendiente en una posición, su solicitud más
+        antigua.
+
+        Args:
+            posicion (int): Posición con solicitudes pendientes
+
+        Yields:
+            tuple: (secuencia, solicitud)
+        """
+        for pendientes in self.grupos[posicion].values():
+            yield pendientes[0], self.entradas[pendientes[0]]
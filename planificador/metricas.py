@@ -1,62 +1,136 @@
-import time
-from dataclasses import dataclass
-from typing import List
+import math
+from collections import Counter
 
-@dataclass
-class MetricaAcceso:
+from planificador.histograma import LatenciasPorClase
+from planificador.historial import HistorialAccesos
+from reloj.reloj import RelojReal
+
+
+class Acumulador:
     """
-    Estructura de datos para almacenar información detallada de cada acceso al disco.
-    
-    Esta clase utiliza @dataclass para proporcionar una estructura eficiente
-    para el almacenamiento y manejo de métricas individuales de acceso.
-    
+    Resumen en línea de una serie de valores: cantidad, total, mínimo,
+    máximo, media y varianza (algoritmo de Welford), sin guardar los valores.
+
+    Cada registro y cada consulta cuestan O(1).
+
     Attributes:
-        posicion (int): Posición en el disco donde se realizó el acceso
-        movimientos (int): Cantidad de movimientos del cabezal realizados
-        tiempo_inicio (float): Timestamp del inicio de la operación
-        tiempo_fin (float): Timestamp de finalización de la operación
+        n (int): Valores registrados
+        total (float): Suma de los valores
+        minimo (float): Menor valor (0 sin valores)
+        maximo (float): Mayor valor (0 sin valores)
+        media (float): Media de los valores
     """
-    posicion: int
-    movimientos: int
-    tiempo_inicio: float
-    tiempo_fin: float
 
-    @property
-    def tiempo_proceso(self):
+    __slots__ = ("n", "total", "minimo", "maximo", "media", "_m2")
+
+    def __init__(self):
+        self.n = 0
+        self.total = 0.0
+        self.minimo = 0.0
+        self.maximo = 0.0
+        self.media = 0.0
+        self._m2 = 0.0  # Suma de cuadrados de las desviaciones a la media
+
+    def registrar(self, valor):
         """
-        Calcula el tiempo total de proceso para este acceso.
-        
-        Returns:
-            float: Tiempo total en segundos que tomó el acceso
+        Agrega un valor a la serie.
+
+        Args:
+            valor (float): Valor observado
         """
-        return self.tiempo_fin - self.tiempo_inicio
+        self.n += 1
+        self.total += valor
+        if self.n == 1 or valor < self.minimo:
+            self.minimo = valor
+        if self.n == 1 or valor > self.maximo:
+            self.maximo = valor
+        delta = valor - self.media
+        self.media += delta / self.n
+        self._m2 += delta * (valor - self.media)
+
+    @property
+    def varianza(self):
+        """Varianza muestral (0 con menos de dos valores)."""
+        return self._m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def desviacion(self):
+        """Desviación estándar muestral."""
+        return math.sqrt(self.varianza)
+
 
 class Metricas:
     """
     Sistema de medición y análisis de rendimiento para el planificador de disco.
     
-    Esta clase mantiene un registro detallado de todas las operaciones realizadas,
-    incluyendo tiempos, movimientos y estadísticas de rendimiento.
+    Los resúmenes (tiempo total, promedio, mínimo, máximo, desviación,
+    movimientos y accesos por sector) se mantienen con acumuladores que se
+    actualizan al registrar cada búsqueda, así que consultarlos cuesta O(1)
+    sin importar cuántas solicitudes se procesaron. El detalle de cada acceso
+    solo se conserva para los últimos `max_historial` accesos.
     
     Attributes:
         movimientos_cabezal (int): Total de movimientos realizados por el cabezal
         solicitudes_procesadas (int): Número total de solicitudes completadas
         tiempo_inicio_global (float): Timestamp del inicio de la medición
-        tiempos_por_solicitud (list): Lista de tiempos de proceso por solicitud
-        historial_accesos (list): Lista detallada de todos los accesos realizados
+        tiempos (Acumulador): Resumen de los tiempos de proceso por solicitud
+        ultimo_tiempo (float): Tiempo de proceso de la última solicitud
+        ultimo_fin (float): Timestamp de fin del último acceso, o None
+        accesos_por_sector (Counter): Accesos registrados de cada sector
+        latencias (LatenciasPorClase): Histogramas de servicio, espera y latencia
+            extremo a extremo por dispositivo, prioridad y tipo
+        historial_accesos (HistorialAccesos): Últimos accesos en detalle, por columnas
+        max_historial (int): Accesos que conserva el historial (0 lo desactiva,
+            None lo deja sin límite)
         acceso_actual (dict): Información del acceso en proceso actual
+        tiempo_espera_total (float): Suma de esperas en cola de las solicitudes despachadas
+        tiempo_espera_max (float): Mayor espera en cola observada
+        profundidad_total (int): Suma de la profundidad de cola en cada despacho
+        profundidad_max (int): Mayor profundidad de cola observada
+        esperas_registradas (int): Número de despachos con espera registrada
+        reloj (RelojReal | RelojVirtual): Fuente de timestamps (real o simulada)
     """
-    def __init__(self):
+    def __init__(self, reloj=None, max_historial=1000):
         """
         Inicializa el sistema de métricas con valores por defecto.
+
+        Args:
+            reloj (RelojReal | RelojVirtual, optional): Reloj a utilizar.
+                Defaults to RelojReal().
+            max_historial (int, optional): Accesos a conservar en detalle; 0 no
+                guarda ninguno y None los guarda todos. Defaults to 1000.
         """
+        self.reloj = reloj or RelojReal()
         self.movimientos_cabezal = 0  # Contador de movimientos totales
         self.solicitudes_procesadas = 0  # Contador de solicitudes procesadas
-        self.tiempo_inicio_global = time.time()  # Marca de tiempo inicial
-        self.tiempos_por_solicitud = []  # Registro de tiempos individuales
-        self.historial_accesos: List[MetricaAcceso] = []  # Historial completo
+        self.tiempo_inicio_global = self.reloj.ahora()  # Marca de tiempo inicial
+        self.tiempos = Acumulador()  # Resumen de tiempos de proceso
+        self.ultimo_tiempo = 0.0
+        self.ultimo_fin = None
+        self.accesos_por_sector = Counter()
+        self.latencias = LatenciasPorClase()
+        self.max_historial = max_historial
+        self.historial_accesos = HistorialAccesos(max_historial)  # Últimos accesos
         self.acceso_actual = None  # Acceso en proceso
 
+        # Espera en cola y profundidad de cola (acumuladores)
+        self.tiempo_espera_total = 0.0
+        self.tiempo_espera_max = 0.0
+        self.profundidad_total = 0
+        self.profundidad_max = 0
+        self.esperas_registradas = 0
+
+    def sectores_mas_accedidos(self, n=5):
+        """
+        Args:
+            n (int, optional): Número de sectores. Defaults to 5.
+
+        Returns:
+            list[tuple]: (sector, accesos) de los n sectores más accedidos,
+                desempatando por sector
+        """
+        return sorted(self.accesos_por_sector.items(), key=lambda x: (-x[1], x[0]))[:n]
+
     def iniciar_solicitud(self):
         """
         Marca el inicio de una nueva solicitud.
@@ -65,72 +139,99 @@ class Metricas:
         del tiempo de proceso de la solicitud actual.
         """
         self.acceso_actual = {
-            'tiempo_inicio': time.time()
+            'tiempo_inicio': self.reloj.ahora()
         }
 
     def registrar_busqueda(self, movimientos: int, posicion: int):
         """
         Registra una operación de búsqueda completada.
         
-        Almacena toda la información relevante de la operación,
-        incluyendo tiempo, movimientos y posición.
+        Actualiza los acumuladores y, si el historial está activo, guarda
+        el detalle del acceso.
         
         Args:
             movimientos (int): Cantidad de movimientos realizados
             posicion (int): Posición final del cabezal
         """
-        tiempo_fin = time.time()
+        tiempo_fin = self.reloj.ahora()
         
         if not self.acceso_actual:
             self.acceso_actual = {'tiempo_inicio': self.tiempo_inicio_global}
 
-        # Crear registro detallado del acceso
-        acceso = MetricaAcceso(
-            posicion=posicion,
-            movimientos=movimientos,
-            tiempo_inicio=self.acceso_actual['tiempo_inicio'],
-            tiempo_fin=tiempo_fin
-        )
+        tiempo_inicio = self.acceso_actual['tiempo_inicio']
 
-        # Actualizar contadores y registros
+        # Actualizar contadores y acumuladores
         self.movimientos_cabezal += movimientos
         self.solicitudes_procesadas += 1
-        self.tiempos_por_solicitud.append(acceso.tiempo_proceso)
-        self.historial_accesos.append(acceso)
+        self.ultimo_tiempo = tiempo_fin - tiempo_inicio
+        self.ultimo_fin = tiempo_fin
+        self.tiempos.registrar(self.ultimo_tiempo)
+        self.accesos_por_sector[posicion] += 1
+        self.historial_accesos.agregar(posicion, movimientos, tiempo_inicio, tiempo_fin)
         self.acceso_actual = None
 
+    @property
+    def tiempos_por_solicitud(self):
+        """Tiempos de proceso de los accesos del historial (list), del más antiguo al más reciente."""
+        historial = self.historial_accesos
+        return [fin - inicio for inicio, fin in zip(historial.valores("tiempo_inicio"),
+                                                     historial.valores("tiempo_fin"))]
+
+    def registrar_latencia(self, metrica: str, solicitud, valor: float):
+        """
+        Registra una latencia de una solicitud en los histogramas.
+
+        Args:
+            metrica (str): "servicio", "espera" o "extremo_a_extremo"
+            solicitud (Solicitud): Solicitud medida
+            valor (float): Latencia en segundos
+        """
+        self.latencias.registrar(metrica, solicitud, valor)
+
+    def registrar_espera(self, espera: float, profundidad: int):
+        """
+        Registra la espera en cola de una solicitud al despacharla.
+
+        Args:
+            espera (float): Tiempo desde la llegada hasta el despacho
+            profundidad (int): Solicitudes pendientes en el momento del despacho
+        """
+        self.tiempo_espera_total += espera
+        self.tiempo_espera_max = max(self.tiempo_espera_max, espera)
+        self.profundidad_total += profundidad
+        self.profundidad_max = max(self.profundidad_max, profundidad)
+        self.esperas_registradas += 1
+
     def obtener_estadisticas_detalladas(self):
         """
-        Genera un reporte completo de estadísticas de rendimiento.
+        Genera un reporte completo de estadísticas de rendimiento en O(1).
         
         Returns:
             dict: Diccionario con todas las métricas relevantes incluyendo:
-                - Tiempos totales y promedios
+                - Tiempos totales, promedio, mínimo, máximo y desviación estándar
                 - Movimientos totales y promedios
                 - Estadísticas de solicitudes procesadas
+                - Espera y profundidad de cola promedio y máxima
         """
-        if not self.historial_accesos:
-            return {
-                'tiempo_total': 0,
-                'tiempo_promedio': 0,
-                'tiempo_min': 0,
-                'tiempo_max': 0,
-                'movimientos_totales': 0,
-                'movimientos_promedio': 0,
-                'solicitudes_procesadas': 0
-            }
-
-        tiempos_proceso = [acc.tiempo_proceso for acc in self.historial_accesos]
-        tiempo_total = self.historial_accesos[-1].tiempo_fin - self.tiempo_inicio_global
+        n_esperas = self.esperas_registradas
+        cola = {
+            'espera_promedio': self.tiempo_espera_total / n_esperas if n_esperas else 0,
+            'espera_max': self.tiempo_espera_max,
+            'profundidad_promedio': self.profundidad_total / n_esperas if n_esperas else 0,
+            'profundidad_max': self.profundidad_max
+        }
 
+        procesadas = self.solicitudes_procesadas
         return {
-            'tiempo_total': tiempo_total,
-            'tiempo_promedio': sum(tiempos_proceso) / len(tiempos_proceso),
-            'tiempo_min': min(tiempos_proceso),
-            'tiempo_max': max(tiempos_proceso),
+            'tiempo_total': self.obtener_tiempo_total(),
+            'tiempo_promedio': self.tiempos.media,
+            'tiempo_min': self.tiempos.minimo,
+            'tiempo_max': self.tiempos.maximo,
+            'tiempo_desviacion': self.tiempos.desviacion,
             'movimientos_totales': self.movimientos_cabezal,
-            'movimientos_promedio': self.movimientos_cabezal / self.solicitudes_procesadas,
-            'solicitudes_procesadas': self.solicitudes_procesadas
+            'movimientos_promedio': self.movimientos_cabezal / procesadas if procesadas else 0,
+            'solicitudes_procesadas': procesadas,
+            **cola
         }
 
     def calcular_tiempo_promedio(self):
@@ -140,9 +241,7 @@ class Metricas:
         Returns:
             float: Tiempo promedio en segundos, o 0 si no hay solicitudes
         """
-        if not self.tiempos_por_solicitud:
-            return 0
-        return sum(self.tiempos_por_solicitud) / len(self.tiempos_por_solicitud)
+        return self.tiempos.media
 
     def obtener_tiempo_total(self):
         """
@@ -151,6 +250,6 @@ class Metricas:
         Returns:
             float: Tiempo total en segundos desde el inicio de la medición
         """
-        if not self.historial_accesos:
+        if self.ultimo_fin is None:
             return 0
-        return self.historial_accesos[-1].tiempo_fin - self.tiempo_inicio_global
\ No newline at end of file
+        return self.ultimo_fin - self.tiempo_inicio_global
\ No newline at end of file
@@ -34,7 +34,7 @@ class MetricVisualizer:
         
         Args:
             metricas (dict): Diccionario con métricas generales del sistema
-            historial_accesos (list): Lista de accesos con timestamps y posiciones
+            historial_accesos (HistorialAccesos): Historial por columnas de Metricas
         
         Returns:
             Figure: Objeto Figure con los gráficos generados
@@ -49,8 +49,8 @@ class MetricVisualizer:
         ax3 = self.figure.add_subplot(grid[1, :])
        
         # 1. Gráfico de movimientos del cabezal
-        tiempos = [acc['tiempo'] for acc in historial_accesos]
-        posiciones = [acc['posicion'] for acc in historial_accesos]
+        tiempos = historial_accesos.tiempo_fin
+        posiciones = historial_accesos.posicion
         ax1.plot(tiempos, posiciones, 'b-', label='Posición del cabezal')
         ax1.set_title('Movimiento del Cabezal vs Tiempo')
         ax1.set_xlabel('Tiempo (s)')
@@ -64,8 +64,8 @@ class MetricVisualizer:
         ax2.set_ylabel('Frecuencia')
        
         # 3. Gráfico de rendimiento temporal acumulado
-        movimientos = [acc['movimientos'] for acc in historial_accesos]
-        tiempos_normalizados = [(t - tiempos[0]) for t in tiempos]
+        movimientos = historial_accesos.movimientos
+        tiempos_normalizados = tiempos - tiempos[0] if len(tiempos) else tiempos
         ax3.plot(tiempos_normalizados, np.cumsum(movimientos), 
                 'r-', label='Movimientos acumulados')
         ax3.set_title('Rendimiento Temporal')
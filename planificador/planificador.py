@@ -1,7 +1,10 @@
-from collections import Counter, defaultdict
+from collections import deque
+import queue
+from planificador.envejecimiento import ColaEnvejecimiento
+from planificador.frecuencia import FrecuenciaAccesos
+from planificador.indice import IndiceSolicitudes
 from planificador.metricas import Metricas
-from planificador.metricasView import MetricVisualizer
-import time
+from reloj.reloj import RelojReal
 
 class PlanificadorDisco:
 
@@ -13,8 +16,11 @@ class PlanificadorDisco:
     y ejecución de solicitudes según diferentes estrategias de optimización.
 
     Attributes:
-        solicitudes (list): Cola de solicitudes pendientes
-        tamano_buffer (int): Tamaño del buffer de solicitudes
+        solicitudes (list): Copia de las solicitudes pendientes (ver `pendientes`)
+        indice (IndiceSolicitudes): Índice de solicitudes pendientes ordenado por posición
+        cola_fifo (ColaEnvejecimiento): Cola FIFO con envejecimiento (solo algoritmo FIFO)
+        tamano_buffer (int): Tamaño del buffer de solicitudes. En modo flujo es la
+            ventana de admisión: máximo de solicitudes pendientes a la vez
         algoritmo (str): Algoritmo de planificación seleccionado
         metricas (Metricas): Sistema de métricas y estadísticas
         posicion_actual (int): Posición actual del cabezal
@@ -23,12 +29,21 @@ class PlanificadorDisco:
         is_running (bool): Estado de ejecución del planificador
         interfaz (InterfazSimulador): Referencia a la interfaz gráfica
         dma (DMA): Sistema de Acceso Directo a Memoria
-        patron_accesos (defaultdict): Registro de patrones de acceso
-        predictor_accesos (defaultdict): Sistema de predicción de accesos
-        inicio_espera (dict): Registro de tiempos de espera de solicitudes
+        patron_accesos (FrecuenciaAccesos): Frecuencia de acceso por sector, acotada
+            en memoria. Su total acumulado por sector actúa como predictor de accesos.
+        reloj (RelojReal | RelojVirtual): Reloj de la simulación
+        fuente (iterable | queue.Queue): Fuente de llegadas para el modo flujo
+        silencioso (bool): Si es True no se escriben los logs en la consola
+        max_en_vuelo (int): Máximo de transferencias del DMA sin completar; al
+            alcanzarlo el planificador espera a que termine alguna (None = sin límite)
+        en_vuelo (deque): Futures de las transferencias sin completar
+        tiempo_espera_dma (float): Tiempo total bloqueado esperando transferencias
+        grabador (GrabadorTraza): Grabador de llegadas y despachos, o None
     """
 
-    def __init__(self, solicitudes=None, tamano_buffer=10, algoritmo="FIFO", interfaz=None, dma=None):
+    def __init__(self, solicitudes=None, tamano_buffer=10, algoritmo="FIFO", interfaz=None, dma=None,
+                 reloj=None, fuente=None, silencioso=False, max_en_vuelo=None, max_historial=1000,
+                 grabador=None):
 
         """
         Inicializa el planificador de disco.
@@ -39,16 +54,31 @@ class PlanificadorDisco:
             algoritmo (str, optional): Algoritmo a utilizar. Defaults to "FIFO".
             interfaz (InterfazSimulador, optional): Referencia a la UI. Defaults to None.
             dma (DMA, optional): Sistema DMA. Defaults to None.
+            reloj (RelojReal | RelojVirtual, optional): Reloj de la simulación. Con un
+                RelojVirtual las esperas avanzan el tiempo simulado al instante.
+                Defaults to el reloj del DMA o RelojReal().
+            fuente (iterable | queue.Queue, optional): Llegadas (instante, solicitud) para
+                un sistema abierto, con el instante en segundos desde el inicio de
+                `ejecutar` (None = llega al recibirse). En una cola, None marca el fin.
+                Defaults to None.
+            silencioso (bool, optional): No escribir logs en la consola. Defaults to False.
+            max_en_vuelo (int, optional): Transferencias del DMA en vuelo a la vez. La
+                búsqueda de la siguiente solicitud se solapa con ellas. Defaults to None
+                (sin límite).
+            max_historial (int, optional): Accesos que las métricas guardan en detalle
+                (0 = ninguno, None = todos). Defaults to 1000.
+            grabador (GrabadorTraza, optional): Graba la corrida para reproducirla
+                con FuenteTraza. Defaults to None.
 
         Raises:
             ValueError: Si se especifica un algoritmo no soportado
         """
 
 
-        self.solicitudes = solicitudes or []
+        self.reloj = reloj or (dma.reloj if dma else None) or RelojReal()
         self.tamano_buffer = tamano_buffer
         self.algoritmo = algoritmo
-        self.metricas = Metricas()
+        self.metricas = Metricas(self.reloj, max_historial)
         self.posicion_actual = 0
         self.direccion = 1  # 1: hacia arriba, -1: hacia abajo
         self.max_posicion = 100
@@ -57,16 +87,76 @@ class PlanificadorDisco:
         self.dma = dma
 
         # Mejoras para predicción y envejecimiento
-        self.patron_accesos = defaultdict(list)  # Para SSTF mejorado
-        self.predictor_accesos = defaultdict(int)  # Para predicción de movimientos
+        self.patron_accesos = FrecuenciaAccesos()  # Para SSTF mejorado y predicción
+        self.max_prediccion = {}  # Mayor predictor alcanzado por cubeta del índice, acota el SSTF
         self.tiempo_envejecimiento = 5.0  # Segundos antes de aumentar prioridad
         self.tiempos_ultimo_acceso = {}  # Para envejecimiento FIFO
         self.prediccion_cache = {}  # Cache de predicciones
-        self.inicio_espera = {}  # Para tracking de tiempo de espera
+        self.solicitudes = solicitudes  # Construye el índice y la cola FIFO
+        self.fuente = fuente
+        self.silencioso = silencioso
+        self._fuente_agotada = False
+        self.max_en_vuelo = max_en_vuelo
+        self.en_vuelo = deque()
+        self.tiempo_espera_dma = 0.0
+        self.grabador = grabador
+        self._inicio = self.reloj.ahora()  # Origen de los instantes de la traza
         
         if self.algoritmo not in ["FIFO", "SSTF", "SCAN", "C-SCAN"]:
             raise ValueError(f"Algoritmo desconocido: {self.algoritmo}")
 
+    @property
+    def solicitudes(self):
+        """
+        Copia de las solicitudes pendientes en orden de llegada.
+
+        Cuesta O(n) en cada acceso: para contarlas use `pendientes` y para
+        recorrerlas sin copiar, `iterar_pendientes()`.
+        """
+        return list(self.indice)
+
+    @property
+    def pendientes(self):
+        """Número de solicitudes pendientes, en O(1)."""
+        return len(self.indice)
+
+    def iterar_pendientes(self):
+        """
+        Recorre las solicitudes pendientes en orden de llegada sin copiarlas.
+
+        El planificador no debe despachar ni admitir solicitudes mientras dure
+        el recorrido.
+
+        Yields:
+            Solicitud: Solicitudes pendientes
+        """
+        return iter(self.indice)
+
+    @solicitudes.setter
+    def solicitudes(self, solicitudes):
+        self.indice = IndiceSolicitudes()
+        self.cola_fifo = (ColaEnvejecimiento(self.tiempo_envejecimiento)
+                          if self.algoritmo == "FIFO" else None)
+        for solicitud in solicitudes or []:
+            self.agregar_solicitud(solicitud)
+
+    def agregar_solicitud(self, solicitud, llegada=None):
+        """
+        Admite una nueva solicitud pendiente.
+
+        Args:
+            solicitud (Solicitud): Solicitud a planificar
+            llegada (float, optional): Instante de llegada; la espera se mide desde
+                aquí. Defaults to `solicitud.llegada` si ya la trae, o el instante actual.
+        """
+        if llegada is not None:
+            solicitud.llegada = llegada
+        elif solicitud.llegada is None:
+            solicitud.llegada = self.reloj.ahora()
+        self.indice.agregar(solicitud)
+        if self.cola_fifo is not None:
+            self.cola_fifo.agregar(solicitud)
+
     def sstf_optimizado(self, posicion_actual):
         """
         Implementa el algoritmo SSTF (Shortest Seek Time First) optimizado.
@@ -81,28 +171,17 @@ class PlanificadorDisco:
             Solicitud: Siguiente solicitud a procesar, o None si no hay solicitudes
         """
 
-        if not self.solicitudes:
+        if not self.indice:
             return None
 
-        tiempo_actual = time.time()
-        
-        # Actualizar predicciones basadas en patrones históricos
-        for solicitud in self.solicitudes:
-            sector = solicitud.posicion
-            if sector in self.patron_accesos:
-                # Calcular la probabilidad de acceso basada en el historial
-                accesos_recientes = [acc for acc in self.patron_accesos[sector] 
-                                   if tiempo_actual - acc < 60]  # Últimos 60 segundos
-                frecuencia = len(accesos_recientes)
-            else:
-                frecuencia = 0
+        tiempo_actual = self.reloj.ahora()
 
         def calcular_puntuacion(solicitud):
             distancia = abs(solicitud.posicion - posicion_actual)
-            espera = tiempo_actual - self.inicio_espera.get(id(solicitud), tiempo_actual)
-            prediccion = self.predictor_accesos[solicitud.posicion]
-            frecuencia = len([acc for acc in self.patron_accesos[solicitud.posicion] 
-                            if tiempo_actual - acc < 60])
+            espera = tiempo_actual - solicitud.llegada
+            prediccion = self.patron_accesos.total(solicitud.posicion)
+            # Accesos en los últimos 60 segundos
+            frecuencia = self.patron_accesos.frecuencia(solicitud.posicion, tiempo_actual)
             
             # Puntuación combinada de todos los factores
             return (
@@ -113,12 +192,47 @@ class PlanificadorDisco:
                 min(espera * 2, 20)         # Tiempo de espera (máximo 20 puntos)
             )
 
-        solicitud = max(self.solicitudes, key=calcular_puntuacion)
-        self.solicitudes.remove(solicitud)
+        # Cota superior de la puntuación: la frecuencia nunca supera al predictor
+        # del sector, así que ambos suman a lo sumo 7 * predictor, y la espera
+        # aporta como mucho 20. Por cubeta se usa el mayor predictor que alcanzó
+        # alguno de sus sectores y la distancia a su posición pendiente más cercana.
+        # Se revisan las cubetas de mayor a menor cota y se corta cuando ni la cota
+        # puede superar a la mejor encontrada; así el coste depende del número de
+        # posiciones distintas cercanas, no del de solicitudes pendientes.
+        base = self.indice.max_prioridad() * 10 + 20
+        cubetas = []
+        for cubeta, posiciones in self.indice.cubetas.items():
+            distancia = max(posiciones[0] - posicion_actual, posicion_actual - posiciones[-1], 0)
+            cubetas.append((base + self.max_prediccion.get(cubeta, 0) * 7 - distancia, cubeta))
+        cubetas.sort(reverse=True)
+
+        solicitud = None
+        mejor = (None, None)
+        for cota, cubeta in cubetas:
+            if solicitud is not None and cota < mejor[0]:
+                break
+            for posicion in self.indice.cubetas[cubeta]:
+                if solicitud is not None:
+                    cota = (max(self.indice.grupos[posicion]) * 10 + 20 +
+                            self.patron_accesos.total(posicion) * 7 - abs(posicion - posicion_actual))
+                    if cota < mejor[0]:
+                        continue
+                # En una posición, a igual prioridad puntúa más la que más espera
+                # (la más antigua, pues las llegadas se admiten en orden)
+                for secuencia, candidata in self.indice.mas_antiguas_en(posicion):
+                    puntuacion = calcular_puntuacion(candidata)
+                    # Empates: gana la más antigua, igual que max() sobre la lista
+                    if solicitud is None or puntuacion > mejor[0] or (
+                            puntuacion == mejor[0] and secuencia < mejor[1]):
+                        solicitud = candidata
+                        mejor = (puntuacion, secuencia)
+        self.indice.eliminar(solicitud)
         
         # Registrar acceso para futuros patrones
-        self.patron_accesos[solicitud.posicion].append(tiempo_actual)
-        self.predictor_accesos[solicitud.posicion] += 1
+        self.patron_accesos.registrar(solicitud.posicion, tiempo_actual)
+        cubeta = self.indice.cubeta(solicitud.posicion)
+        self.max_prediccion[cubeta] = max(self.max_prediccion.get(cubeta, 0),
+                                          self.patron_accesos.total(solicitud.posicion))
         
         return solicitud
 
@@ -137,40 +251,25 @@ class PlanificadorDisco:
             Solicitud: Siguiente solicitud a procesar, o None si no hay solicitudes
         """
 
-        if not self.solicitudes:
+        if not self.indice:
             return None
         
-        # Dividir solicitudes según posición actual y dirección
-        solicitudes_adelante = [s for s in self.solicitudes if s.posicion >= posicion_actual]
-        solicitudes_atras = [s for s in self.solicitudes if s.posicion < posicion_actual]
-        
-        # Ordenar ambos grupos por posición
-        solicitudes_adelante.sort(key=lambda x: x.posicion)
-        solicitudes_atras.sort(key=lambda x: x.posicion, reverse=True)
-        
-        # Seleccionar siguiente solicitud según dirección
+        # Vecinas inmediatas en cada dirección según el índice por posición
         if self.direccion == 1:  # Moviendo hacia arriba
-            if solicitudes_adelante:
-                solicitud = solicitudes_adelante[0]
-                self.solicitudes.remove(solicitud)
-            else:
+            solicitud = self.indice.siguiente_desde(posicion_actual)
+            if solicitud is None:
                 self.direccion = -1  # Cambiar dirección
-                if solicitudes_atras:
-                    solicitud = solicitudes_atras[0]
-                    self.solicitudes.remove(solicitud)
-                else:
-                    return None
+                solicitud = self.indice.anterior_a(posicion_actual)
         else:  # Moviendo hacia abajo
-            if solicitudes_atras:
-                solicitud = solicitudes_atras[0]
-                self.solicitudes.remove(solicitud)
-            else:
+            # Incluye la posición del cabezal: atenderla no mueve el brazo
+            solicitud = self.indice.anterior_a(posicion_actual + 1)
+            if solicitud is None:
                 self.direccion = 1  # Cambiar dirección
-                if solicitudes_adelante:
-                    solicitud = solicitudes_adelante[0]
-                    self.solicitudes.remove(solicitud)
-                else:
-                    return None
+                solicitud = self.indice.siguiente_desde(posicion_actual)
+
+        if solicitud is None:
+            return None
+        self.indice.eliminar(solicitud)
         
         return solicitud
 
@@ -188,45 +287,36 @@ class PlanificadorDisco:
         Returns:
             Solicitud: Siguiente solicitud a procesar, o None si no hay solicitudes
         """
-        if not self.solicitudes:
+        if not self.indice:
             return None
         
-        # Obtener todas las solicitudes adelante de la posición actual
-        solicitudes_adelante = [s for s in self.solicitudes if s.posicion >= posicion_actual]
+        # Si hay solicitudes adelante, tomar la más cercana
+        solicitud = self.indice.siguiente_desde(posicion_actual)
         
-        if solicitudes_adelante:
-            # Si hay solicitudes adelante, tomar la más cercana
-            solicitudes_adelante.sort(key=lambda x: x.posicion)
-            solicitud = solicitudes_adelante[0]
-            self.solicitudes.remove(solicitud)
-        else:
+        if solicitud is None:
             # Si no hay solicitudes adelante, volver al inicio
             self.posicion_actual = 0
-            self.solicitudes.sort(key=lambda x: x.posicion)
-            if self.solicitudes:
-                solicitud = self.solicitudes.pop(0)
-            else:
-                return None
+            solicitud = self.indice.primera()
         
+        self.indice.eliminar(solicitud)
         return solicitud
 
     def fifo_con_envejecimiento(self):
-        """FIFO con sistema de prioridades y envejecimiento"""
-        if not self.solicitudes:
+        """
+        FIFO con sistema de prioridades y envejecimiento.
+
+        La prioridad efectiva crece un punto cada `tiempo_envejecimiento`
+        segundos de espera y se calcula al despachar; la prioridad original
+        de la solicitud no se modifica.
+
+        Returns:
+            Solicitud: Solicitud más antigua con mayor prioridad efectiva, o None
+        """
+        if not self.indice:
             return None
 
-        tiempo_actual = time.time()
-        
-        # Actualizar prioridades basadas en tiempo de espera
-        for solicitud in self.solicitudes:
-            tiempo_espera = tiempo_actual - self.inicio_espera.get(id(solicitud), tiempo_actual)
-            incrementos = int(tiempo_espera / self.tiempo_envejecimiento)
-            if incrementos > 0:
-                solicitud.prioridad = min(5, solicitud.prioridad + incrementos)
-
-        # Obtener la solicitud más antigua con mayor prioridad
-        solicitud = max(self.solicitudes, key=lambda x: (x.prioridad, -self.solicitudes.index(x)))
-        self.solicitudes.remove(solicitud)
+        solicitud = self.cola_fifo.extraer(self.reloj.ahora())
+        self.indice.eliminar(solicitud)
         
         return solicitud
 
@@ -246,37 +336,90 @@ class PlanificadorDisco:
         Raises:
             ValueError: Si el algoritmo especificado es inválido
         """
-        if not self.solicitudes:
+        if not self.indice:
             return None
             
         self.metricas.iniciar_solicitud()
+        profundidad = len(self.indice)
         
         # Seleccionar solicitud según el algoritmo
         if self.algoritmo == "FIFO":
             solicitud = self.fifo_con_envejecimiento()
         elif self.algoritmo == "SSTF":
             solicitud = self.sstf_optimizado(posicion_actual)
-        elif self.algoritmo in ["SCAN", "C-SCAN"]:
+        elif self.algoritmo == "SCAN":
             solicitud = self.scan_optimizado(posicion_actual)
+        elif self.algoritmo == "C-SCAN":
+            solicitud = self.c_scan_optimizado(posicion_actual)
         else:
             raise ValueError("Algoritmo desconocido.")
 
-        # Registrar tiempo de inicio para nuevas solicitudes
-        for sol in self.solicitudes:
-            if id(sol) not in self.inicio_espera:
-                self.inicio_espera[id(sol)] = time.time()
-        
-        if self.dma:
-            self.dma.transferir(solicitud)
+        espera = self.reloj.ahora() - solicitud.llegada
+        self.metricas.registrar_espera(espera, profundidad)
+        self.metricas.registrar_latencia("espera", solicitud, espera)
         
+        # Buscar mientras siguen en curso las transferencias anteriores
         movimientos = abs(posicion_actual - solicitud.posicion)
         tiempo_estimado = self.predecir_tiempo_busqueda(movimientos, solicitud)
-        time.sleep(tiempo_estimado)
+        self.reloj.dormir(tiempo_estimado)
+        
+        futuro = self.transferir(solicitud) if self.dma else None
         
         self.metricas.registrar_busqueda(movimientos, solicitud.posicion)
+        self.metricas.registrar_latencia("servicio", solicitud, self.metricas.ultimo_tiempo)
+        if self.grabador:
+            self.grabador.registrar_despacho(self.reloj.ahora() - self._inicio, solicitud,
+                                             movimientos, self.metricas.ultimo_tiempo)
+        if futuro is None:
+            self._registrar_extremo_a_extremo(solicitud)
+        else:
+            # La solicitud termina cuando el bus completa su transferencia
+            futuro.add_done_callback(
+                lambda f: f.cancelled() or self._registrar_extremo_a_extremo(solicitud))
         
         return solicitud
 
+    def _registrar_extremo_a_extremo(self, solicitud):
+        """
+        Registra la latencia desde la llegada de la solicitud hasta ahora.
+        """
+        self.metricas.registrar_latencia("extremo_a_extremo", solicitud,
+                                         self.reloj.ahora() - solicitud.llegada)
+
+    def transferir(self, solicitud):
+        """
+        Entrega una solicitud al DMA respetando el límite de transferencias en vuelo.
+
+        Args:
+            solicitud (Solicitud): Solicitud a transferir
+
+        Returns:
+            Future: Future de la transferencia devuelto por el DMA
+        """
+        if self.max_en_vuelo is not None:
+            self._esperar_transferencias(self.max_en_vuelo - 1)
+        futuro = self.dma.transferir(solicitud)
+        if self.max_en_vuelo is not None and not futuro.done():
+            self.en_vuelo.append(futuro)
+        return futuro
+
+    def _esperar_transferencias(self, maximo):
+        """
+        Espera hasta que queden como mucho `maximo` transferencias en vuelo.
+        """
+        en_vuelo = self.en_vuelo
+        while en_vuelo and en_vuelo[0].done():
+            en_vuelo.popleft()
+        if len(en_vuelo) <= maximo:
+            return
+        inicio = self.reloj.ahora()
+        while len(en_vuelo) > maximo:
+            # Las completadas fuera de orden se descartan al llegar a la cabeza
+            self.reloj.esperar(en_vuelo.popleft())
+            while en_vuelo and en_vuelo[0].done():
+                en_vuelo.popleft()
+        self.tiempo_espera_dma += self.reloj.ahora() - inicio
+
     def predecir_tiempo_busqueda(self, movimientos, solicitud):
         """Predice el tiempo de búsqueda basado en patrones históricos"""
         sector_key = (solicitud.posicion // 10) * 10  # Agrupa sectores similares
@@ -292,35 +435,122 @@ class PlanificadorDisco:
     def ejecutar(self):
         """Ejecuta el planificador con las mejoras implementadas"""
         self.log(f"Planificador: Iniciando simulación con algoritmo {self.algoritmo}")
-        posicion_actual = 0
-        
-        # Inicializar tiempos de espera para todas las solicitudes
-        for solicitud in self.solicitudes:
-            self.inicio_espera[id(solicitud)] = time.time()
         
-        while self.solicitudes:
-            solicitud = self.procesar(posicion_actual)
-            if solicitud:
-                tiempo_proceso = self.metricas.tiempos_por_solicitud[-1]
-                self.log(
-                    f"Planificador: Procesado {solicitud} en {tiempo_proceso:.3f}s",
-                    "success" if tiempo_proceso < 0.3 else "warning"
-                )
-                posicion_actual = solicitud.posicion
-                
-                # Limpiar referencias de solicitudes procesadas
-                self.inicio_espera.pop(id(solicitud), None)
+        if self.fuente is not None:
+            self.ejecutar_flujo()
+        else:
+            posicion_actual = 0
+
+            # Las solicitudes del lote inicial llegan todas al comenzar la simulación
+            inicio = self._inicio = self.reloj.ahora()
+            for solicitud in self.indice:
+                solicitud.llegada = inicio
+                if self.grabador:
+                    self.grabador.registrar_llegada(0.0, solicitud)
+
+            while self.indice:
+                posicion_actual = self._despachar(posicion_actual)
+
+        # Escribir lo que la caché del DMA aún retiene como sucio
+        if self.dma:
+            self.dma.vaciar_sucias()
+
+        # En modo virtual, completar las transferencias que quedan en vuelo
+        if self.reloj.virtual:
+            self.reloj.ejecutar_pendientes()
+        self._esperar_transferencias(0)
                 
         self.log("Planificador: Simulación completada", "success")
         self.mostrar_analisis_rendimiento()
 
 
 
+    def ejecutar_flujo(self):
+        """
+        Atiende un flujo abierto de llegadas desde `self.fuente`.
+
+        Las llegadas se admiten en orden mientras haya hueco en la ventana de
+        `tamano_buffer` solicitudes; el resto espera en la fuente, así que la
+        memoria usada no depende de la duración del flujo. La espera de cada
+        solicitud se mide desde su instante de llegada, incluido el tiempo que
+        pasó fuera de la ventana. Si no hay trabajo, el disco queda ocioso hasta
+        la próxima llegada.
+        """
+        inicio = self._inicio = self.reloj.ahora()
+        posicion_actual = 0
+        self._fuente_agotada = False
+        proxima = None
+
+        while self.is_running:
+            if proxima is None:
+                proxima = self._siguiente_llegada(bloquear=not self.indice)
+            if proxima is None and not self.indice:
+                if self._fuente_agotada:
+                    break
+                continue
+
+            # Admitir llegadas ya ocurridas mientras haya espacio en la ventana
+            while proxima is not None and len(self.indice) < self.tamano_buffer:
+                instante, solicitud = proxima
+                llegada = self.reloj.ahora() if instante is None else inicio + instante
+                if llegada > self.reloj.ahora():
+                    if self.indice:
+                        break
+                    self.reloj.dormir(llegada - self.reloj.ahora())  # Disco ocioso
+                self.agregar_solicitud(solicitud, llegada)
+                if self.grabador:
+                    self.grabador.registrar_llegada(llegada - inicio, solicitud)
+                proxima = self._siguiente_llegada(bloquear=False)
+
+            if self.indice:
+                posicion_actual = self._despachar(posicion_actual)
+
+    def _siguiente_llegada(self, bloquear):
+        """
+        Obtiene la siguiente llegada de la fuente.
+
+        Args:
+            bloquear (bool): En una cola, esperar (hasta 0.5s) si no hay llegadas disponibles
+
+        Returns:
+            tuple: (instante, solicitud), o None si no hay llegadas disponibles
+                o la fuente se agotó (ver `_fuente_agotada`)
+        """
+        if self._fuente_agotada:
+            return None
+        if isinstance(self.fuente, queue.Queue):
+            try:
+                llegada = self.fuente.get(block=bloquear, timeout=0.5 if bloquear else None)
+            except queue.Empty:
+                return None
+        else:
+            if not hasattr(self.fuente, "__next__"):
+                self.fuente = iter(self.fuente)
+            llegada = next(self.fuente, None)
+        if llegada is None:
+            self._fuente_agotada = True
+        return llegada
+
+    def _despachar(self, posicion_actual):
+        """
+        Procesa una solicitud, la registra en el log y devuelve la nueva posición.
+        """
+        solicitud = self.procesar(posicion_actual)
+        if not solicitud:
+            return posicion_actual
+        tiempo_proceso = self.metricas.ultimo_tiempo
+        self.log(
+            f"Planificador: Procesado {solicitud} en {tiempo_proceso:.3f}s",
+            "success" if tiempo_proceso < 0.3 else "warning"
+        )
+        return solicitud.posicion
+
     def log(self, mensaje, tipo="info"):
         """
         Registra un mensaje tanto en la consola como en la interfaz si está disponible.
         """
-        print(mensaje)
+        if not self.silencioso:
+            print(mensaje)
         if self.interfaz:
             self.interfaz.agregar_log(mensaje, tipo)
 
@@ -334,6 +564,7 @@ class PlanificadorDisco:
         estadisticas = self.metricas.obtener_estadisticas_detalladas()
         return {
             "solicitudes_procesadas": self.metricas.solicitudes_procesadas,
+            "solicitudes_pendientes": self.pendientes,
             "movimientos_cabezal": self.metricas.movimientos_cabezal,
             "tiempo_promedio": self.metricas.calcular_tiempo_promedio(),
             "tiempos_por_solicitud": self.metricas.tiempos_por_solicitud,
@@ -343,7 +574,15 @@ class PlanificadorDisco:
             "direccion_actual": "Ascendente" if self.direccion == 1 else "Descendente",
             "tiempo_total": estadisticas.get('tiempo_total', 0),
             "tiempo_min": estadisticas.get('tiempo_min', 0),
-            "tiempo_max": estadisticas.get('tiempo_max', 0)
+            "tiempo_max": estadisticas.get('tiempo_max', 0),
+            "tiempo_desviacion": estadisticas.get('tiempo_desviacion', 0),
+            "espera_promedio": estadisticas.get('espera_promedio', 0),
+            "espera_max": estadisticas.get('espera_max', 0),
+            "profundidad_cola_promedio": estadisticas.get('profundidad_promedio', 0),
+            "profundidad_cola_max": estadisticas.get('profundidad_max', 0),
+            "espera_transferencias": self.tiempo_espera_dma,
+            # Percentiles de servicio, espera y extremo a extremo por dispositivo, prioridad y tipo
+            "latencias": self.metricas.latencias.resumen()
         }
     
 
@@ -361,28 +600,24 @@ class PlanificadorDisco:
         self.log(f"Tiempo total: {tiempo_total:.2f}s", "info")
         self.log(f"Tiempo promedio por solicitud: {estadisticas['tiempo_promedio']:.3f}s", "info")
         self.log(f"Promedio movimientos/acceso: {movimientos_promedio:.2f}", "info")
+        self.log(f"Espera promedio en cola: {estadisticas['espera_promedio']:.3f}s", "info")
+        self.log(f"Profundidad promedio de cola: {estadisticas['profundidad_promedio']:.2f}", "info")
 
         # Análisis adicional para algoritmos mejorados
         if self.algoritmo == "SSTF":
             self.log("\nAnálisis de Patrones:", "info")
-            sectores_frecuentes = sorted(
-                self.patron_accesos.items(), 
-                key=lambda x: len(x[1]), 
-                reverse=True
-            )[:5]
+            sectores_frecuentes = self.patron_accesos.mas_frecuentes(5)
             for sector, accesos in sectores_frecuentes:
-                self.log(f"Sector {sector}: {len(accesos)} accesos", "info")
+                self.log(f"Sector {sector}: {accesos} accesos", "info")
                 
-        elif self.algoritmo in ["SCAN", "C-SCAN"]:
+        elif self.algoritmo == "SCAN":
             self.log(f"\nDirección actual: {'Ascendente' if self.direccion == 1 else 'Descendente'}", "info")
+        elif self.algoritmo == "C-SCAN":
+            self.log("\nDirección actual: Ascendente (circular)", "info")
             
         # Análisis de sectores más accedidos
-        sectores = {}
-        for acc in self.metricas.historial_accesos:
-            sectores[acc.posicion] = sectores.get(acc.posicion, 0) + 1
-
         self.log("\nSectores más accedidos:", "info")
-        for sector, accesos in sorted(sectores.items(), key=lambda x: (-x[1], x[0]))[:5]:
+        for sector, accesos in self.metricas.sectores_mas_accedidos(5):
             self.log(f"Sector {sector}: {accesos} accesos", "info")
 
         # Análisis de predicciones
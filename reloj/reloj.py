@@ -0,0 +1,177 @@
+import heapq
+import itertools
+import time
+from concurrent.futures import wait
+
+
+class RelojReal:
+    """
+    Reloj de tiempo real basado en el reloj del sistema.
+
+    Es el reloj por defecto del simulador: las esperas bloquean el hilo
+    que las solicita mediante time.sleep.
+
+    Attributes:
+        virtual (bool): Siempre False, indica que el tiempo avanza por sí solo
+    """
+
+    virtual = False
+
+    def ahora(self):
+        """
+        Obtiene el instante actual.
+
+        Returns:
+            float: Timestamp actual en segundos
+        """
+        return time.time()
+
+    def dormir(self, segundos):
+        """
+        Bloquea el hilo actual durante el tiempo indicado.
+
+        Args:
+            segundos (float): Duración de la espera
+        """
+        if segundos > 0:
+            time.sleep(segundos)
+
+    def esperar(self, futuro, timeout=None):
+        """
+        Bloquea el hilo actual hasta que el futuro termine.
+
+        Args:
+            futuro (Future): Operación a esperar
+            timeout (float, optional): Espera máxima en segundos. Defaults to None.
+
+        Returns:
+            bool: True si el futuro terminó
+        """
+        wait((futuro,), timeout)
+        return futuro.done()
+
+
+class RelojVirtual:
+    """
+    Reloj simulado con un motor de eventos discretos.
+
+    El tiempo solo avanza cuando alguien "duerme" o cuando se vacía la cola
+    de eventos, de forma instantánea. Los eventos se guardan en un heap
+    ordenado por (instante, secuencia), así que dos eventos programados para
+    el mismo instante se ejecutan en el orden en que se programaron.
+
+    El reloj virtual no es thread-safe: los componentes que lo usan
+    (planificador, DMA y bus) trabajan en un único hilo.
+
+    Attributes:
+        virtual (bool): Siempre True
+        tiempo (float): Instante simulado actual en segundos
+        eventos (list): Heap de eventos pendientes
+        eventos_procesados (int): Contador de eventos ejecutados
+    """
+
+    virtual = True
+
+    def __init__(self, inicio=0.0):
+        """
+        Inicializa el reloj virtual.
+
+        Args:
+            inicio (float, optional): Instante inicial. Defaults to 0.0.
+        """
+        self.tiempo = inicio
+        self.eventos = []
+        self.eventos_procesados = 0
+        self._secuencia = itertools.count()
+
+    def ahora(self):
+        """
+        Obtiene el instante simulado actual.
+
+        Returns:
+            float: Tiempo simulado en segundos
+        """
+        return self.tiempo
+
+    def programar(self, retardo, accion, *args):
+        """
+        Programa una acción para dentro de un tiempo simulado.
+
+        Args:
+            retardo (float): Segundos simulados hasta la ejecución
+            accion (callable): Función a invocar
+            *args: Argumentos para la acción
+        """
+        self.programar_en(self.tiempo + max(retardo, 0.0), accion, *args)
+
+    def programar_en(self, instante, accion, *args):
+        """
+        Programa una acción para un instante simulado absoluto.
+
+        Args:
+            instante (float): Instante de ejecución
+            accion (callable): Función a invocar
+            *args: Argumentos para la acción
+        """
+        heapq.heappush(self.eventos, (instante, next(self._secuencia), accion, args))
+
+    def avanzar_hasta(self, instante):
+        """
+        Ejecuta en orden todos los eventos hasta el instante dado y deja
+        el reloj en ese instante.
+
+        Args:
+            instante (float): Instante simulado de destino
+        """
+        while self.eventos and self.eventos[0][0] <= instante:
+            self._ejecutar_siguiente()
+        self.tiempo = max(self.tiempo, instante)
+
+    def dormir(self, segundos):
+        """
+        Avanza el tiempo simulado sin bloquear.
+
+        Args:
+            segundos (float): Duración simulada de la espera
+        """
+        self.avanzar_hasta(self.tiempo + max(segundos, 0.0))
+
+    def esperar(self, futuro, timeout=None):
+        """
+        Ejecuta eventos hasta que el futuro termine o no queden eventos.
+
+        Args:
+            futuro (Future): Operación a esperar
+            timeout (float, optional): Tiempo simulado máximo. Defaults to None.
+
+        Returns:
+            bool: True si el futuro terminó
+        """
+        limite = None if timeout is None else self.tiempo + timeout
+        while not futuro.done() and self.eventos:
+            if limite is not None and self.eventos[0][0] > limite:
+                self.tiempo = limite
+                break
+            self._ejecutar_siguiente()
+        return futuro.done()
+
+    def ejecutar_pendientes(self):
+        """
+        Ejecuta todos los eventos pendientes, incluidos los que se
+        programen mientras tanto.
+        """
+        while self.eventos:
+            self._ejecutar_siguiente()
+
+    def pendientes(self):
+        """
+        Returns:
+            int: Número de eventos pendientes
+        """
+        return len(self.eventos)
+
+    def _ejecutar_siguiente(self):
+        instante, _, accion, args = heapq.heappop(self.eventos)
+        self.tiempo = max(self.tiempo, instante)
+        self.eventos_procesados += 1
+        accion(*args)
@@ -0,0 +1,74 @@
+import unittest
+
+from dma.bus import BusInteligente
+from generador.generador import Solicitud
+from reloj.reloj import RelojVirtual
+
+
+class TestRepartoDRR(unittest.TestCase):
+
+    """
+    Con colas siempre llenas, cada prioridad recibe bytes del bus en
+    proporción a su peso, con un error de a lo sumo un cuanto y una entrada.
+    """
+
+    def _servir(self, cargas, pesos=None):
+        # cargas: {prioridad: (cantidad, tamano)}
+        completadas = []
+        bus = BusInteligente(reloj=RelojVirtual(), pesos=pesos, latencia=0.0,
+                             al_completar=completadas.append)
+        solicitudes = []
+        for prioridad, (cantidad, tamano) in cargas.items():
+            solicitudes += [Solicitud(1, i, "lectura", prioridad, tamano=tamano) for i in range(cantidad)]
+        bus.agregar_lote(solicitudes)
+        bus.reloj.ejecutar_pendientes()
+        self.assertEqual(len(completadas), len(solicitudes))
+
+        # Bytes por prioridad mientras todas las colas seguían con pendientes
+        restantes = {p: cantidad for p, (cantidad, _) in cargas.items()}
+        servidos = dict.fromkeys(cargas, 0)
+        for solicitud in completadas:
+            servidos[solicitud.prioridad] += solicitud.tamano
+            restantes[solicitud.prioridad] -= 1
+            if not restantes[solicitud.prioridad]:
+                break
+        return bus, servidos
+
+    def _assert_proporcional(self, bus, servidos, cargas):
+        margen = bus.cuanto * max(bus.pesos.values()) + max(t for _, t in cargas.values())
+        normalizados = {p: b / bus.pesos[p] for p, b in servidos.items()}
+        self.assertLessEqual(max(normalizados.values()) - min(normalizados.values()), margen)
+
+    def test_bytes_proporcionales_al_peso(self):
+        cargas = {1: (400, 4096), 3: (400, 4096), 5: (400, 4096)}
+        bus, servidos = self._servir(cargas)
+        self._assert_proporcional(bus, servidos, cargas)
+        self.assertGreater(servidos[5], servidos[3])
+        self.assertGreater(servidos[3], servidos[1])
+
+    def test_el_cuanto_se_mide_en_bytes(self):
+        # Igual peso y tamaños distintos: mismos bytes, no mismas solicitudes
+        cargas = {1: (100, 16384), 2: (1600, 1024)}
+        bus, servidos = self._servir(cargas, pesos={1: 1, 2: 1})
+        self._assert_proporcional(bus, servidos, cargas)
+        self.assertGreater(servidos[1], 0)
+
+    def test_ninguna_prioridad_queda_sin_atender(self):
+        cargas = {1: (5, 4096), 5: (500, 4096)}
+        completadas = []
+        bus = BusInteligente(reloj=RelojVirtual(), latencia=0.0, al_completar=completadas.append)
+        bus.agregar_lote([Solicitud(1, i, "lectura", p, tamano=t)
+                          for p, (n, t) in cargas.items() for i in range(n)])
+        bus.reloj.ejecutar_pendientes()
+        # Con pesos 1:5, la prioridad 1 termina antes de servirse 6 · 5 entradas de la 5
+        ultima = max(i for i, s in enumerate(completadas) if s.prioridad == 1)
+        self.assertLess(ultima, 6 * 6)
+
+    def test_peso_invalido(self):
+        bus = BusInteligente(reloj=RelojVirtual())
+        with self.assertRaises(ValueError):
+            bus.set_priority_weight(1, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
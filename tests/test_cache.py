@@ -0,0 +1,90 @@
+import random
+import unittest
+
+from dma.cache import POLITICAS, crear_cache
+
+
+class TestPoliticasCache(unittest.TestCase):
+
+    def test_capacidad_y_desalojos_en_todas_las_politicas(self):
+        for politica in POLITICAS:
+            with self.subTest(politica=politica):
+                rng = random.Random(11)
+                cache = crear_cache(politica, 16)
+                desalojadas = []
+                cache.al_desalojar = lambda clave, valor: desalojadas.append(clave)
+                nuevas = 0
+                for _ in range(3000):
+                    clave = int(rng.paretovariate(1.2)) % 64
+                    if cache.obtener(clave) is None:
+                        nuevas += 1
+                        cache.insertar(clave, f"bloque {clave}")
+                    self.assertLessEqual(len(cache), 16)
+                    self.assertNotIn(desalojadas[-1] if desalojadas else None, cache)
+                # Cada clave nueva queda en caché o fue desalojada exactamente una vez
+                self.assertEqual(len(cache), nuevas - cache.desalojos)
+                self.assertEqual(len(desalojadas), cache.desalojos)
+                self.assertEqual(cache.aciertos + cache.fallos, 3000)
+
+                cache.redimensionar(4)
+                self.assertLessEqual(len(cache), 4)
+                self.assertEqual(len(cache), nuevas - cache.desalojos)
+
+    def test_capacidad_cero_no_guarda_nada(self):
+        for politica in POLITICAS:
+            cache = crear_cache(politica, 0)
+            cache.insertar(1, "x")
+            self.assertIsNone(cache.obtener(1))
+            self.assertEqual(len(cache), 0)
+
+    def test_lru_desaloja_la_menos_reciente(self):
+        cache = crear_cache("LRU", 2)
+        cache.insertar("a", 1)
+        cache.insertar("b", 2)
+        cache.obtener("a")
+        cache.insertar("c", 3)
+        self.assertNotIn("b", cache)
+        self.assertIn("a", cache)
+
+    def test_lfu_desaloja_la_menos_frecuente_y_empata_por_recencia(self):
+        cache = crear_cache("LFU", 3)
+        for clave in "abc":
+            cache.insertar(clave, clave)
+        cache.obtener("a")
+        cache.obtener("a")
+        cache.obtener("c")
+        cache.insertar("d", "d")  # b tiene un solo uso
+        self.assertNotIn("b", cache)
+        cache.obtener("d")
+        cache.insertar("e", "e")  # c y d con dos usos: sale la menos reciente, c
+        self.assertEqual(sorted(cache.entradas), ["a", "d", "e"])
+
+    def test_arc_acota_las_listas_fantasma(self):
+        rng = random.Random(3)
+        cache = crear_cache("ARC", 8)
+        for _ in range(5000):
+            clave = rng.randrange(40)
+            if cache.obtener(clave) is None:
+                cache.insertar(clave, clave)
+            self.assertLessEqual(len(cache.t1) + len(cache.b1), 8)
+            self.assertLessEqual(len(cache) + len(cache.b1) + len(cache.b2), 16)
+            self.assertTrue(0 <= cache.p <= 8)
+
+    def test_2q_resiste_un_barrido(self):
+        resultados = {}
+        for politica in ("LRU", "2Q"):
+            cache = crear_cache(politica, 8)
+            # Un sector caliente pedido dos veces con otros en medio, y luego
+            # un barrido de sectores de un solo uso
+            for clave in ["h"] + list(range(8)) + ["h"]:
+                if cache.obtener(clave) is None:
+                    cache.insertar(clave, clave)
+            for clave in range(100, 200):
+                if cache.obtener(clave) is None:
+                    cache.insertar(clave, clave)
+            resultados[politica] = "h" in cache
+        self.assertEqual(resultados, {"LRU": False, "2Q": True})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+from dma.dma import DMA
+from generador.generador import Solicitud
+from reloj.reloj import RelojReal, RelojVirtual
+
+
+class TestApagadoDMA(unittest.TestCase):
+
+    """
+    Al apagarse, el DMA debe escribir en el bus las escrituras diferidas y
+    esperar a que el bus termine lo aceptado, con cualquiera de los relojes.
+    """
+
+    def _escribir_y_apagar(self, reloj):
+        # Bus rápido para que la prueba en tiempo real dure poco
+        dma = DMA(buffer_size=2, cache_size=100, reloj=reloj, marca_alta=1.0,
+                  ancho_banda_bus=4096 / 0.001, latencia_bus=0.0)
+        for posicion in range(40):
+            dma.transferir(Solicitud(1, posicion, "escritura"))
+        self.assertEqual(dma.get_status()['sucias'], 40)
+        dma.shutdown()
+        return dma
+
+    def test_tiempo_real_vacia_escrituras_diferidas(self):
+        dma = self._escribir_y_apagar(RelojReal())
+        self.assertEqual(dma.get_status()['sucias'], 0)
+        self.assertEqual(dma.bus.solicitudes_procesadas, 40)
+        self.assertEqual(dma.bus.pendientes(), 0)
+
+    def test_reloj_virtual_vacia_escrituras_diferidas(self):
+        dma = self._escribir_y_apagar(RelojVirtual())
+        self.assertEqual(dma.get_status()['sucias'], 0)
+        self.assertEqual(dma.bus.solicitudes_procesadas, 40)
+        self.assertEqual(dma.bus.pendientes(), 0)
+
+    def test_write_through_no_inicia_el_vaciador(self):
+        dma = DMA(buffer_size=2, cache_size=100, reloj=RelojReal(), escritura_diferida=False,
+                  ancho_banda_bus=4096 / 0.001, latencia_bus=0.0)
+        self.assertIsNone(dma.vaciador_thread)
+        for posicion in range(10):
+            dma.transferir(Solicitud(1, posicion, "escritura"))
+        dma.shutdown()
+        self.assertEqual(dma.bus.solicitudes_procesadas, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
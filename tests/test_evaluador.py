@@ -0,0 +1,67 @@
+import random
+import unittest
+
+from generador.generador import Solicitud
+from planificador.evaluador import arreglos_desde_solicitudes, evaluar
+from planificador.planificador import PlanificadorDisco
+from reloj.reloj import RelojVirtual
+
+
+def orden_planificador(algoritmo, solicitudes, posicion_inicial):
+    """Despacha con PlanificadorDisco y devuelve los índices en orden de despacho."""
+    indices = {s.id_solicitud: i for i, s in enumerate(solicitudes)}
+    planificador = PlanificadorDisco(solicitudes, algoritmo=algoritmo, reloj=RelojVirtual(),
+                                     silencioso=True)
+    posicion = posicion_inicial
+    orden = []
+    while planificador.indice:
+        solicitud = planificador.procesar(posicion)
+        posicion = solicitud.posicion
+        orden.append(indices[solicitud.id_solicitud])
+    return orden
+
+
+class TestEquivalenciaConPlanificador(unittest.TestCase):
+
+    """
+    El evaluador offline debe despachar en el mismo orden que PlanificadorDisco
+    en los casos que documenta `evaluar`.
+    """
+
+    def _comparar(self, algoritmo, crear_carga, intentos=200):
+        rng = random.Random(1234)
+        for _ in range(intentos):
+            solicitudes = crear_carga(rng)
+            posicion_inicial = 0 if algoritmo == "FIFO" else rng.randint(0, 20)
+            posiciones, prioridades = arreglos_desde_solicitudes(solicitudes)
+            esperado = evaluar(algoritmo, posiciones, prioridades, posicion_inicial).orden.tolist()
+            obtenido = orden_planificador(algoritmo, solicitudes, posicion_inicial)
+            self.assertEqual(obtenido, esperado, f"{algoritmo}: {solicitudes} desde {posicion_inicial}")
+
+    @staticmethod
+    def _carga_mixta(rng):
+        # Posiciones repetidas y prioridades variadas; a lo sumo 15 * 20 * 10 ms
+        # de búsqueda, menos que el envejecimiento del FIFO
+        return [Solicitud(1, rng.randint(0, 20), "lectura", rng.randint(1, 5))
+                for _ in range(rng.randint(1, 15))]
+
+    def test_fifo(self):
+        self._comparar("FIFO", self._carga_mixta)
+
+    def test_scan(self):
+        self._comparar("SCAN", self._carga_mixta)
+
+    def test_c_scan(self):
+        self._comparar("C-SCAN", self._carga_mixta)
+
+    def test_sstf(self):
+        # Posiciones distintas y prioridad única: frecuencia, predicción y
+        # espera son iguales para todas las candidatas y solo decide la distancia
+        def carga(rng):
+            return [Solicitud(1, posicion, "lectura")
+                    for posicion in rng.sample(range(21), rng.randint(1, 15))]
+        self._comparar("SSTF", carga)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import re
+import unittest
+from collections import defaultdict
+
+from dma.dma import DMA
+from exportador.exportador import ExportadorMetricas
+from generador.generador import GeneradorSolicitudes
+from planificador.planificador import PlanificadorDisco
+from reloj.reloj import RelojVirtual
+
+MUESTRA = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(\{(.*)\})? (\S+)$')
+ETIQUETA = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"')
+
+
+def analizar(texto):
+    """Devuelve {familia: (tipo, [(nombre, etiquetas, valor)])} y valida la estructura."""
+    familias = {}
+    actual = None
+    for linea in texto.rstrip("\n").split("\n"):
+        if linea.startswith("# HELP "):
+            actual = linea.split(" ")[2]
+            assert actual not in familias, f"familia repetida: {actual}"
+        elif linea.startswith("# TYPE "):
+            _, _, nombre, tipo = linea.split(" ")
+            assert nombre == actual, f"TYPE sin HELP: {linea}"
+            familias[nombre] = (tipo, [])
+        elif linea == "# EOF":
+            actual = None
+        else:
+            coincidencia = MUESTRA.match(linea)
+            assert coincidencia, f"línea inválida: {linea}"
+            nombre, _, etiquetas, valor = coincidencia.groups()
+            assert nombre.startswith(actual), f"muestra fuera de su familia: {linea}"
+            familias[actual][1].append((nombre, dict(ETIQUETA.findall(etiquetas or "")), float(valor)))
+    return familias
+
+
+class TestExportadorMetricas(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        reloj = RelojVirtual()
+        cls.dma = DMA(reloj=reloj)
+        cls.planificador = PlanificadorDisco(GeneradorSolicitudes(60).generar(), algoritmo="SSTF",
+                                             dma=cls.dma, silencioso=True)
+        cls.planificador.ejecutar()
+        cls.dma.shutdown()
+        cls.exportador = ExportadorMetricas(cls.dma, cls.planificador, intervalo_minimo=0)
+
+    def test_openmetrics_termina_en_eof_y_declara_cada_familia(self):
+        texto = self.exportador.generar(openmetrics=True)
+        self.assertTrue(texto.endswith("# EOF\n"))
+        familias = analizar(texto)
+        for nombre, (tipo, muestras) in familias.items():
+            self.assertIn(tipo, ("counter", "gauge", "histogram"))
+            for muestra, _, _ in muestras:
+                if tipo == "counter":
+                    self.assertEqual(muestra, nombre + "_total")
+                elif tipo == "gauge":
+                    self.assertEqual(muestra, nombre)
+
+    def test_prometheus_declara_contadores_con_total_y_sin_eof(self):
+        texto = self.exportador.generar(openmetrics=False)
+        self.assertNotIn("# EOF", texto)
+        for nombre, (tipo, _) in analizar(texto).items():
+            if tipo == "counter":
+                self.assertTrue(nombre.endswith("_total"), nombre)
+
+    def test_histogramas_acumulados_y_sin_doble_conteo(self):
+        familias = analizar(self.exportador.generar())
+        histogramas = {n: m for n, (t, m) in familias.items() if t == "histogram"}
+        self.assertIn("simulador_planificador_latencia_segundos", histogramas)
+        procesadas = self.planificador.metricas.solicitudes_procesadas
+        for nombre, muestras in histogramas.items():
+            series = defaultdict(list)
+            conteos = defaultdict(float)
+            for muestra, etiquetas, valor in muestras:
+                if muestra == nombre + "_bucket":
+                    le = etiquetas.pop("le")
+                    series[tuple(sorted(etiquetas.items()))].append((float(le), valor))
+                elif muestra == nombre + "_count":
+                    serie = tuple(sorted(etiquetas.items()))
+                    conteos[serie] = valor
+            for serie, buckets in series.items():
+                limites = [le for le, _ in buckets]
+                acumulados = [valor for _, valor in buckets]
+                self.assertEqual(limites, sorted(limites))
+                self.assertEqual(acumulados, sorted(acumulados))
+                self.assertEqual(limites[-1], float("inf"))
+                self.assertEqual(acumulados[-1], conteos[serie])
+            # Dentro de una familia, cada observación se cuenta una sola vez
+            por_metrica = defaultdict(float)
+            for serie, valor in conteos.items():
+                por_metrica[dict(serie)["metrica"]] += valor
+            for metrica, total in por_metrica.items():
+                self.assertEqual(total, procesadas, f"{nombre} {metrica}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import math
+import random
+import unittest
+
+from planificador.histograma import HistogramaLatencia
+
+PERCENTILES = (1, 25, 50, 90, 99, 99.9, 100)
+
+
+def percentil_exacto(ordenados, p):
+    # Rango más cercano, como HistogramaLatencia.percentiles
+    return ordenados[max(1, math.ceil(len(ordenados) * p / 100)) - 1]
+
+
+class TestHistogramaLatencia(unittest.TestCase):
+
+    def _valores(self, semilla, n=20000):
+        rng = random.Random(semilla)
+        return [rng.lognormvariate(-4, 1.5) for _ in range(n)]
+
+    def test_error_relativo_acotado_por_la_precision(self):
+        for precision in (4, 7, 10):
+            with self.subTest(precision=precision):
+                histograma = HistogramaLatencia(precision=precision)
+                valores = self._valores(precision)
+                for valor in valores:
+                    histograma.registrar(valor)
+                ordenados = sorted(valores)
+                cota = 2.0 ** -(precision - 1)
+                for p, estimado in zip(PERCENTILES, histograma.percentiles(PERCENTILES)):
+                    exacto = percentil_exacto(ordenados, p)
+                    # Más una unidad por truncar a unidades enteras
+                    self.assertLessEqual(abs(estimado - exacto), exacto * cota + histograma.unidad,
+                                         f"p{p}")
+                self.assertEqual(histograma.n, len(valores))
+                self.assertAlmostEqual(histograma.total, sum(valores))
+                self.assertEqual((histograma.minimo, histograma.maximo), (ordenados[0], ordenados[-1]))
+
+    def test_combinar_equivale_a_registrar_todo_junto(self):
+        a, b, juntos = HistogramaLatencia(), HistogramaLatencia(), HistogramaLatencia()
+        for valor in self._valores(1, 5000):
+            a.registrar(valor)
+            juntos.registrar(valor)
+        for valor in self._valores(2, 3000):
+            b.registrar(valor * 10)
+            juntos.registrar(valor * 10)
+        a.combinar(b)
+        self.assertEqual(list(a.cuentas), list(juntos.cuentas))
+        self.assertEqual((a.n, a.minimo, a.maximo), (juntos.n, juntos.minimo, juntos.maximo))
+        self.assertAlmostEqual(a.total, juntos.total)
+        self.assertEqual(a.percentiles(PERCENTILES), juntos.percentiles(PERCENTILES))
+
+        vacio = HistogramaLatencia()
+        vacio.combinar(b)
+        self.assertEqual((vacio.n, vacio.minimo), (b.n, b.minimo))
+
+    def test_combinar_exige_la_misma_configuracion(self):
+        with self.assertRaises(ValueError):
+            HistogramaLatencia(precision=7).combinar(HistogramaLatencia(precision=8))
+
+    def test_saturados_y_cubetas_acumuladas(self):
+        histograma = HistogramaLatencia(valor_max=1.0)
+        for valor in (0.001, 0.002, 0.5, 2.0, 3.0):
+            histograma.registrar(valor)
+        self.assertEqual(histograma.saturados, 2)
+        cubetas = histograma.cubetas()
+        self.assertEqual([acumulado for _, acumulado in cubetas], [1, 2, 3])
+        for (limite, _), valor in zip(cubetas, (0.001, 0.002, 0.5)):
+            self.assertLessEqual(valor, limite)
+        # Los saturados caen en la última cubeta: su percentil no baja de valor_max
+        self.assertGreaterEqual(histograma.percentil(100), 1.0)
+        self.assertEqual(histograma.maximo, 3.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
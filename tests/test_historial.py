@@ -0,0 +1,40 @@
+import unittest
+
+from planificador.historial import HistorialAccesos
+
+
+class TestHistorialAccesos(unittest.TestCase):
+
+    def _llenar(self, historial, desde, hasta):
+        for i in range(desde, hasta):
+            historial.agregar(i, i, float(i), i + 0.5)
+
+    def test_conserva_los_ultimos_accesos(self):
+        historial = HistorialAccesos(max_accesos=5, capacidad_inicial=2)
+        self._llenar(historial, 0, 23)
+        self.assertEqual(len(historial), 5)
+        self.assertEqual(historial.total, 23)
+        self.assertEqual(historial.valores("posicion"), [18, 19, 20, 21, 22])
+        self.assertLessEqual(historial.capacidad, 10)
+
+    def test_vista_no_cambia_al_hacer_lugar(self):
+        historial = HistorialAccesos(max_accesos=4, capacidad_inicial=4)
+        self._llenar(historial, 0, 7)
+        vista = historial.posicion
+        antes = vista.tolist()
+        # Supera la capacidad varias veces: los vigentes se mueven de lugar
+        self._llenar(historial, 7, 40)
+        self.assertEqual(vista.tolist(), antes)
+        self.assertEqual(historial.valores("posicion"), [36, 37, 38, 39])
+
+    def test_vista_no_cambia_al_crecer(self):
+        historial = HistorialAccesos(capacidad_inicial=2)
+        self._llenar(historial, 0, 2)
+        vista = historial.tiempo_fin
+        self._llenar(historial, 2, 100)
+        self.assertEqual(vista.tolist(), [0.5, 1.5])
+        self.assertEqual(len(historial.tiempo_fin), 100)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import random
+import unittest
+
+from generador.generador import Solicitud
+from planificador.indice import IndiceSolicitudes
+
+
+class TestIndiceSolicitudes(unittest.TestCase):
+
+    """
+    Las búsquedas del índice deben coincidir con recorrer la lista de
+    pendientes completa, tras cualquier secuencia de altas y bajas.
+    """
+
+    def _comprobar(self, indice, pendientes):
+        # pendientes: (posicion, secuencia, solicitud) en orden de llegada
+        for posicion in range(-1, 42):
+            adelante = [p for p in pendientes if p[0] >= posicion]
+            esperada = min(adelante, key=lambda p: (p[0], p[1]))[2] if adelante else None
+            self.assertIs(indice.siguiente_desde(posicion), esperada)
+
+            atras = [p for p in pendientes if p[0] < posicion]
+            if atras:
+                cercana = max(p[0] for p in atras)
+                esperada = min((p for p in atras if p[0] == cercana), key=lambda p: p[1])[2]
+            else:
+                esperada = None
+            self.assertIs(indice.anterior_a(posicion), esperada)
+
+        primera = min(pendientes, key=lambda p: (p[0], p[1]))[2] if pendientes else None
+        self.assertIs(indice.primera(), primera)
+        self.assertEqual(len(indice), len(pendientes))
+        self.assertEqual(list(indice), [p[2] for p in pendientes])
+        self.assertEqual(indice.max_prioridad(), max((p[2].prioridad for p in pendientes), default=0))
+
+        # Grupos por posición y prioridad, y cubetas de posiciones distintas
+        posiciones = sorted({p[0] for p in pendientes})
+        cubetas = {}
+        for posicion in posiciones:
+            cubetas.setdefault(indice.cubeta(posicion), []).append(posicion)
+        self.assertEqual(indice.cubetas, cubetas)
+        for posicion in posiciones:
+            mas_antiguas = {}
+            for p in pendientes:
+                if p[0] == posicion:
+                    mas_antiguas.setdefault(p[2].prioridad, p)
+            obtenidas = sorted(indice.mas_antiguas_en(posicion), key=lambda e: e[0])
+            esperadas = sorted((p[1], p[2]) for p in mas_antiguas.values())
+            self.assertEqual([s for _, s in obtenidas], [s for _, s in esperadas])
+
+    def test_busquedas_coinciden_con_la_lista(self):
+        rng = random.Random(5)
+        indice = IndiceSolicitudes(ancho_cubeta=8)
+        pendientes = []
+        for _ in range(300):
+            if pendientes and rng.random() < 0.45:
+                posicion, secuencia, solicitud = pendientes.pop(rng.randrange(len(pendientes)))
+                indice.eliminar(solicitud)
+            else:
+                solicitud = Solicitud(1, rng.randint(0, 40), "lectura", rng.randint(1, 5))
+                indice.agregar(solicitud)
+                pendientes.append((solicitud.posicion, indice.secuencia(solicitud), solicitud))
+            self._comprobar(indice, pendientes)
+
+    def test_eliminar_no_indexada(self):
+        indice = IndiceSolicitudes()
+        solicitud = Solicitud(1, 3, "lectura")
+        indice.agregar(solicitud)
+        indice.eliminar(solicitud)
+        self.assertNotIn(solicitud, indice)
+        with self.assertRaises(ValueError):
+            indice.eliminar(solicitud)
+
+
+if __name__ == "__main__":
+    unittest.main()
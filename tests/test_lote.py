@@ -0,0 +1,30 @@
+import unittest
+
+from generador.generador import GeneradorSolicitudes
+from generador.lote import LoteSolicitudes
+
+
+def campos(solicitud):
+    return (solicitud.id_dispositivo, solicitud.posicion, solicitud.tipo, solicitud.prioridad,
+            solicitud.id_solicitud, solicitud.tamano)
+
+
+class TestLoteSolicitudes(unittest.TestCase):
+
+    def setUp(self):
+        self.lote = GeneradorSolicitudes(25, tamanos=(512, 4096)).generar_lote(semilla=3)
+
+    def test_iterar_y_bloques_coinciden_con_indexar(self):
+        esperadas = [campos(self.lote[i]) for i in range(len(self.lote))]
+        self.assertEqual([campos(s) for s in iter(self.lote)], esperadas)
+        bloques = list(self.lote.bloques(10))
+        self.assertEqual([len(b) for b in bloques], [10, 10, 5])
+        self.assertEqual([campos(s) for b in bloques for s in b], esperadas)
+
+    def test_ida_y_vuelta_desde_solicitudes(self):
+        copia = LoteSolicitudes.desde_solicitudes(self.lote.a_solicitudes())
+        self.assertEqual([campos(s) for s in copia], [campos(s) for s in self.lote])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,83 @@
+import random
+import unittest
+
+from generador.generador import Solicitud
+from planificador.planificador import PlanificadorDisco
+from reloj.reloj import RelojVirtual
+
+
+def despachar_todo(algoritmo, solicitudes, posicion_inicial=0):
+    """Despacha todas las solicitudes y devuelve sus posiciones en orden."""
+    planificador = PlanificadorDisco(solicitudes, algoritmo=algoritmo, reloj=RelojVirtual(),
+                                     silencioso=True)
+    posicion = posicion_inicial
+    orden = []
+    while planificador.indice:
+        posicion = planificador.procesar(posicion).posicion
+        orden.append(posicion)
+    return orden
+
+
+class TestAlgoritmos(unittest.TestCase):
+
+    def test_c_scan_vuelve_al_inicio_en_lugar_de_invertir(self):
+        posiciones = [60, 40, 70, 30]
+        solicitudes = lambda: [Solicitud(1, p, "lectura") for p in posiciones]
+        scan = despachar_todo("SCAN", solicitudes(), posicion_inicial=50)
+        c_scan = despachar_todo("C-SCAN", solicitudes(), posicion_inicial=50)
+        self.assertEqual(scan, [60, 70, 40, 30])
+        self.assertEqual(c_scan, [60, 70, 30, 40])
+
+    def _candidatas_por_despacho(self, pendientes, despachos=200):
+        rng = random.Random(0)
+        solicitudes = [Solicitud(1, rng.randint(0, 1000), "lectura", rng.randint(1, 5))
+                       for _ in range(pendientes)]
+        planificador = PlanificadorDisco(solicitudes, algoritmo="SSTF", reloj=RelojVirtual(),
+                                         silencioso=True)
+        # Cada candidata puntuada consulta su frecuencia una vez
+        puntuadas = [0]
+        frecuencia = planificador.patron_accesos.frecuencia
+
+        def contar(*args):
+            puntuadas[0] += 1
+            return frecuencia(*args)
+
+        planificador.patron_accesos.frecuencia = contar
+        posicion = 0
+        for _ in range(despachos):
+            posicion = planificador.procesar(posicion).posicion
+        return puntuadas[0] / despachos
+
+    def test_sstf_coincide_con_la_busqueda_exhaustiva(self):
+        rng = random.Random(7)
+        for _ in range(100):
+            solicitudes = [Solicitud(1, rng.randint(0, rng.choice([5, 40, 300])), "lectura",
+                                     rng.randint(1, 5), llegada=rng.uniform(0, 20))
+                           for _ in range(rng.randint(1, 80))]
+            planificador = PlanificadorDisco(algoritmo="SSTF", reloj=RelojVirtual(30.0),
+                                             silencioso=True)
+            # Admitidas en orden de llegada, como en el modo flujo
+            for solicitud in sorted(solicitudes, key=lambda s: s.llegada):
+                planificador.agregar_solicitud(solicitud)
+            patron = planificador.patron_accesos
+            posicion = 0
+            while planificador.indice:
+                ahora = planificador.reloj.ahora()
+                esperada = max(
+                    planificador.indice.entradas.items(),
+                    key=lambda e: (e[1].prioridad * 10 + patron.frecuencia(e[1].posicion, ahora) * 5 +
+                                   patron.total(e[1].posicion) * 2 - abs(e[1].posicion - posicion) +
+                                   min((ahora - e[1].llegada) * 2, 20), -e[0]))[1]
+                self.assertIs(planificador.procesar(posicion), esperada)
+                posicion = esperada.posicion
+
+    def test_sstf_no_recorre_todas_las_pendientes(self):
+        pocas = self._candidatas_por_despacho(2000)
+        muchas = self._candidatas_por_despacho(20000)
+        # Diez veces más pendientes no multiplican las candidatas revisadas
+        self.assertLess(muchas, 100)
+        self.assertLess(muchas, 2 * pocas)
+
+
+if __name__ == "__main__":
+    unittest.main()
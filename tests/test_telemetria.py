@@ -0,0 +1,40 @@
+import unittest
+
+from dma.telemetria import RegistroCircular
+
+
+class TestRegistroCircular(unittest.TestCase):
+
+    def test_antes_de_llenarse(self):
+        registro = RegistroCircular(("a", "b"), capacidad=5)
+        self.assertEqual(len(registro), 0)
+        self.assertEqual(list(registro.ultimas()["a"]), [])
+        for i in range(3):
+            registro.registrar(i, -i)
+        ultimas = registro.ultimas()
+        self.assertEqual(list(ultimas["a"]), [0.0, 1.0, 2.0])
+        self.assertEqual(list(ultimas["b"]), [0.0, -1.0, -2.0])
+        self.assertEqual(list(registro.ultimas(2)["a"]), [1.0, 2.0])
+
+    def test_al_dar_la_vuelta_conserva_las_ultimas_en_orden(self):
+        registro = RegistroCircular(("valor",), capacidad=4)
+        for total in range(1, 23):
+            registro.registrar(total)
+            esperadas = [float(v) for v in range(max(1, total - 3), total + 1)]
+            self.assertEqual(len(registro), len(esperadas))
+            self.assertEqual(list(registro.ultimas()["valor"]), esperadas)
+            self.assertEqual(list(registro.ultimas(2)["valor"]), esperadas[-2:])
+            # Pedir más de lo conservado devuelve solo lo conservado
+            self.assertEqual(list(registro.ultimas(100)["valor"]), esperadas)
+        self.assertEqual(registro.total, 22)
+
+    def test_ultimas_no_copia(self):
+        registro = RegistroCircular(("valor",), capacidad=3)
+        registro.registrar(1.0)
+        vista = registro.ultimas()["valor"]
+        self.assertIsInstance(vista, memoryview)
+        self.assertIs(vista.obj, registro.columnas["valor"])
+
+
+if __name__ == "__main__":
+    unittest.main()
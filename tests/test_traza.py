@@ -0,0 +1,100 @@
+import os
+import tempfile
+import unittest
+
+from generador.generador import Solicitud, reservar_ids
+from traza.traza import CABECERA, MAGICO, VERSION, FuenteTraza, GrabadorTraza, leer_cabecera
+
+
+class TestTraza(unittest.TestCase):
+
+    def setUp(self):
+        self.directorio = tempfile.TemporaryDirectory()
+        self.ruta = os.path.join(self.directorio.name, "corrida.traza")
+
+    def tearDown(self):
+        self.directorio.cleanup()
+
+    def _grabar(self, solicitudes):
+        with GrabadorTraza(self.ruta, tamano_bloque=3) as grabador:
+            for i, solicitud in enumerate(solicitudes):
+                grabador.registrar_llegada(i * 0.5, solicitud)
+            for i, solicitud in enumerate(reversed(solicitudes)):
+                grabador.registrar_despacho(10 + i, solicitud, i * 7, 0.25)
+        return grabador
+
+    def _solicitudes(self):
+        return [Solicitud(1 + i % 3, 100 * i, ("lectura", "escritura")[i % 2], 1 + i % 5,
+                          tamano=512 * (i + 1)) for i in range(10)]
+
+    def test_ida_y_vuelta(self):
+        solicitudes = self._solicitudes()
+        grabador = self._grabar(solicitudes)
+        self.assertEqual(grabador.registros, 20)
+        self.assertEqual(os.path.getsize(self.ruta), CABECERA.size + 20 * 48)
+
+        fuente = FuenteTraza(self.ruta, tamano_bloque=4)
+        self.assertEqual(len(fuente), 20)
+        leidas = list(fuente)
+        self.assertEqual([instante for instante, _ in leidas], [i * 0.5 for i in range(10)])
+        for (_, leida), original in zip(leidas, solicitudes):
+            self.assertEqual(
+                (leida.id_solicitud, leida.id_dispositivo, leida.posicion, leida.tipo, leida.prioridad,
+                 leida.tamano),
+                (original.id_solicitud, original.id_dispositivo, original.posicion, original.tipo,
+                 original.prioridad, original.tamano))
+
+        despachos = fuente.despachos()
+        self.assertEqual(despachos["id_solicitud"].tolist(),
+                         [s.id_solicitud for s in reversed(solicitudes)])
+        self.assertEqual(despachos["movimientos"].tolist(), [i * 7 for i in range(10)])
+        self.assertEqual(despachos["duracion"].tolist(), [0.25] * 10)
+
+        lote = fuente.lote()
+        self.assertEqual(lote.posicion.tolist(), [s.posicion for s in solicitudes])
+
+    def test_los_identificadores_nuevos_no_repiten_los_de_la_traza(self):
+        solicitudes = [Solicitud(1, 0, "lectura", id_solicitud=reservar_ids() + 10 ** 6)]
+        self._grabar(solicitudes)
+        list(FuenteTraza(self.ruta))
+        self.assertGreater(reservar_ids(), solicitudes[0].id_solicitud)
+
+    def test_registro_incompleto_al_final_se_ignora(self):
+        self._grabar(self._solicitudes())
+        with open(self.ruta, "ab") as archivo:
+            archivo.write(b"\x00" * 20)
+        self.assertEqual(len(FuenteTraza(self.ruta)), 20)
+
+    def test_traza_vacia(self):
+        self._grabar([])
+        fuente = FuenteTraza(self.ruta)
+        self.assertEqual(len(fuente), 0)
+        self.assertEqual(list(fuente), [])
+
+    def test_cabecera_invalida(self):
+        casos = {
+            "incompleta": MAGICO,
+            "magico": CABECERA.pack(b"NOTRAZA!", VERSION, 48),
+            "version": CABECERA.pack(MAGICO, VERSION + 1, 48),
+            "registro": CABECERA.pack(MAGICO, VERSION, 40),
+        }
+        for caso, cabecera in casos.items():
+            with self.subTest(caso=caso):
+                with open(self.ruta, "wb") as archivo:
+                    archivo.write(cabecera)
+                with self.assertRaises(ValueError):
+                    leer_cabecera(self.ruta)
+                with self.assertRaises(ValueError):
+                    FuenteTraza(self.ruta)
+
+    def test_cabecera_valida(self):
+        self._grabar([])
+        self.assertEqual(leer_cabecera(self.ruta), VERSION)
+        with open(self.ruta, "rb") as archivo:
+            magico, version, tamano = CABECERA.unpack(archivo.read(CABECERA.size))
+        self.assertEqual((magico, version, tamano), (MAGICO, VERSION, 48))
+        self.assertEqual(CABECERA.size, 64)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,232 @@
+import queue
+import struct
+import threading
+
+import numpy as np
+
+from generador.generador import Solicitud, TIPOS, avanzar_ids
+from generador.lote import LoteSolicitudes
+
+MAGICO = b"PSOTRAZA"
+VERSION = 1
+CABECERA = struct.Struct("<8sHH52x")  # Mágico, versión y tamaño de registro; 64 bytes
+
+# Clases de registro
+LLEGADA = 0
+DESPACHO = 1
+
+# Registro de tamaño fijo (48 bytes, little-endian, sin relleno). Una llegada
+# guarda la solicitud completa; un despacho guarda la solicitud atendida, los
+# movimientos del cabezal y la duración de su servicio.
+REGISTRO = np.dtype([
+    ("clase", "u1"),
+    ("tipo", "u1"),
+    ("id_dispositivo", "i1"),
+    ("prioridad", "i1"),
+    ("tamano", "<u4"),
+    ("movimientos", "<i8"),
+    ("id_solicitud", "<i8"),
+    ("posicion", "<i8"),
+    ("instante", "<f8"),
+    ("duracion", "<f8"),
+])
+
+_CODIGOS_TIPO = {tipo: i for i, tipo in enumerate(TIPOS)}
+
+
+class GrabadorTraza:
+    """
+    Graba una traza binaria de llegadas y despachos de una simulación.
+
+    El archivo empieza con una cabecera de 64 bytes (mágico, versión y tamaño
+    de registro) seguida de registros REGISTRO de tamaño fijo. Registrar solo
+    encola una tupla; un hilo escritor las agrupa en bloques y los escribe
+    con una sola llamada, así que grabar no frena al planificador.
+
+    Los instantes son relativos al inicio de la simulación.
+
+    Attributes:
+        ruta (str): Archivo de la traza
+        registros (int): Registros encolados
+        tamano_bloque (int): Máximo de registros por escritura
+    """
+
+    def __init__(self, ruta, tamano_bloque=4096):
+        self.ruta = ruta
+        self.tamano_bloque = tamano_bloque
+        self.registros = 0
+        self._archivo = open(ruta, "wb")
+        self._archivo.write(CABECERA.pack(MAGICO, VERSION, REGISTRO.itemsize))
+        self._cola = queue.SimpleQueue()
+        self._hilo = threading.Thread(target=self._escribir)
+        self._hilo.daemon = True
+        self._hilo.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+    def registrar_llegada(self, instante, solicitud):
+        """
+        Registra la llegada de una solicitud.
+
+        Args:
+            instante (float): Segundos desde el inicio de la simulación
+            solicitud (Solicitud): Solicitud que llega
+        """
+        self.registros += 1
+        self._cola.put((LLEGADA, _CODIGOS_TIPO[solicitud.tipo], solicitud.id_dispositivo, solicitud.prioridad,
+                        solicitud.tamano, 0, solicitud.id_solicitud, solicitud.posicion, instante, 0.0))
+
+    def registrar_despacho(self, instante, solicitud, movimientos, duracion):
+        """
+        Registra el despacho de una solicitud.
+
+        Args:
+            instante (float): Segundos desde el inicio de la simulación
+            solicitud (Solicitud): Solicitud atendida
+            movimientos (int): Movimientos del cabezal hasta ella
+            duracion (float): Tiempo de servicio
+        """
+        self.registros += 1
+        self._cola.put((DESPACHO, _CODIGOS_TIPO[solicitud.tipo], solicitud.id_dispositivo, solicitud.prioridad,
+                        solicitud.tamano, movimientos, solicitud.id_solicitud, solicitud.posicion,
+                        instante, duracion))
+
+    def _escribir(self):
+        """
+        Bucle del hilo escritor: vacía la cola en bloques hasta recibir None.
+        """
+        terminar = False
+        while not terminar:
+            bloque = [self._cola.get()]
+            while len(bloque) < self.tamano_bloque:
+                try:
+                    bloque.append(self._cola.get_nowait())
+                except queue.Empty:
+                    break
+            if bloque[-1] is None:
+                bloque.pop()
+                terminar = True
+            if bloque:
+                self._archivo.write(np.array(bloque, dtype=REGISTRO).tobytes())
+
+    def cerrar(self):
+        """
+        Escribe los registros pendientes y cierra el archivo.
+        """
+        if self._archivo.closed:
+            return
+        self._cola.put(None)
+        self._hilo.join()
+        self._archivo.close()
+
+
+def leer_cabecera(ruta):
+    """
+    Lee y valida la cabecera de una traza.
+
+    Args:
+        ruta (str): Archivo de la traza
+
+    Returns:
+        int: Versión del formato
+
+    Raises:
+        ValueError: Si el archivo no es una traza o su versión no está soportada
+    """
+    with open(ruta, "rb") as archivo:
+        datos = archivo.read(CABECERA.size)
+    if len(datos) < CABECERA.size:
+        raise ValueError(f"{ruta} no es una traza: cabecera incompleta")
+    magico, version, tamano_registro = CABECERA.unpack(datos)
+    if magico != MAGICO:
+        raise ValueError(f"{ruta} no es una traza")
+    if version != VERSION or tamano_registro != REGISTRO.itemsize:
+        raise ValueError(f"Versión de traza no soportada: {version} (registro de {tamano_registro} bytes)")
+    return version
+
+
+class FuenteTraza:
+    """
+    Reproduce una traza grabada con GrabadorTraza.
+
+    El archivo se mapea en memoria: iterar lee los registros por bloques
+    directamente del mapa, así que una traza de varios GB se reproduce a la
+    velocidad del disco sin cargarla entera. Iterar devuelve (instante,
+    Solicitud) por cada llegada, con el mismo identificador de la corrida
+    original, así que la fuente sirve como `fuente` de PlanificadorDisco; el
+    contador global de identificadores se adelanta a medida que se leen,
+    para que las solicitudes creadas después no los repitan. Un registro
+    incompleto al final (grabación interrumpida) se ignora.
+
+    Attributes:
+        ruta (str): Archivo de la traza
+        version (int): Versión del formato
+        registros (np.memmap): Todos los registros (vacío si no hay ninguno)
+    """
+
+    def __init__(self, ruta, tamano_bloque=65536):
+        self.ruta = ruta
+        self.version = leer_cabecera(ruta)
+        self.tamano_bloque = tamano_bloque
+        with open(ruta, "rb") as archivo:
+            archivo.seek(0, 2)
+            cantidad = (archivo.tell() - CABECERA.size) // REGISTRO.itemsize
+        if cantidad:
+            self.registros = np.memmap(ruta, dtype=REGISTRO, mode="r", offset=CABECERA.size, shape=(cantidad,))
+        else:
+            self.registros = np.empty(0, dtype=REGISTRO)
+
+    def __len__(self):
+        return len(self.registros)
+
+    def __iter__(self):
+        for inicio in range(0, len(self.registros), self.tamano_bloque):
+            bloque = self.registros[inicio:inicio + self.tamano_bloque]
+            bloque = bloque[bloque["clase"] == LLEGADA]
+            if len(bloque):
+                avanzar_ids(int(bloque["id_solicitud"].max()))
+            yield from (
+                (instante, Solicitud(d, p, TIPOS[t], pr, i, tamano=b))
+                for instante, d, p, t, pr, i, b in zip(
+                    bloque["instante"].tolist(),
+                    bloque["id_dispositivo"].tolist(),
+                    bloque["posicion"].tolist(),
+                    bloque["tipo"].tolist(),
+                    bloque["prioridad"].tolist(),
+                    bloque["id_solicitud"].tolist(),
+                    bloque["tamano"].tolist()
+                )
+            )
+
+    def llegadas(self):
+        """
+        Returns:
+            np.ndarray: Registros de llegada (copia)
+        """
+        return self.registros[self.registros["clase"] == LLEGADA]
+
+    def despachos(self):
+        """
+        Returns:
+            np.ndarray: Registros de despacho en orden (copia); sus
+                id_solicitud dan el orden de atención de la corrida
+        """
+        return self.registros[self.registros["clase"] == DESPACHO]
+
+    def lote(self):
+        """
+        Devuelve las llegadas como un lote, para reproducir una corrida por
+        lotes (todas las solicitudes presentes al inicio).
+
+        Returns:
+            LoteSolicitudes: Solicitudes de la traza en orden de llegada
+        """
+        llegadas = self.llegadas()
+        if len(llegadas):
+            avanzar_ids(int(llegadas["id_solicitud"].max()))
+        return LoteSolicitudes(llegadas["id_dispositivo"], llegadas["posicion"], llegadas["tipo"],
+                               llegadas["prioridad"], llegadas["id_solicitud"], llegadas["tamano"])